@@ -0,0 +1,116 @@
+"""Memory benchmark for converting account/role dicts into models.
+
+Compares three strategies over the same synthetic org export:
+
+* ``legacy``  - dict-backed frozen dataclasses, one fresh account per row
+* ``slotted`` - the slotted models, one fresh account per row
+* ``pooled``  - the slotted models shared through AccountPool (what select_accounts uses)
+
+Usage:
+    python benchmarks/bench_memory.py [--rows 100000] [--roles-per-account 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from aws_pick.core.inventory import _validate_and_convert
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
+
+
+@dataclass(frozen=True)
+class _LegacyAccount:
+    account_id: str
+    account_name: str
+    environment: str | None = None
+
+
+@dataclass(frozen=True)
+class _LegacyRole:
+    role_name: str
+
+
+@dataclass(frozen=True)
+class _LegacyAccountRole:
+    account: _LegacyAccount
+    role: _LegacyRole
+
+
+_ROLE_NAMES = [f"Role{n:02d}" for n in range(64)]
+
+
+def make_rows(rows: int, roles_per_account: int) -> list[dict[str, Any]]:
+    data: list[dict[str, Any]] = []
+    for i in range(rows):
+        acct = i // roles_per_account
+        data.append(
+            {
+                "account_id": f"{100000000000 + acct:012d}",
+                "account_name": f"team-{acct:06d}-prod" if acct % 3 == 0 else f"team-{acct:06d}-dev",
+                "role_name": _ROLE_NAMES[i % roles_per_account % len(_ROLE_NAMES)],
+            }
+        )
+    return data
+
+
+def convert_legacy(rows: list[dict[str, Any]]) -> list[Any]:
+    return [
+        _LegacyAccountRole(
+            account=_LegacyAccount(str(r["account_id"]), str(r["account_name"]), r.get("environment")),
+            role=_LegacyRole(str(r["role_name"])),
+        )
+        for r in rows
+    ]
+
+
+def convert_slotted(rows: list[dict[str, Any]]) -> list[AccountRole]:
+    return [
+        AccountRole(
+            account=AwsAccount(str(r["account_id"]), str(r["account_name"]), r.get("environment")),
+            role=AwsRole(str(r["role_name"])),
+        )
+        for r in rows
+    ]
+
+
+def measure(fn: Callable[[list[dict[str, Any]]], list[Any]], rows: list[dict[str, Any]]) -> int:
+    """Return the bytes still held by fn's result after conversion."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = fn(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--roles-per-account", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows, args.roles_per_account)
+    strategies: list[tuple[str, Callable[[list[dict[str, Any]]], list[Any]]]] = [
+        ("legacy", convert_legacy),
+        ("slotted", convert_slotted),
+        ("pooled", _validate_and_convert),
+    ]
+
+    print(f"{args.rows:,} rows, {args.roles_per_account} roles per account")
+    print(f"{'strategy':<10}{'retained':>14}{'per row':>12}{'vs legacy':>12}")
+    baseline: int | None = None
+    for name, fn in strategies:
+        retained = measure(fn, rows)
+        baseline = baseline or retained
+        print(f"{name:<10}{retained / 1e6:>11.1f} MB{retained / args.rows:>10.0f} B{retained / baseline:>11.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Timing benchmark for Inventory.query against a plain Python scan.
+
+Builds an Inventory from a synthetic org export, then runs a few scripted
+selections both through ``query`` and as a list comprehension over the items,
+reporting the best wall time of several repeats. Index build time is reported
+separately since it is paid once per inventory.
+
+Usage:
+    python benchmarks/bench_query.py [--rows 100000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from bench_memory import make_rows
+
+from aws_pick.core.environment import classify
+from aws_pick.core.inventory import Inventory, _QueryIndex
+from aws_pick.models.account import AccountRole
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scan(items: tuple[AccountRole, ...], predicate: Callable[[AccountRole], bool]) -> list[AccountRole]:
+    return [item for item in items if predicate(item)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--roles-per-account", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    inventory = Inventory.from_dicts(make_rows(args.rows, args.roles_per_account), validate="fast")
+    build = best_time(lambda: _QueryIndex(inventory.items), 1)
+    items = inventory.items
+
+    def env_of(item: AccountRole) -> str | None:
+        pattern = classify(item.account)
+        return None if pattern is None else pattern.environment
+
+    cases: list[tuple[str, dict[str, Any], Callable[[AccountRole], bool]]] = [
+        (
+            "env + role",
+            {"env": "production", "role": "Role00"},
+            lambda item: item.role.role_name == "Role00" and env_of(item) == "production",
+        ),
+        (
+            "name prefix",
+            {"name_prefix": "team-0001"},
+            lambda item: item.account.account_name.lower().startswith("team-0001"),
+        ),
+        (
+            "account ids + role",
+            {"account_ids": [f"{100000000000 + n:012d}" for n in range(0, 500, 5)], "role": "Role03"},
+            lambda item: item.role.role_name == "Role03"
+            and int(item.account.account_id) % 5 == 0
+            and int(item.account.account_id) < 100000000500,
+        ),
+    ]
+
+    print(f"{args.rows:,} rows, index build {build * 1000:.1f} ms")
+    print(f"{'query':<22}{'matches':>10}{'indexed':>12}{'scan':>12}{'gain':>8}")
+    for label, criteria, predicate in cases:
+        matches = inventory.query(**criteria)
+        assert matches == scan(items, predicate), label
+        indexed = best_time(lambda: inventory.query(**criteria), args.repeat)
+        scanned = best_time(lambda: scan(items, predicate), args.repeat)
+        timings = f"{indexed * 1000:>9.2f} ms{scanned * 1000:>9.1f} ms{scanned / indexed:>7.0f}x"
+        print(f"{label:<22}{len(matches):>10,}{timings}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Timing benchmark for the select_accounts validation modes.
+
+Converts the same synthetic org export with validate="full", "fast" and
+"trusted" and reports the best wall time of several repeats per size.
+
+Usage:
+    python benchmarks/bench_validation.py [--sizes 10000 100000 1000000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from bench_memory import make_rows
+
+from aws_pick.core.inventory import ValidationMode, _validate_and_convert
+
+_MODES: tuple[ValidationMode, ...] = ("full", "fast", "trusted")
+
+
+def best_time(rows: list[dict[str, str]], mode: ValidationMode, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        _validate_and_convert(rows, validate=mode)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--roles-per-account", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}" + "".join(f"{mode:>12}" for mode in _MODES) + f"{'fast gain':>12}{'trusted gain':>14}")
+    for size in args.sizes:
+        rows = make_rows(size, args.roles_per_account)
+        timings = {mode: best_time(rows, mode, args.repeat) for mode in _MODES}
+        cells = "".join(f"{timings[mode] * 1000:>9.1f} ms" for mode in _MODES)
+        fast_gain = timings["full"] / timings["fast"]
+        trusted_gain = timings["full"] / timings["trusted"]
+        print(f"{size:>10,}{cells}{fast_gain:>11.1f}x{trusted_gain:>13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,10 @@
 __version__ = "0.1.3"
 
 from aws_pick.core.favorites import manage_favorites
+from aws_pick.core.inventory import Inventory
+from aws_pick.core.login import aiter_logins, iter_logins
 from aws_pick.core.presets import manage_presets
-from aws_pick.core.selector import select_accounts
+from aws_pick.core.selector import aselect_accounts, select_accounts
 from aws_pick.models.selection import (
     BatchLoginResult,
     ItemLoginResult,
@@ -14,6 +16,10 @@ from aws_pick.models.selection import (
 
 __all__ = [
     "select_accounts",
+    "aselect_accounts",
+    "iter_logins",
+    "aiter_logins",
+    "Inventory",
     "manage_favorites",
     "manage_presets",
     "SelectionResult",
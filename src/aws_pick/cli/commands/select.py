@@ -23,11 +23,13 @@ def run(
     ] = None,
     select: Annotated[
         Optional[list[str]],
-        typer.Option("--select", "-s", help="Non-interactive: account_id:role_name pairs."),
+        typer.Option(
+            "--select", "-s", help="Non-interactive: account_id:role_name pairs, or globs, re:... and env=... specs."
+        ),
     ] = None,
-    preset_name: Annotated[
-        Optional[str],
-        typer.Option("--preset", "-p", help="Load a named preset."),
+    preset_names: Annotated[
+        Optional[list[str]],
+        typer.Option("--preset", "-p", help="Load a named preset (repeatable)."),
     ] = None,
     favorites: Annotated[
         bool,
@@ -47,7 +49,7 @@ def run(
     if accounts is None:
         raise typer.Exit(code=1)
 
-    interactive = select is None and not favorites and preset_name is None
+    interactive = select is None and not favorites and not preset_names
     selections = list(select) if select else None
 
     if favorites:
@@ -58,13 +60,14 @@ def run(
         selections = [f"{f.account_id}:{f.role_name}" for f in fav_list]
         interactive = False
 
-    if preset_name:
+    if preset_names:
         from aws_pick.core.presets import PresetsManager
 
         mgr_p = PresetsManager()
         try:
-            preset = mgr_p.get(preset_name)
-            selections = [f"{item.account_id}:{item.role_name}" for item in preset.items]
+            presets = mgr_p.get_many(preset_names)
+            keys = dict.fromkeys(f"{item.account_id}:{item.role_name}" for p in presets.values() for item in p.items)
+            selections = list(keys)
             interactive = False
         except Exception as e:
             typer.echo(f"Error loading preset: {e}", err=True)
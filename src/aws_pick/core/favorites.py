@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+from aws_pick.core.registry import shared_manager
 from aws_pick.models.config import Favorite
 from aws_pick.storage.json_store import JsonStore, default_config_dir
 
@@ -12,43 +13,53 @@ _CONFIG_FILE = "config.json"
 
 
 class FavoritesManager:
-    """CRUD operations for persisted favorites."""
+    """CRUD operations for persisted favorites.
+
+    Managers are safe to share between threads. Reads are served from the
+    shared store's parsed-file cache plus an index of favorite keys rebuilt
+    only when config.json changes; writes run as store transactions.
+    """
 
     def __init__(self, config_dir: Path | None = None) -> None:
-        self._store = JsonStore(base_dir=config_dir or default_config_dir())
+        self._store = JsonStore.shared(config_dir or default_config_dir())
+        self._index: tuple[dict[str, Any], tuple[Favorite, ...], frozenset[tuple[str, str]]] | None = None
+
+    def _favorites(self) -> tuple[tuple[Favorite, ...], frozenset[tuple[str, str]]]:
+        data = self._store.snapshot(_CONFIG_FILE)
+        index = self._index
+        if index is None or index[0] is not data:
+            favorites = tuple(Favorite.from_dict(item) for item in data.get("favorites", []))
+            index = self._index = (data, favorites, frozenset((f.account_id, f.role_name) for f in favorites))
+        return index[1], index[2]
 
     def list(self) -> list[Favorite]:
-        data = self._store.read(_CONFIG_FILE)
-        raw: list[dict[str, Any]] = data.get("favorites", [])
-        return [Favorite.from_dict(item) for item in raw]
+        return list(self._favorites()[0])
 
     def add(self, account_id: str, role_name: str) -> None:
         if self.is_favorite(account_id, role_name):
             return
-        data = self._store.read(_CONFIG_FILE)
-        favorites: list[dict[str, Any]] = data.get("favorites", [])
-        favorites.append({"account_id": account_id, "role_name": role_name})
-        data["favorites"] = favorites
-        self._store.write(_CONFIG_FILE, data)
+        with self._store.transaction(_CONFIG_FILE) as data:
+            favorites: list[dict[str, Any]] = data.get("favorites", [])
+            if not any(f.get("account_id") == account_id and f.get("role_name") == role_name for f in favorites):
+                favorites.append({"account_id": account_id, "role_name": role_name})
+            data["favorites"] = favorites
 
     def remove(self, account_id: str, role_name: str) -> None:
-        data = self._store.read(_CONFIG_FILE)
-        favorites: list[dict[str, Any]] = data.get("favorites", [])
-        data["favorites"] = [
-            f for f in favorites if not (f.get("account_id") == account_id and f.get("role_name") == role_name)
-        ]
-        self._store.write(_CONFIG_FILE, data)
+        with self._store.transaction(_CONFIG_FILE) as data:
+            favorites: list[dict[str, Any]] = data.get("favorites", [])
+            data["favorites"] = [
+                f for f in favorites if not (f.get("account_id") == account_id and f.get("role_name") == role_name)
+            ]
 
     def clear(self) -> None:
-        data = self._store.read(_CONFIG_FILE)
-        data["favorites"] = []
-        self._store.write(_CONFIG_FILE, data)
+        with self._store.transaction(_CONFIG_FILE) as data:
+            data["favorites"] = []
 
     def is_favorite(self, account_id: str, role_name: str) -> bool:
-        return any(f.account_id == account_id and f.role_name == role_name for f in self.list())
+        return (account_id, role_name) in self._favorites()[1]
 
 
 def manage_favorites(*, config_dir: str | Path | None = None) -> FavoritesManager:
-    """Factory function to create a FavoritesManager."""
+    """Return the process-wide FavoritesManager for config_dir."""
     path = Path(config_dir) if isinstance(config_dir, str) else config_dir
-    return FavoritesManager(config_dir=path)
+    return shared_manager(FavoritesManager, path)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,45 +13,79 @@ from aws_pick.storage.json_store import JsonStore, default_config_dir
 
 _HISTORY_FILE = "history.json"
 _DEFAULT_RETENTION_DAYS = 90
+# Weight of the newest sample in a pair's moving-average login time.
+_LATENCY_WEIGHT = 0.3
 
 
 class HistoryManager:
     """Records and queries account/role usage history."""
 
     def __init__(self, config_dir: Path | None = None, retention_days: int = _DEFAULT_RETENTION_DAYS) -> None:
-        self._store = JsonStore(base_dir=config_dir or default_config_dir())
+        self._store = JsonStore.shared(config_dir or default_config_dir())
         self._retention_days = retention_days
         self.prune()
 
     def record(self, items: list[AccountRole]) -> None:
         """Record the current timestamp for each selected item."""
-        data = self._store.read(_HISTORY_FILE, defaults={"entries": []})
-        entries: list[dict[str, Any]] = data.get("entries", [])
         now = datetime.now(timezone.utc).isoformat()
-
-        existing: dict[tuple[str, str], int] = {}
-        for i, entry in enumerate(entries):
-            key = (entry.get("account_id", ""), entry.get("role_name", ""))
-            existing[key] = i
-
-        for item in items:
-            key = (item.account.account_id, item.role.role_name)
-            entry_data = {
-                "account_id": item.account.account_id,
-                "role_name": item.role.role_name,
-                "last_used": now,
-            }
-            if key in existing:
-                entries[existing[key]] = entry_data
-            else:
-                entries.append(entry_data)
-
-        data["entries"] = entries
-        self._store.write(_HISTORY_FILE, data)
+        with self._store.transaction(_HISTORY_FILE, defaults={"entries": []}) as data:
+            entries: list[dict[str, Any]] = data.get("entries", [])
+
+            existing: dict[tuple[str, str], int] = {}
+            for i, entry in enumerate(entries):
+                key = (entry.get("account_id", ""), entry.get("role_name", ""))
+                existing[key] = i
+
+            for item in items:
+                key = item.key
+                entry_data = {
+                    "account_id": item.account.account_id,
+                    "role_name": item.role.role_name,
+                    "last_used": now,
+                }
+                if key in existing:
+                    entries[existing[key]] = {**entries[existing[key]], **entry_data}
+                else:
+                    entries.append(entry_data)
+
+            data["entries"] = entries
+
+    def record_latencies(self, latencies: Iterable[tuple[str, str, float]]) -> None:
+        """Fold measured login times in seconds into each pair's moving average and mark the pairs used."""
+        samples = {(account_id, role_name): seconds for account_id, role_name, seconds in latencies}
+        if not samples:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        with self._store.transaction(_HISTORY_FILE, defaults={"entries": []}) as data:
+            entries: list[dict[str, Any]] = data.get("entries", [])
+            for entry in entries:
+                key = (entry.get("account_id", ""), entry.get("role_name", ""))
+                seconds = samples.pop(key, None)
+                if seconds is None:
+                    continue
+                previous = entry.get("login_seconds")
+                if isinstance(previous, (int, float)):
+                    seconds = previous + _LATENCY_WEIGHT * (seconds - previous)
+                entry["login_seconds"] = seconds
+                entry["last_used"] = now
+            for (account_id, role_name), seconds in samples.items():
+                entries.append(
+                    {"account_id": account_id, "role_name": role_name, "last_used": now, "login_seconds": seconds}
+                )
+            data["entries"] = entries
+
+    def get_latencies(self) -> dict[tuple[str, str], float]:
+        """Return the average login time in seconds of each pair that has one recorded."""
+        data = self._store.snapshot(_HISTORY_FILE, defaults={"entries": []})
+        return {
+            (str(entry.get("account_id", "")), str(entry.get("role_name", ""))): float(entry["login_seconds"])
+            for entry in data.get("entries", [])
+            if isinstance(entry.get("login_seconds"), (int, float))
+        }
 
     def get_last_used(self, account_id: str, role_name: str) -> str | None:
         """Return the ISO timestamp of when this pair was last used, or None."""
-        data = self._store.read(_HISTORY_FILE, defaults={"entries": []})
+        data = self._store.snapshot(_HISTORY_FILE, defaults={"entries": []})
         for entry in data.get("entries", []):
             if entry.get("account_id") == account_id and entry.get("role_name") == role_name:
                 return str(entry.get("last_used", ""))
@@ -58,7 +93,7 @@ class HistoryManager:
 
     def list_entries(self) -> list[HistoryEntry]:
         """Return all history entries."""
-        data = self._store.read(_HISTORY_FILE, defaults={"entries": []})
+        data = self._store.snapshot(_HISTORY_FILE, defaults={"entries": []})
         return [HistoryEntry.from_dict(e) for e in data.get("entries", [])]
 
     def clear(self) -> None:
@@ -67,11 +102,13 @@ class HistoryManager:
 
     def prune(self) -> None:
         """Remove entries older than retention period."""
-        data = self._store.read(_HISTORY_FILE, defaults={"entries": []})
-        entries: list[dict[str, Any]] = data.get("entries", [])
-        if not entries:
+        entries: list[dict[str, Any]] = self._store.snapshot(_HISTORY_FILE, defaults={"entries": []}).get("entries", [])
+        if not entries or len(self._unexpired(entries)) == len(entries):
             return
+        with self._store.transaction(_HISTORY_FILE, defaults={"entries": []}) as data:
+            data["entries"] = self._unexpired(data.get("entries", []))
 
+    def _unexpired(self, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
         now = datetime.now(timezone.utc)
         kept: list[dict[str, Any]] = []
         for entry in entries:
@@ -85,10 +122,7 @@ class HistoryManager:
                     kept.append(entry)
             except (ValueError, TypeError):
                 pass
-
-        if len(kept) != len(entries):
-            data["entries"] = kept
-            self._store.write(_HISTORY_FILE, data)
+        return kept
 
 
 def format_relative_time(iso_timestamp: str) -> str:
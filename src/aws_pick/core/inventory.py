@@ -0,0 +1,369 @@
+"""Validated, deduplicated account inventories reusable across selections."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, islice
+from typing import Any, Literal, overload
+
+from aws_pick.core.environment import classify
+from aws_pick.core.specs import SelectionSpec, compile_specs
+from aws_pick.exceptions import InvalidAccountError, InvalidSelectionError
+from aws_pick.models.account import AccountRole, AwsAccount, DedupeReport, iter_deduplicate
+from aws_pick.models.pool import AccountPool
+
+ValidationMode = Literal["full", "fast", "trusted"]
+_VALIDATION_MODES = ("full", "fast", "trusted")
+_CHUNK_SIZE = 8192
+
+
+class Inventory(Sequence[AccountRole]):
+    """An immutable, validated and deduplicated set of account/role items.
+
+    Build one with ``from_dicts`` and pass it to ``select_accounts`` as many
+    times as needed: validation, deduplication and the key index are done once
+    here instead of on every call. ``query`` selects items by environment, role,
+    name prefix or account id through secondary indexes built on first use.
+    """
+
+    __slots__ = ("_items", "_index", "_query_index")
+
+    def __init__(self, items: Iterable[AccountRole] = (), report: DedupeReport | None = None) -> None:
+        self._items: tuple[AccountRole, ...] = tuple(iter_deduplicate(items, report))
+        self._index: dict[tuple[str, str], AccountRole] = {item.key: item for item in self._items}
+        self._query_index: _QueryIndex | None = None
+
+    @classmethod
+    def from_dicts(
+        cls,
+        accounts: Iterable[dict[str, Any]],
+        *,
+        validate: ValidationMode = "full",
+        report: DedupeReport | None = None,
+    ) -> Inventory:
+        """Validate account/role dicts and build an inventory from them.
+
+        ``accounts`` may be any iterable, such as a generator over a paginated
+        source: rows are validated, converted and deduplicated in one streaming
+        pass. ``validate`` accepts the same modes as ``select_accounts``; pass a
+        DedupeReport to see which rows were dropped as duplicates.
+        """
+        return cls(_iter_convert(accounts, validate), report)
+
+    @property
+    def items(self) -> tuple[AccountRole, ...]:
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[AccountRole]:
+        return iter(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> AccountRole: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[AccountRole, ...]: ...
+
+    def __getitem__(self, index: int | slice) -> AccountRole | tuple[AccountRole, ...]:
+        return self._items[index]
+
+    def __contains__(self, item: object) -> bool:
+        return isinstance(item, AccountRole) and self._index.get(item.key) == item
+
+    def __repr__(self) -> str:
+        return f"Inventory({len(self._items)} items)"
+
+    def get(self, account_id: str, role_name: str) -> AccountRole | None:
+        """Return the item for (account_id, role_name), or None."""
+        return self._index.get((account_id, role_name))
+
+    def query(
+        self,
+        *,
+        env: str | Iterable[str] | None = None,
+        role: str | Iterable[str] | None = None,
+        name_prefix: str | None = None,
+        account_ids: str | Iterable[str] | None = None,
+    ) -> list[AccountRole]:
+        """Return the items matching every given criterion, in inventory order.
+
+        ``env`` matches the classified environment (see ``classify``) and
+        ``name_prefix`` the start of the account name, both case-insensitively;
+        ``role`` and ``account_ids`` match exactly. ``env``, ``role`` and
+        ``account_ids`` accept a single value or several alternatives. With no
+        criteria, every item is returned.
+        """
+        return self._queries().query(
+            env=None if env is None else _as_set(env, fold=True),
+            role=None if role is None else _as_set(role),
+            name_prefix=None if name_prefix is None else name_prefix.lower(),
+            account_ids=None if account_ids is None else _as_set(account_ids),
+        )
+
+    def resolve(self, selections: Iterable[str]) -> list[AccountRole]:
+        """Resolve "account_id:role_name" strings to items, in the given order.
+
+        Raises InvalidSelectionError naming every selection that is not present.
+        """
+        found: dict[str, AccountRole] = {}
+        missing: list[str] = []
+        selections = list(selections)
+        for sel in dict.fromkeys(selections):
+            account_id, _, role_name = sel.partition(":")
+            item = self._index.get((account_id, role_name))
+            if item is None:
+                missing.append(sel)
+            else:
+                found[sel] = item
+        if missing:
+            raise InvalidSelectionError(_missing_message(missing))
+        return [found[sel] for sel in selections]
+
+    def select(self, selections: Iterable[str]) -> list[AccountRole]:
+        """Resolve selection specs, including globs, regexes and env= specs (see SelectionSpec).
+
+        Exact "account_id:role_name" selections behave exactly like ``resolve``.
+        When any pattern spec is present, items come back in spec order (each
+        spec's matches in inventory order) with duplicates removed. Raises
+        InvalidSelectionError naming every spec that matched nothing.
+        """
+        selections = list(selections)
+        specs = compile_specs(selections)
+        if all(spec.exact for spec in specs):
+            return self.resolve(selections)
+        queries = self._queries()
+        matched: dict[AccountRole, None] = {}
+        missing: dict[str, None] = {}
+        for spec in specs:
+            if spec.key is not None:
+                item = self._index.get(spec.key)
+                items = [] if item is None else [item]
+            else:
+                items = queries.match(spec)
+            if not items:
+                missing[spec.text] = None
+            matched.update(dict.fromkeys(items))
+        if missing:
+            raise InvalidSelectionError(_missing_message(list(missing)))
+        return list(matched)
+
+    def _queries(self) -> _QueryIndex:
+        if self._query_index is None:
+            self._query_index = _QueryIndex(self._items)
+        return self._query_index
+
+
+class _QueryIndex:
+    """Secondary indexes from environment, role, account and account name to positions.
+
+    A query takes the positions from its most selective criterion's index and
+    checks the remaining criteria against only those rows, so its cost follows
+    the smallest candidate set rather than the inventory size. Selection specs
+    are tested once per distinct account and role, never per row.
+    """
+
+    __slots__ = ("_items", "_by_env", "_by_role", "_by_id", "_by_account", "_env_of", "_names", "_by_name")
+
+    def __init__(self, items: tuple[AccountRole, ...]) -> None:
+        self._items = items
+        self._by_env: dict[str, list[int]] = {}
+        self._by_role: dict[str, list[int]] = {}
+        self._by_id: dict[str, list[int]] = {}
+        self._by_account: dict[AwsAccount, list[int]] = {}
+        self._env_of: dict[str, str | None] = {}
+        by_name: dict[str, list[int]] = {}
+        for position, item in enumerate(items):
+            account = item.account
+            account_id = account.account_id
+            if account_id in self._env_of:
+                env = self._env_of[account_id]
+            else:
+                pattern = classify(account)
+                env = self._env_of[account_id] = None if pattern is None else pattern.environment.lower()
+            if env is not None:
+                self._by_env.setdefault(env, []).append(position)
+            self._by_role.setdefault(item.role.role_name, []).append(position)
+            self._by_id.setdefault(account_id, []).append(position)
+            self._by_account.setdefault(account, []).append(position)
+            by_name.setdefault(account.account_name.lower(), []).append(position)
+        self._names = sorted(by_name)
+        self._by_name = [by_name[name] for name in self._names]
+
+    def query(
+        self,
+        *,
+        env: set[str] | None,
+        role: set[str] | None,
+        name_prefix: str | None,
+        account_ids: set[str] | None,
+    ) -> list[AccountRole]:
+        candidates: list[list[list[int]]] = []
+        if env is not None:
+            candidates.append([self._by_env[key] for key in env if key in self._by_env])
+        if role is not None:
+            candidates.append([self._by_role[key] for key in role if key in self._by_role])
+        if account_ids is not None:
+            candidates.append([self._by_id[key] for key in account_ids if key in self._by_id])
+        if name_prefix is not None:
+            start = bisect_left(self._names, name_prefix)
+            stop = bisect_left(self._names, name_prefix + "\U0010ffff", start)
+            candidates.append(self._by_name[start:stop])
+        if not candidates:
+            return list(self._items)
+        smallest = min(candidates, key=lambda lists: sum(map(len, lists)))
+        positions = smallest[0] if len(smallest) == 1 else sorted(p for group in smallest for p in group)
+        items = self._items
+        env_of = self._env_of
+        matches = []
+        for position in positions:
+            item = items[position]
+            account = item.account
+            if (
+                (env is None or env_of[account.account_id] in env)
+                and (role is None or item.role.role_name in role)
+                and (account_ids is None or account.account_id in account_ids)
+                and (name_prefix is None or account.account_name.lower().startswith(name_prefix))
+            ):
+                matches.append(item)
+        return matches
+
+    def match(self, spec: SelectionSpec) -> list[AccountRole]:
+        """Return the items matching a pattern spec, in inventory order."""
+        sides: list[list[list[int]]] = []
+        if spec.account is not None:
+            sides.append([group for account, group in self._by_account.items() if spec.matches_account(account)])
+        elif spec.environment is not None:
+            group = self._by_env.get(spec.environment)
+            sides.append([] if group is None else [group])
+        if spec.role is not None:
+            sides.append([group for role_name, group in self._by_role.items() if spec.matches_role(role_name)])
+        if not sides:
+            return list(self._items)
+        sides.sort(key=lambda groups: sum(map(len, groups)))
+        positions = set(chain.from_iterable(sides[0]))
+        for groups in sides[1:]:
+            positions.intersection_update(chain.from_iterable(groups))
+        items = self._items
+        return [items[position] for position in sorted(positions)]
+
+
+def _as_set(value: str | Iterable[str], *, fold: bool = False) -> set[str]:
+    values = [value] if isinstance(value, str) else list(value)
+    return {v.lower() for v in values} if fold else set(values)
+
+
+def _missing_message(missing: list[str]) -> str:
+    """Describe every unresolved selection in one error message."""
+    if len(missing) == 1:
+        return f"Selection '{missing[0]}' not found in available accounts"
+    quoted = ", ".join(f"'{sel}'" for sel in missing)
+    return f"Selections {quoted} not found in available accounts"
+
+
+def _validate_and_convert(
+    accounts: Iterable[dict[str, Any]],
+    validate: ValidationMode = "full",
+) -> list[AccountRole]:
+    """Validate input dicts and convert to AccountRole objects.
+
+    Accounts and roles are shared through an AccountPool, so an account with
+    twenty roles is validated and allocated once rather than twenty times.
+    """
+    return list(_iter_convert(accounts, validate))
+
+
+def _iter_convert(accounts: Iterable[dict[str, Any]], validate: ValidationMode = "full") -> Iterator[AccountRole]:
+    """Lazily validate and convert account dicts in a single pass over ``accounts``.
+
+    "fast" and "trusted" work on chunks of ``_CHUNK_SIZE`` rows, so only one
+    chunk of input is held at a time; any iterable, including a generator over
+    a paginated source, is accepted.
+    """
+    _check_validation_mode(validate)
+    return _iter_convert_rows(accounts, validate)
+
+
+def _check_validation_mode(validate: str) -> None:
+    if validate not in _VALIDATION_MODES:
+        raise ValueError(f"validate must be one of {', '.join(_VALIDATION_MODES)}, got '{validate}'")
+
+
+def _iter_convert_rows(accounts: Iterable[dict[str, Any]], validate: ValidationMode) -> Iterator[AccountRole]:
+    if validate == "full":
+        yield from _convert_full(accounts, AccountPool())
+        return
+    pool = AccountPool(validate=False)
+    rows = iter(accounts)
+    offset = 0
+    while chunk := list(islice(rows, _CHUNK_SIZE)):
+        if validate == "fast":
+            yield from _convert_fast(chunk, pool, offset)
+        else:
+            yield from _convert_trusted(chunk, pool)
+        offset += len(chunk)
+
+
+def _convert_full(accounts: Iterable[dict[str, Any]], pool: AccountPool, offset: int = 0) -> Iterator[AccountRole]:
+    """Check every row individually, reporting the first invalid one."""
+    for i, acct in enumerate(accounts, offset):
+        if not isinstance(acct, dict):
+            raise InvalidAccountError(f"accounts[{i}] must be a dict, got {type(acct).__name__}")
+        for field in ("account_id", "account_name", "role_name"):
+            if field not in acct:
+                raise InvalidAccountError(f"accounts[{i}] missing required field '{field}'")
+        yield pool.account_role(
+            str(acct["account_id"]),
+            str(acct["account_name"]),
+            str(acct["role_name"]),
+            acct.get("environment"),
+        )
+
+
+def _convert_fast(accounts: list[dict[str, Any]], pool: AccountPool, offset: int = 0) -> list[AccountRole]:
+    """Validate whole columns at once, then build models without per-row checks.
+
+    Ids are checked with one length scan and a single ``isdecimal`` over the
+    concatenated column; names and roles with ``isspace`` scans. Any failure
+    re-runs the full per-row validation so the error names the offending row.
+    """
+    columns = _checked_columns(accounts)
+    if columns is None:
+        return list(_convert_full(accounts, AccountPool(pool.symbols), offset))
+    return pool.account_roles(*columns)
+
+
+def _checked_columns(
+    accounts: list[dict[str, Any]],
+) -> tuple[list[str], list[str], list[str], list[str | None]] | None:
+    """Split rows into columns, or return None if any row fails the batched checks."""
+    try:
+        if not all(type(acct) is dict for acct in accounts):
+            return None
+        ids = [str(acct["account_id"]) for acct in accounts]
+        names = [str(acct["account_name"]) for acct in accounts]
+        roles = [str(acct["role_name"]) for acct in accounts]
+    except KeyError:
+        return None
+    if (
+        set(map(len, ids)) != {12}
+        or not "".join(ids).isdecimal()
+        or "" in names
+        or any(map(str.isspace, names))
+        or "" in roles
+        or any(map(str.isspace, roles))
+    ):
+        return None
+    return ids, names, roles, [acct.get("environment") for acct in accounts]
+
+
+def _convert_trusted(accounts: list[dict[str, Any]], pool: AccountPool) -> list[AccountRole]:
+    """Build models with no checks at all; the caller guarantees every row is valid."""
+    return pool.account_roles(
+        [acct["account_id"] for acct in accounts],
+        [acct["account_name"] for acct in accounts],
+        [acct["role_name"] for acct in accounts],
+        [acct.get("environment") for acct in accounts],
+    )
@@ -3,9 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from typing import Any
+import contextvars
+import dataclasses
+import inspect
+import threading
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Coroutine, Hashable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, NamedTuple, TypeVar, Union
 
+from aws_pick.core.history import HistoryManager
+from aws_pick.core.login_cache import LoginCache
+from aws_pick.core.ratelimit import RateLimiter, is_throttle_error
+from aws_pick.core.retry import RetryPolicy
 from aws_pick.models.account import AccountRole
 from aws_pick.models.selection import (
     BatchLoginResult,
@@ -13,55 +23,627 @@ from aws_pick.models.selection import (
     LoginResult,
 )
 
+LoginHandler = Union[
+    Callable[[dict[str, Any]], LoginResult],
+    Callable[[dict[str, Any]], Awaitable[LoginResult]],
+]
+"""A login callback: a plain function run in a worker thread, or an ``async def`` run on the event loop."""
+
+DEFAULT_MAX_CONCURRENCY = 1
+DEADLINE_ERROR = "Batch deadline exceeded"
+
+_T = TypeVar("_T")
+
+# Logins in flight anywhere in the process, keyed by (handler, account_id, role_name).
+# The future resolves to the leader's result, or None if the leader was cancelled.
+_in_flight_lock = threading.Lock()
+_in_flight: dict[tuple[Hashable, str, str], Future[ItemLoginResult | None]] = {}
+
+
+def is_async_handler(handler: LoginHandler) -> bool:
+    """Return True if handler is a coroutine function (or an object with an async ``__call__``)."""
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(getattr(handler, "__call__", None))
+
 
 async def process_batch(
-    items: list[AccountRole],
-    handler: Callable[[dict[str, Any]], LoginResult],
+    items: Sequence[AccountRole],
+    handler: LoginHandler,
     on_progress: Callable[[ItemLoginResult], None] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    on_start: Callable[[AccountRole], None] | None = None,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
 ) -> BatchLoginResult:
-    """Process login for each selected item sequentially.
+    """Process login for each selected item, up to max_concurrency at a time.
+
+    Async handlers are awaited on the running loop; sync handlers run in worker
+    threads so they never block it. Results keep the order of ``items`` whatever
+    the completion order, and ``on_progress`` is called on the loop as each item
+    finishes. If the batch is cancelled, in-flight items are reported as
+    "Cancelled" and items not yet started are left out.
+
+    Concurrent logins for the same (handler, account_id, role_name) are merged
+    across batches, threads and event loops: one call runs and every caller
+    waiting on it gets a copy of its result.
 
     Args:
         items: List of selected AccountRole items.
-        handler: Sync callback that processes a single item dict and returns LoginResult.
+        handler: Sync or async callback that processes a single item dict and returns LoginResult.
         on_progress: Optional callback invoked after each item completes.
+        max_concurrency: Maximum number of handlers running at once.
+        on_start: Optional callback invoked as each item's handler is started.
+        rate_limiter: Optional RateLimiter each dispatch waits on. Throttled results
+            (``LoginResult.throttled`` or an AWS throttling exception) slow it down
+            and successes speed it back up.
+        retry: Optional RetryPolicy for transient failures. Retries keep the item's
+            concurrency slot while backing off; ``ItemLoginResult.attempts`` records
+            how many calls were made.
+        login_cache: Optional LoginCache. Items with an unexpired cached login are
+            reported as ``cached`` (with zero attempts) without calling the handler;
+            successful results that carry ``expires_at`` are added to it. The cache
+            is looked up once when the batch starts and written once when it ends,
+            both in a worker thread.
+        item_timeout: Optional limit in seconds on each handler call. A call that
+            overruns is failed with ``timed_out`` set (and retried if the retry
+            policy covers TimeoutError) while the rest of the batch keeps going.
+            Sync handlers cannot be interrupted: the worker thread is abandoned
+            and its eventual result discarded.
+        batch_timeout: Optional limit in seconds on the whole batch. When it
+            passes, in-flight items are cancelled and every unfinished item is
+            reported as failed with DEADLINE_ERROR and ``timed_out`` set.
+        executor: Optional executor for sync handlers instead of a thread per
+            concurrency slot, e.g. a ProcessPoolExecutor for CPU-bound handlers that
+            hold the GIL. A process pool needs a picklable handler (a module-level
+            function) and picklable payloads. Async handlers ignore it.
+        priority: Optional key giving each item's dispatch priority; lower values
+            start first (e.g. ``0`` for favorites and ``1`` for the rest).
+        latency_history: Optional HistoryManager. Items (within a priority) start
+            slowest first by their recorded login time, so the slow logins do not
+            end up running alone at the end of the batch, and the times measured
+            for successful logins are recorded back (both in a worker thread).
+            Results keep the order of ``items`` either way.
 
     Returns:
         BatchLoginResult with all item results.
     """
-    results: list[ItemLoginResult] = []
-    for item in items:
-        item_dict = item.to_dict()
+    results: list[ItemLoginResult | None] = [None] * len(items)
+
+    def collect(index: int, result: ItemLoginResult, held: bool) -> None:
+        results[index] = result
+        if on_progress:
+            on_progress(result)
+
+    try:
+        await _dispatch(
+            items,
+            handler,
+            collect,
+            max_concurrency=max_concurrency,
+            on_start=on_start,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            login_cache=login_cache,
+            item_timeout=item_timeout,
+            batch_timeout=batch_timeout,
+            executor=executor,
+            priority=priority,
+            latency_history=latency_history,
+        )
+    except asyncio.CancelledError:
+        pass
+    return BatchLoginResult(results=[result for result in results if result is not None])
+
+
+def run_batch(
+    items: Sequence[AccountRole],
+    handler: LoginHandler,
+    on_progress: Callable[[ItemLoginResult], None] | None = None,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
+) -> BatchLoginResult:
+    """Blocking form of process_batch for synchronous callers.
+
+    The batch runs on a private event loop. If the calling thread is already
+    running a loop, the batch runs on a helper thread instead of re-entering it.
+    """
+    batch = process_batch(
+        items,
+        handler,
+        on_progress,
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
+        retry=retry,
+        login_cache=login_cache,
+        item_timeout=item_timeout,
+        batch_timeout=batch_timeout,
+        executor=executor,
+        priority=priority,
+        latency_history=latency_history,
+    )
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return _run(batch)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_run, batch).result()
+
+
+def _run(main: Coroutine[Any, Any, _T]) -> _T:
+    """asyncio.run, except that closing the loop does not wait for abandoned handler threads."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main)
+    finally:
         try:
-            lr = await asyncio.to_thread(handler, item_dict)
-            result = ItemLoginResult(
-                account_id=item.account.account_id,
-                account_name=item.account.account_name,
-                role_name=item.role.role_name,
-                success=lr.success,
-                error=lr.error,
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+async def aiter_logins(
+    items: Sequence[AccountRole],
+    handler: LoginHandler,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
+) -> AsyncGenerator[ItemLoginResult, None]:
+    """Log in to each item and yield results as they complete, not in input order.
+
+    Takes the same options as run_batch. Work is paced by the consumer: at most
+    ``2 * max_concurrency`` items are started but not yet taken, so up to
+    ``max_concurrency`` results can wait without slowing the logins down.
+    Closing the iterator early (e.g. with ``contextlib.aclosing``) or cancelling
+    the consumer cancels the logins still running; those results are never
+    yielded.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    queue: asyncio.Queue[tuple[ItemLoginResult, bool] | None] = asyncio.Queue()
+    # One slot per item claimed by a worker but not yet taken by the consumer.
+    slots = asyncio.Semaphore(2 * max_concurrency)
+
+    async def run() -> None:
+        try:
+            await _dispatch(
+                items,
+                handler,
+                lambda _, result, held: queue.put_nowait((result, held)),
+                max_concurrency=max_concurrency,
+                on_start=None,
+                rate_limiter=rate_limiter,
+                retry=retry,
+                login_cache=login_cache,
+                item_timeout=item_timeout,
+                batch_timeout=batch_timeout,
+                executor=executor,
+                priority=priority,
+                latency_history=latency_history,
+                slots=slots,
             )
-        except asyncio.CancelledError:
-            result = ItemLoginResult(
-                account_id=item.account.account_id,
-                account_name=item.account.account_name,
-                role_name=item.role.role_name,
-                success=False,
-                error="Cancelled",
+        finally:
+            queue.put_nowait(None)
+
+    task = asyncio.ensure_future(run())
+    try:
+        while (entry := await queue.get()) is not None:
+            result, held = entry
+            if held:
+                slots.release()
+            yield result
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+def iter_logins(
+    items: Sequence[AccountRole],
+    handler: LoginHandler,
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
+) -> Iterator[ItemLoginResult]:
+    """Blocking form of aiter_logins for synchronous callers.
+
+    The logins run on a private event loop in a helper thread, so they carry on
+    while the caller works on the results already yielded.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="aws-pick-logins", daemon=True)
+    thread.start()
+    results = aiter_logins(
+        items,
+        handler,
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
+        retry=retry,
+        login_cache=login_cache,
+        item_timeout=item_timeout,
+        batch_timeout=batch_timeout,
+        executor=executor,
+        priority=priority,
+        latency_history=latency_history,
+    )
+    try:
+        while (result := asyncio.run_coroutine_threadsafe(_next_result(results), loop).result()) is not None:
+            yield result
+    finally:
+        asyncio.run_coroutine_threadsafe(results.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        # close() does not wait for worker threads of sync handlers that were abandoned.
+        loop.close()
+
+
+async def _next_result(results: AsyncIterator[ItemLoginResult]) -> ItemLoginResult | None:
+    try:
+        return await results.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def _dispatch(
+    items: Sequence[AccountRole],
+    handler: LoginHandler,
+    emit: Callable[[int, ItemLoginResult, bool], None],
+    *,
+    max_concurrency: int,
+    on_start: Callable[[AccountRole], None] | None,
+    rate_limiter: RateLimiter | None,
+    retry: RetryPolicy | None,
+    login_cache: LoginCache | None,
+    item_timeout: float | None,
+    batch_timeout: float | None,
+    executor: Executor | None,
+    priority: Callable[[AccountRole], float] | None,
+    latency_history: HistoryManager | None,
+    slots: asyncio.Semaphore | None = None,
+) -> None:
+    """Run the batch, passing each item's index and result to emit as it finishes.
+
+    If slots is given, a worker takes one before claiming each item, and emit's
+    flag says whether the result holds one: results filled in for unclaimed
+    items at the batch deadline do not. On cancellation the workers report
+    their in-flight items before it is re-raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+    run_async = is_async_handler(handler)
+    pending: Iterator[tuple[int, AccountRole]]
+    if priority is None and latency_history is None:
+        pending = iter(enumerate(items))
+    else:
+        latencies = await asyncio.to_thread(latency_history.get_latencies) if latency_history is not None else {}
+        pending = ((index, items[index]) for index in _dispatch_order(items, priority, latencies))
+    # Cache and history files are read and written in worker threads so the loop never waits on disk.
+    cached: dict[tuple[str, str], LoginResult] = {}
+    if login_cache is not None:
+        cached = await asyncio.to_thread(login_cache.get_many, [item.key for item in items])
+    # Sync handlers get a thread per concurrency slot; the loop's default pool may be smaller.
+    threads = _HandlerThreads(max_concurrency) if executor is None and not run_async else None
+    if threads is not None:
+        executor = threads
+    finished = bytearray(len(items))
+    stopped = False
+    expired = False
+    fresh: list[tuple[str, str, LoginResult]] = []
+    timings: list[tuple[str, str, float]] = []
+
+    def report(index: int, result: ItemLoginResult, held: bool = True) -> None:
+        finished[index] = 1
+        emit(index, result, held and slots is not None)
+
+    async def worker() -> None:
+        nonlocal stopped
+        while not stopped:
+            if slots is not None:
+                await slots.acquire()
+            claimed = next(pending, None)
+            if claimed is None:
+                if slots is not None:
+                    slots.release()
+                return
+            index, item = claimed
+            hit = cached.get(item.key)
+            if hit is not None:
+                report(
+                    index,
+                    _item_result(
+                        item, True, None, attempts=0, cached=True, expires_at=hit.expires_at, payload=hit.payload
+                    ),
+                )
+                continue
+            result, cancelled = await _login_single_flight(
+                item, handler, run_async, executor, rate_limiter, retry, item_timeout, on_start
             )
-            results.append(result)
-            if on_progress:
-                on_progress(result)
+            if cancelled and expired:
+                result = dataclasses.replace(result, error=DEADLINE_ERROR, timed_out=True)
+            if login_cache is not None and result.success and result.expires_at is not None:
+                fresh.append(
+                    (*item.key, LoginResult(success=True, expires_at=result.expires_at, payload=result.payload))
+                )
+            if latency_history is not None and result.success:
+                timings.append((*item.key, result.elapsed))
+            report(index, result)
+            if cancelled:
+                stopped = True
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(max_concurrency, len(items)))]
+    try:
+        if batch_timeout is None or not workers:
+            await asyncio.gather(*workers)
+        else:
+            done, late = await asyncio.wait(workers, timeout=batch_timeout)
+            if late:
+                expired = True
+                for task in late:
+                    task.cancel()
+                await asyncio.gather(*late, return_exceptions=True)
+            for task in done:
+                task.result()
+    except asyncio.CancelledError:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    finally:
+        if threads is not None:
+            threads.shutdown(wait=False)
+        if login_cache is not None and fresh:
+            await asyncio.to_thread(login_cache.put_many, fresh)
+        if latency_history is not None and timings:
+            await asyncio.to_thread(latency_history.record_latencies, timings)
+    if expired:
+        for index, item in enumerate(items):
+            if not finished[index]:
+                report(index, _item_result(item, False, DEADLINE_ERROR, attempts=0, timed_out=True), held=False)
+
+
+async def _login_single_flight(
+    item: AccountRole,
+    handler: LoginHandler,
+    run_async: bool,
+    executor: Executor | None,
+    rate_limiter: RateLimiter | None,
+    retry: RetryPolicy | None,
+    timeout: float | None,
+    on_start: Callable[[AccountRole], None] | None,
+) -> tuple[ItemLoginResult, bool]:
+    """Log in once per key: lead the call, or wait for the one already in flight.
+
+    The flag is True if this caller was cancelled. If the leading call is
+    cancelled, its waiters go round again and one of them takes over. A waiter
+    gives up after timeout seconds, as its own call would have.
+    """
+    key = (_handler_key(handler), *item.key)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout if timeout is not None else None
+    while True:
+        with _in_flight_lock:
+            shared = _in_flight.get(key)
+            leader = shared is None
+            if shared is None:
+                shared = _in_flight[key] = Future()
+        if leader:
             break
-        except Exception as exc:
-            result = ItemLoginResult(
-                account_id=item.account.account_id,
-                account_name=item.account.account_name,
-                role_name=item.role.role_name,
-                success=False,
-                error=str(exc),
+        if on_start:
+            on_start(item)
+        try:
+            # shield: a cancelled or timed-out waiter must not cancel the shared call.
+            outcome = await asyncio.wait_for(
+                asyncio.shield(asyncio.wrap_future(shared)),
+                max(0.0, deadline - loop.time()) if deadline is not None else None,
             )
-        results.append(result)
-        if on_progress:
-            on_progress(result)
-    return BatchLoginResult(results=results)
+        except asyncio.CancelledError:
+            return _item_result(item, False, "Cancelled", attempts=0), True
+        except asyncio.TimeoutError:
+            return _item_result(item, False, f"Timed out after {timeout:g}s", attempts=0, timed_out=True), False
+        if outcome is not None:
+            return dataclasses.replace(outcome), False
+
+    result: ItemLoginResult | None = None
+    try:
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        if on_start:
+            on_start(item)
+        result, cancelled = await _login_with_retries(item, handler, run_async, executor, rate_limiter, retry, timeout)
+        return result, cancelled
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+        shared.set_result(None if result is None or cancelled else dataclasses.replace(result))
+
+
+def _dispatch_order(
+    items: Sequence[AccountRole],
+    priority: Callable[[AccountRole], float] | None,
+    latencies: dict[tuple[str, str], float],
+) -> list[int]:
+    """Indexes of items in start order: lowest priority value first, then slowest recorded login first.
+
+    Items with no recorded latency are assumed to take the batch's average.
+    """
+    known = [latencies[item.key] for item in items if item.key in latencies]
+    default = sum(known) / len(known) if known else 0.0
+
+    def key(index: int) -> tuple[float, float]:
+        item = items[index]
+        return (priority(item) if priority is not None else 0.0, -latencies.get(item.key, default))
+
+    return sorted(range(len(items)), key=key)
+
+
+def _handler_key(handler: LoginHandler) -> Hashable:
+    try:
+        hash(handler)
+    except TypeError:
+        return id(handler)
+    return handler
+
+
+class _Attempt(NamedTuple):
+    result: ItemLoginResult
+    cancelled: bool
+    retryable: bool
+
+
+async def _login_with_retries(
+    item: AccountRole,
+    handler: LoginHandler,
+    run_async: bool,
+    executor: Executor | None,
+    rate_limiter: RateLimiter | None,
+    retry: RetryPolicy | None,
+    timeout: float | None,
+) -> tuple[ItemLoginResult, bool]:
+    """Run the handler for one item until it succeeds, fails for good or runs out of attempts.
+
+    The caller has already taken a rate-limiter token for the first attempt. The
+    flag is True if the item was cancelled.
+    """
+    max_attempts = retry.max_attempts if retry is not None else 1
+    attempt = 0
+    elapsed = 0.0
+    while True:
+        attempt += 1
+        started = time.perf_counter()
+        outcome = await _login_item(item, handler, run_async, executor, retry, timeout)
+        elapsed += time.perf_counter() - started
+        result = outcome.result
+        result.attempts = attempt
+        result.elapsed = elapsed
+        if outcome.cancelled:
+            return result, True
+        if rate_limiter is not None:
+            if result.throttled:
+                rate_limiter.on_throttle()
+            elif result.success:
+                rate_limiter.on_success()
+        if retry is None or not outcome.retryable or attempt >= max_attempts:
+            return result, False
+        try:
+            await asyncio.sleep(retry.delay(attempt))
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+        except asyncio.CancelledError:
+            return _item_result(item, False, "Cancelled", attempts=attempt), True
+
+
+async def _login_item(
+    item: AccountRole,
+    handler: LoginHandler,
+    run_async: bool,
+    executor: Executor | None,
+    retry: RetryPolicy | None,
+    timeout: float | None,
+) -> _Attempt:
+    """Call the handler once for one item, giving up after timeout seconds if set."""
+    item_dict = item.to_dict()
+    call: asyncio.Future[LoginResult] | None = None
+    try:
+        if timeout is None:
+            lr = await _call_handler(handler, item_dict, run_async, executor)
+        else:
+            # Wait on a task rather than wait_for so a TimeoutError raised by the
+            # handler itself is not mistaken for the call overrunning.
+            call = asyncio.ensure_future(_call_handler(handler, item_dict, run_async, executor))
+            done, _ = await asyncio.wait({call}, timeout=timeout)
+            if not done:
+                call.cancel()
+                if isinstance(executor, _HandlerThreads):
+                    executor.abandon()
+                retryable = retry is not None and retry.should_retry(TimeoutError())
+                result = _item_result(item, False, f"Timed out after {timeout:g}s", timed_out=True)
+                return _Attempt(result, False, retryable)
+            lr = call.result()
+    except asyncio.CancelledError:
+        if call is not None:
+            call.cancel()
+        return _Attempt(_item_result(item, False, "Cancelled"), True, False)
+    except Exception as exc:
+        retryable = retry is not None and retry.should_retry(exc)
+        return _Attempt(_item_result(item, False, str(exc), throttled=is_throttle_error(exc)), False, retryable)
+    retryable = retry is not None and retry.should_retry(lr)
+    result = _item_result(
+        item, lr.success, lr.error, throttled=lr.throttled, expires_at=lr.expires_at, payload=lr.payload
+    )
+    return _Attempt(result, False, retryable)
+
+
+async def _call_handler(
+    handler: LoginHandler, item_dict: dict[str, Any], run_async: bool, executor: Executor | None
+) -> LoginResult:
+    outcome: LoginResult | Awaitable[LoginResult]
+    if run_async:
+        outcome = handler(item_dict)
+    else:
+        outcome = await asyncio.get_running_loop().run_in_executor(executor, handler, item_dict)
+    return await outcome if inspect.isawaitable(outcome) else outcome
+
+
+class _HandlerThreads(Executor):
+    """Worker threads for one batch's sync handlers, one per concurrency slot.
+
+    Handlers run in a copy of the submitting context, as with asyncio.to_thread.
+    A thread left running by a timed-out call cannot be reclaimed, so abandon()
+    moves later calls to a fresh pool rather than queueing them behind it.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._pool = self._new_pool()
+
+    def submit(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> Future[_T]:
+        return self._pool.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def abandon(self) -> None:
+        retired, self._pool = self._pool, self._new_pool()
+        retired.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _new_pool(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self._size, thread_name_prefix="aws-pick-login")
+
+
+def _item_result(item: AccountRole, success: bool, error: str | None, **fields: Any) -> ItemLoginResult:
+    return ItemLoginResult(
+        account_id=item.account.account_id,
+        account_name=item.account.account_name,
+        role_name=item.role.role_name,
+        success=success,
+        error=error,
+        **fields,
+    )
@@ -0,0 +1,137 @@
+"""Cache of unexpired login results, in memory and optionally on disk."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from aws_pick.models.selection import LoginResult
+from aws_pick.storage.json_store import JsonStore, default_config_dir
+
+logger = logging.getLogger(__name__)
+
+_CACHE_FILE = "login_cache.json"
+_CACHE_MODE = 0o600
+_DEFAULT_MARGIN = timedelta(minutes=1)
+
+_Key = tuple[str, str]
+_Entry = tuple[datetime, Any]
+
+
+class LoginCache:
+    """Successful login results keyed by (account_id, role_name) until they expire.
+
+    Only results with ``success`` and an ``expires_at`` are cached. An entry is
+    treated as expired ``margin`` before its expiry so callers never receive a
+    session that is about to lapse. With ``persist=True`` entries are also
+    written to ``login_cache.json`` in the config directory (mode 0600) and
+    shared with other processes; payloads that are not JSON-serialisable stay
+    in memory only.
+    """
+
+    def __init__(
+        self,
+        config_dir: Path | None = None,
+        *,
+        persist: bool = False,
+        margin: timedelta = _DEFAULT_MARGIN,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._store = JsonStore.shared(config_dir or default_config_dir()) if persist else None
+        self._margin = margin
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self._lock = threading.Lock()
+        self._entries: dict[_Key, _Entry] = {}
+
+    def get(self, account_id: str, role_name: str) -> LoginResult | None:
+        """Return the cached result for the pair, or None if there is none or it has expired."""
+        key = (account_id, role_name)
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[_Key]) -> dict[_Key, LoginResult]:
+        """Return the unexpired cached results among keys, reading the disk cache at most once.
+
+        Pairs missing from memory are picked up from the disk cache, possibly
+        written by another process.
+        """
+        deadline = self._clock() + self._margin
+        with self._lock:
+            found = {key: self._entries.get(key) for key in keys}
+        stale = [key for key, entry in found.items() if entry is None or entry[0] <= deadline]
+        if stale and self._store is not None:
+            persisted = self._store.snapshot(_CACHE_FILE, defaults={"entries": {}}).get("entries", {})
+            loaded: dict[_Key, _Entry] = {}
+            for key in stale:
+                entry = persisted.get(f"{key[0]}:{key[1]}")
+                if isinstance(entry, dict):
+                    found[key] = loaded[key] = (_expiry(entry), entry.get("payload"))
+            if loaded:
+                with self._lock:
+                    self._entries.update(loaded)
+        return {
+            key: LoginResult(success=True, expires_at=entry[0], payload=entry[1])
+            for key, entry in found.items()
+            if entry is not None and entry[0] > deadline
+        }
+
+    def put(self, account_id: str, role_name: str, result: LoginResult) -> None:
+        """Cache a successful result that has an expiry; other results are ignored."""
+        self.put_many([(account_id, role_name, result)])
+
+    def put_many(self, results: Iterable[tuple[str, str, LoginResult]]) -> None:
+        """Cache several results, writing the disk cache once."""
+        fresh: dict[_Key, _Entry] = {}
+        for account_id, role_name, result in results:
+            if result.success and result.expires_at is not None:
+                fresh[(account_id, role_name)] = (_aware(result.expires_at), result.payload)
+        if not fresh:
+            return
+        with self._lock:
+            self._entries.update(fresh)
+        if self._store is None:
+            return
+        now = self._clock()
+        with self._store.transaction(_CACHE_FILE, defaults={"entries": {}}, mode=_CACHE_MODE) as data:
+            entries: dict[str, Any] = {
+                name: entry for name, entry in data.get("entries", {}).items() if _expiry(entry) > now
+            }
+            for (account_id, role_name), (expires_at, payload) in fresh.items():
+                try:
+                    json.dumps(payload)
+                except (TypeError, ValueError):
+                    logger.debug("Not persisting login for %s:%s: payload is not JSON", account_id, role_name)
+                    continue
+                entries[f"{account_id}:{role_name}"] = {"expires_at": expires_at.isoformat(), "payload": payload}
+            data["entries"] = entries
+
+    def invalidate(self, account_id: str, role_name: str) -> None:
+        """Drop the cached result for one pair."""
+        with self._lock:
+            self._entries.pop((account_id, role_name), None)
+        if self._store is not None:
+            with self._store.transaction(_CACHE_FILE, defaults={"entries": {}}, mode=_CACHE_MODE) as data:
+                data.get("entries", {}).pop(f"{account_id}:{role_name}", None)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.write(_CACHE_FILE, {"entries": {}}, mode=_CACHE_MODE)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _expiry(entry: Any) -> datetime:
+    """Parse an on-disk entry's expiry; entries without a valid one count as long expired."""
+    try:
+        return _aware(datetime.fromisoformat(entry["expires_at"]))
+    except (KeyError, TypeError, ValueError):
+        return datetime.min.replace(tzinfo=timezone.utc)
@@ -2,56 +2,114 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from aws_pick.core.registry import shared_manager
 from aws_pick.exceptions import PresetNotFoundError
+from aws_pick.models.account import AccountRole
 from aws_pick.models.config import Favorite, Preset
+from aws_pick.models.selection import PresetResolution
 from aws_pick.storage.json_store import JsonStore, default_config_dir
 
 _CONFIG_FILE = "config.json"
 
 
 class PresetsManager:
-    """CRUD operations for persisted named presets."""
+    """CRUD operations for persisted named presets.
+
+    Managers are safe to share between threads. Reads are served from the
+    shared store's parsed-file cache, with parsed presets kept until
+    config.json changes; writes run as store transactions.
+    """
 
     def __init__(self, config_dir: Path | None = None) -> None:
-        self._store = JsonStore(base_dir=config_dir or default_config_dir())
+        self._store = JsonStore.shared(config_dir or default_config_dir())
+        self._index: tuple[dict[str, Any], dict[str, Preset]] | None = None
+
+    def _presets(self) -> dict[str, Preset]:
+        data = self._store.snapshot(_CONFIG_FILE)
+        index = self._index
+        if index is None or index[0] is not data:
+            raw: dict[str, Any] = data.get("presets", {})
+            index = self._index = (data, {name: Preset.from_dict(name, value) for name, value in raw.items()})
+        return index[1]
 
     def list_names(self) -> list[str]:
-        data = self._store.read(_CONFIG_FILE)
-        presets: dict[str, Any] = data.get("presets", {})
-        return sorted(presets.keys())
+        return sorted(self._presets())
 
     def get(self, name: str) -> Preset:
-        data = self._store.read(_CONFIG_FILE)
-        presets: dict[str, Any] = data.get("presets", {})
+        presets = self._presets()
         if name not in presets:
             raise PresetNotFoundError(f"Preset '{name}' not found")
-        return Preset.from_dict(name, presets[name])
+        return presets[name]
+
+    def get_many(self, names: Iterable[str]) -> dict[str, Preset]:
+        """Load several presets with a single read of the config file."""
+        presets = self._presets()
+        result: dict[str, Preset] = {}
+        for name in names:
+            if name not in presets:
+                raise PresetNotFoundError(f"Preset '{name}' not found")
+            result[name] = presets[name]
+        return result
 
     def save(self, name: str, items: list[Favorite]) -> None:
-        data = self._store.read(_CONFIG_FILE)
-        presets: dict[str, Any] = data.get("presets", {})
-        presets[name] = {
-            "items": [item.to_dict() for item in items],
-            "created_at": datetime.now(timezone.utc).isoformat(),
-        }
-        data["presets"] = presets
-        self._store.write(_CONFIG_FILE, data)
+        with self._store.transaction(_CONFIG_FILE) as data:
+            presets: dict[str, Any] = data.get("presets", {})
+            presets[name] = {
+                "items": [item.to_dict() for item in items],
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+            data["presets"] = presets
 
     def delete(self, name: str) -> None:
-        data = self._store.read(_CONFIG_FILE)
-        presets: dict[str, Any] = data.get("presets", {})
-        if name not in presets:
-            raise PresetNotFoundError(f"Preset '{name}' not found")
-        del presets[name]
-        data["presets"] = presets
-        self._store.write(_CONFIG_FILE, data)
+        with self._store.transaction(_CONFIG_FILE) as data:
+            presets: dict[str, Any] = data.get("presets", {})
+            if name not in presets:
+                raise PresetNotFoundError(f"Preset '{name}' not found")
+            del presets[name]
+            data["presets"] = presets
+
+
+def resolve_presets(
+    items: Iterable[AccountRole],
+    presets: Mapping[str, Preset | Iterable[Favorite]],
+) -> PresetResolution:
+    """Resolve many presets (or favorites sets) against one inventory in a single pass.
+
+    The inventory is indexed once by (account_id, role_name); each preset is then
+    resolved with set operations on its keys. Duplicate inventory keys keep their
+    first occurrence, matching ``deduplicate``. Nothing is raised for missing keys;
+    callers inspect ``PresetResolution.missing`` instead.
+    """
+    index: dict[tuple[str, str], AccountRole] = {}
+    for item in items:
+        index.setdefault(item.key, item)
+    available = index.keys()
+
+    resolution = PresetResolution()
+    seen_missing: set[tuple[str, str]] = set()
+    for name, source in presets.items():
+        favorites = source.items if isinstance(source, Preset) else source
+        wanted = dict.fromkeys((f.account_id, f.role_name) for f in favorites)
+        absent = wanted.keys() - available
+        if absent:
+            ordered_absent = [key for key in wanted if key in absent]
+            resolution.missing_by_preset[name] = ordered_absent
+            for key in ordered_absent:
+                if key not in seen_missing:
+                    seen_missing.add(key)
+                    resolution.missing.append(key)
+            resolution.resolved[name] = [index[key] for key in wanted if key not in absent]
+        else:
+            resolution.resolved[name] = [index[key] for key in wanted]
+    return resolution
 
 
 def manage_presets(*, config_dir: str | Path | None = None) -> PresetsManager:
-    """Factory function to create a PresetsManager."""
+    """Return the process-wide PresetsManager for config_dir."""
     path = Path(config_dir) if isinstance(config_dir, str) else config_dir
-    return PresetsManager(config_dir=path)
+    return shared_manager(PresetsManager, path)
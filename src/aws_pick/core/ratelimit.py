@@ -0,0 +1,113 @@
+"""Adaptive token-bucket rate limiting for login dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+# Error codes AWS services use to signal throttling, as reported on botocore's
+# ClientError.response["Error"]["Code"].
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "TooManyRequestsException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+    }
+)
+
+
+class RateLimiter:
+    """Token bucket whose rate adapts to throttling (additive increase, multiplicative decrease).
+
+    Each dispatch takes one token; tokens refill at ``rate`` per second up to
+    ``burst``. When a handler reports throttling the rate is multiplied by
+    ``decrease`` (at most once per token interval, so a wave of throttled
+    in-flight calls counts once) down to ``min_rate``. Each success adds
+    ``increase`` tokens per second back, up to the configured ``rate``.
+
+    A limiter may be shared by several batches, including batches running on
+    different threads or event loops.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        *,
+        min_rate: float | None = None,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        if not 0 < decrease < 1:
+            raise ValueError(f"decrease must be between 0 and 1, got {decrease}")
+        self._max_rate = float(rate)
+        self._min_rate = min(float(min_rate), self._max_rate) if min_rate is not None else self._max_rate / 32
+        self._increase = increase
+        self._decrease = decrease
+        self._burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = self._max_rate
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._last_decrease = float("-inf")
+
+    @property
+    def rate(self) -> float:
+        """Current dispatch rate in tokens per second."""
+        return self._rate
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = min(self._max_rate, self._rate + self._increase)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            self._refill()
+            now = self._updated
+            if now - self._last_decrease < 1 / self._rate:
+                return
+            self._last_decrease = now
+            self._rate = max(self._min_rate, self._rate * self._decrease)
+            # Stop the current burst: nothing more goes out until a token refills.
+            self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(float(self._burst), self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+def is_throttle_error(exc: BaseException) -> bool:
+    """Return True if exc looks like an AWS throttling error (e.g. a botocore ClientError)."""
+    response = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return False
+    error = response.get("Error")
+    return isinstance(error, dict) and error.get("Code") in THROTTLE_ERROR_CODES
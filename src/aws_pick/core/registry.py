@@ -0,0 +1,24 @@
+"""Process-wide registry of shared managers, one per manager class and config directory."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any, TypeVar
+
+from aws_pick.storage.json_store import default_config_dir
+
+M = TypeVar("M")
+
+_lock = threading.Lock()
+_managers: dict[tuple[type[Any], Path], Any] = {}
+
+
+def shared_manager(cls: type[M], config_dir: Path | None = None) -> M:
+    """Return the shared ``cls(config_dir=...)`` instance for config_dir, creating it on first use."""
+    key = (cls, (config_dir or default_config_dir()).resolve())
+    with _lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = cls(config_dir=config_dir)  # type: ignore[call-arg]
+    return manager
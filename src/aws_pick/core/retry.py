@@ -0,0 +1,46 @@
+"""Retry policy with exponential backoff and jitter for login handlers."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from aws_pick.core.ratelimit import is_throttle_error
+from aws_pick.models.selection import LoginResult
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How often and how patiently a failed login is retried.
+
+    A result is retried when the handler returns ``LoginResult(retryable=True)``
+    or ``throttled=True``, or raises an AWS throttling error or one of
+    ``retry_on`` (network errors by default). Attempt ``n`` waits up to
+    ``base_delay * 2 ** (n - 1)`` seconds, capped at ``max_delay``; with
+    ``jitter`` the wait is drawn uniformly from zero to that bound ("full
+    jitter"), which spreads out retries from a batch that failed together.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 20.0
+    jitter: bool = True
+    retry_on: tuple[type[BaseException], ...] = (OSError,)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("retry delays must not be negative")
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Seconds to wait after the given (1-based) failed attempt."""
+        bound = min(self.max_delay, self.base_delay * 2.0 ** (attempt - 1))
+        return bound * rand() if self.jitter else bound
+
+    def should_retry(self, outcome: LoginResult | BaseException) -> bool:
+        """Whether a handler result or exception is worth another attempt."""
+        if isinstance(outcome, BaseException):
+            return isinstance(outcome, self.retry_on) or is_throttle_error(outcome)
+        return not outcome.success and (outcome.retryable or outcome.throttled)
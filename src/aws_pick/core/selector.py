@@ -2,88 +2,194 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any
 
+from aws_pick.core.history import HistoryManager
+from aws_pick.core.inventory import Inventory, ValidationMode, _check_validation_mode, _missing_message
+from aws_pick.core.login import DEFAULT_MAX_CONCURRENCY, LoginHandler, process_batch, run_batch
+from aws_pick.core.login_cache import LoginCache
+from aws_pick.core.ratelimit import RateLimiter
+from aws_pick.core.retry import RetryPolicy
+from aws_pick.core.specs import SelectionSpec, compile_specs
 from aws_pick.exceptions import InvalidAccountError, InvalidSelectionError
-from aws_pick.models.account import AccountRole, AwsAccount, AwsRole, deduplicate
-from aws_pick.models.selection import (
-    BatchLoginResult,
-    ItemLoginResult,
-    LoginResult,
-    SelectionResult,
-)
+from aws_pick.models.account import AccountRole
+from aws_pick.models.pool import AccountPool
+from aws_pick.models.selection import SelectionResult
+from aws_pick.models.table import AccountTable
 
 
 def select_accounts(
-    accounts: list[dict[str, Any]],
+    accounts: Iterable[dict[str, Any]] | Inventory | AccountTable,
     *,
     interactive: bool = True,
     selections: list[str] | None = None,
-    on_login: Callable[[dict[str, Any]], LoginResult] | None = None,
+    on_login: LoginHandler | None = None,
     config_dir: str | Path | None = None,
     title: str = "Select Accounts",
+    validate: ValidationMode = "full",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
 ) -> SelectionResult:
     """Launch the credential selector.
 
     Args:
-        accounts: List of account/role dicts with account_id, account_name, role_name.
+        accounts: Account/role dicts with account_id, account_name, role_name, as a
+            list or any iterable (a generator is consumed in one streaming pass),
+            a prebuilt Inventory to reuse across calls, or an AccountTable for very
+            large inventories.
         interactive: If True, launch the TUI. If False, use selections parameter.
-        selections: List of "account_id:role_name" strings for non-interactive mode.
+        selections: Selection specs for non-interactive mode: exact "account_id:role_name"
+            strings, globs such as "*:ReadOnly" or "prod-*:Admin*", regexes such as
+            "re:^data-.*:.*Engineer$", or environment specs such as "env=staging:Deployer".
         on_login: Optional callback for each selected pair. Receives a dict, returns LoginResult.
+            May be a plain function (run in worker threads) or an ``async def``.
         config_dir: Override config directory for favorites/presets/history.
         title: Title displayed in the TUI panel header.
+        validate: How strictly account dicts are checked. "full" validates each row,
+            "fast" runs batched column checks (falling back to "full" to report the
+            offending row), "trusted" skips checks for input known to be valid.
+        max_concurrency: Maximum number of on_login calls running at once (default
+            1; raise it only for a thread-safe handler). Login results keep the
+            selection order.
+        rate_limiter: Optional RateLimiter pacing on_login calls; it slows down when
+            handlers report throttling and recovers as they succeed.
+        retry: Optional RetryPolicy for transient on_login failures.
+        login_cache: Optional LoginCache; pairs with an unexpired cached login skip
+            on_login and are reported as ``cached``.
+        item_timeout: Optional limit in seconds on each on_login call; calls that
+            overrun are failed with ``timed_out`` set.
+        batch_timeout: Optional limit in seconds on all logins together; unfinished
+            items are failed with ``timed_out`` set.
+        executor: Optional executor for sync on_login calls instead of a thread per
+            concurrency slot, e.g. a ProcessPoolExecutor for a picklable CPU-bound handler.
+        priority: Optional key giving each pair's login priority; lower values are
+            logged in first (e.g. favorites first or production last).
+        latency_history: Optional HistoryManager; within a priority, pairs with the
+            slowest recorded logins start first, and new login times are recorded.
 
     Returns:
         SelectionResult with selected items and optional login results.
     """
-    if not accounts:
-        return SelectionResult()
-
-    items = _validate_and_convert(accounts)
-    items = deduplicate(items)
-
-    if interactive:
-        result = _run_interactive(items, title=title)
+    if (
+        not isinstance(accounts, (Inventory, AccountTable))
+        and not interactive
+        and selections is not None
+        and _all_exact(selections)
+    ):
+        result = _run_non_interactive_stream(accounts, selections, validate=validate)
     else:
-        if selections is None:
-            raise ValueError("selections parameter is required when interactive=False")
-        result = _run_non_interactive(items, selections)
+        items = _prepare(accounts, validate)
+        if not items:
+            return SelectionResult()
 
-    if result.cancelled or not result.selected:
+        if interactive:
+            result = _run_interactive(items, title=title)
+        else:
+            if selections is None:
+                raise ValueError("selections parameter is required when interactive=False")
+            result = _run_non_interactive(items, selections)
+
+    if result.cancelled or not len(result.selected_items):
         return result
 
     if on_login is not None:
-        batch = _run_login(result.selected, on_login)
-        result.login_results = batch
+        result.login_results = run_batch(
+            result.selected_items,
+            on_login,
+            max_concurrency=max_concurrency,
+            rate_limiter=rate_limiter,
+            retry=retry,
+            login_cache=login_cache,
+            item_timeout=item_timeout,
+            batch_timeout=batch_timeout,
+            executor=executor,
+            priority=priority,
+            latency_history=latency_history,
+        )
 
     return result
 
 
-def _validate_and_convert(accounts: list[dict[str, Any]]) -> list[AccountRole]:
-    """Validate input dicts and convert to AccountRole objects."""
-    items: list[AccountRole] = []
-    for i, acct in enumerate(accounts):
-        if not isinstance(acct, dict):
-            raise InvalidAccountError(f"accounts[{i}] must be a dict, got {type(acct).__name__}")
-        for field in ("account_id", "account_name", "role_name"):
-            if field not in acct:
-                raise InvalidAccountError(f"accounts[{i}] missing required field '{field}'")
-        items.append(
-            AccountRole(
-                account=AwsAccount(
-                    account_id=str(acct["account_id"]),
-                    account_name=str(acct["account_name"]),
-                    environment=acct.get("environment"),
-                ),
-                role=AwsRole(role_name=str(acct["role_name"])),
-            )
+async def aselect_accounts(
+    accounts: Iterable[dict[str, Any]] | Inventory | AccountTable,
+    *,
+    interactive: bool = True,
+    selections: list[str] | None = None,
+    on_login: LoginHandler | None = None,
+    config_dir: str | Path | None = None,
+    title: str = "Select Accounts",
+    validate: ValidationMode = "full",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+    retry: RetryPolicy | None = None,
+    login_cache: LoginCache | None = None,
+    item_timeout: float | None = None,
+    batch_timeout: float | None = None,
+    executor: Executor | None = None,
+    priority: Callable[[AccountRole], float] | None = None,
+    latency_history: HistoryManager | None = None,
+) -> SelectionResult:
+    """Async counterpart of select_accounts for callers already inside an event loop.
+
+    Input preparation and non-interactive selection run in a worker thread and the
+    TUI runs through ``App.run_async``, so the loop is never blocked. Logins run
+    on the caller's loop, with async handlers awaited natively and sync handlers
+    run in threads. Arguments are as for select_accounts.
+    """
+    if interactive:
+        items = await asyncio.to_thread(_prepare, accounts, validate)
+        if not items:
+            return SelectionResult()
+        result = await _arun_interactive(items, title=title)
+    else:
+        result = await asyncio.to_thread(
+            select_accounts,
+            accounts,
+            interactive=False,
+            selections=selections,
+            config_dir=config_dir,
+            validate=validate,
         )
-    return items
 
+    if result.cancelled or not len(result.selected_items) or on_login is None:
+        return result
+    result.login_results = await process_batch(
+        result.selected_items,
+        on_login,
+        max_concurrency=max_concurrency,
+        rate_limiter=rate_limiter,
+        retry=retry,
+        login_cache=login_cache,
+        item_timeout=item_timeout,
+        batch_timeout=batch_timeout,
+        executor=executor,
+        priority=priority,
+        latency_history=latency_history,
+    )
+    return result
+
+
+def _prepare(
+    accounts: Iterable[dict[str, Any]] | Inventory | AccountTable, validate: ValidationMode
+) -> Inventory | AccountTable:
+    """Validate raw account dicts into an Inventory; prepared inputs pass through."""
+    if isinstance(accounts, (Inventory, AccountTable)):
+        return accounts
+    return Inventory.from_dicts(accounts, validate=validate)
 
-def _run_interactive(items: list[AccountRole], *, title: str = "Select Accounts") -> SelectionResult:
+
+def _run_interactive(items: Sequence[AccountRole] | AccountTable, *, title: str = "Select Accounts") -> SelectionResult:
     """Launch the TUI and return the result."""
     from aws_pick.tui.app import CredentialSelectorApp
 
@@ -92,46 +198,116 @@ def _run_interactive(items: list[AccountRole], *, title: str = "Select Accounts"
     return app.result
 
 
+async def _arun_interactive(items: Sequence[AccountRole] | AccountTable, *, title: str) -> SelectionResult:
+    """Run the TUI inside the caller's event loop and return the result."""
+    from aws_pick.tui.app import CredentialSelectorApp
+
+    app = CredentialSelectorApp(items, title=title)
+    await app.run_async()
+    return app.result
+
+
 def _run_non_interactive(
-    items: list[AccountRole],
+    items: Sequence[AccountRole] | AccountTable,
     selections: list[str],
 ) -> SelectionResult:
-    """Select items by account_id:role_name strings without launching TUI."""
-    lookup = {f"{item.account.account_id}:{item.role.role_name}": item for item in items}
-    selected: list[dict[str, Any]] = []
-    for sel in selections:
-        if sel not in lookup:
-            raise InvalidSelectionError(f"Selection '{sel}' not found in available accounts")
-        selected.append(lookup[sel].to_dict())
-    return SelectionResult(selected=selected)
-
-
-def _run_login(
-    selected: list[dict[str, Any]],
-    on_login: Callable[[dict[str, Any]], LoginResult],
-) -> BatchLoginResult:
-    """Run the login callback for each selected item."""
-    results: list[ItemLoginResult] = []
-    for item in selected:
-        try:
-            lr = on_login(item)
-            results.append(
-                ItemLoginResult(
-                    account_id=item["account_id"],
-                    account_name=item["account_name"],
-                    role_name=item["role_name"],
-                    success=lr.success,
-                    error=lr.error,
-                )
-            )
-        except Exception as exc:
-            results.append(
-                ItemLoginResult(
-                    account_id=item["account_id"],
-                    account_name=item["account_name"],
-                    role_name=item["role_name"],
-                    success=False,
-                    error=str(exc),
-                )
+    """Select items by selection specs without launching TUI.
+
+    Specs are exact "account_id:role_name" strings or the glob, regex and env=
+    forms described by SelectionSpec.
+    """
+    if isinstance(items, AccountTable):
+        return _run_non_interactive_table(items, selections)
+    inventory = items if isinstance(items, Inventory) else Inventory(items)
+    return SelectionResult.from_items(inventory.select(selections))
+
+
+def _all_exact(selections: list[str]) -> bool:
+    return all(spec.exact for spec in compile_specs(selections))
+
+
+def _run_non_interactive_stream(
+    accounts: Iterable[dict[str, Any]],
+    selections: list[str],
+    *,
+    validate: ValidationMode = "full",
+) -> SelectionResult:
+    """Resolve exact selections while streaming raw account dicts.
+
+    Only rows whose key was requested are validated and converted, and reading
+    stops as soon as every requested key has been found, so for a handful of
+    selections the rest of the inventory is never validated or materialised.
+    The first row for each key wins, as with ``deduplicate``.
+    """
+    _check_validation_mode(validate)
+    wanted = {_selection_key(sel) for sel in selections}
+    found: dict[tuple[str, str], AccountRole] = {}
+    pool = AccountPool(validate=validate != "trusted")
+    empty = True
+    for i, acct in enumerate(accounts):
+        empty = False
+        if not isinstance(acct, dict):
+            raise InvalidAccountError(f"accounts[{i}] must be a dict, got {type(acct).__name__}")
+        for field in ("account_id", "role_name"):
+            if field not in acct:
+                raise InvalidAccountError(f"accounts[{i}] missing required field '{field}'")
+        key = (str(acct["account_id"]), str(acct["role_name"]))
+        if key not in wanted or key in found:
+            continue
+        if "account_name" not in acct:
+            raise InvalidAccountError(f"accounts[{i}] missing required field 'account_name'")
+        found[key] = pool.account_role(key[0], str(acct["account_name"]), key[1], acct.get("environment"))
+        if len(found) == len(wanted):
+            break
+    if empty:
+        return SelectionResult()
+    missing = [sel for sel in dict.fromkeys(selections) if _selection_key(sel) not in found]
+    if missing:
+        raise InvalidSelectionError(_missing_message(missing))
+    return SelectionResult.from_items([found[_selection_key(sel)] for sel in selections])
+
+
+def _selection_key(selection: str) -> tuple[str, str]:
+    account_id, _, role_name = selection.partition(":")
+    return account_id, role_name
+
+
+def _run_non_interactive_table(table: AccountTable, selections: list[str]) -> SelectionResult:
+    """Resolve selections through the table's key index, materialising only the selected rows."""
+    specs = compile_specs(selections)
+    if not all(spec.exact for spec in specs):
+        return SelectionResult.from_items(table.rows(_match_table(table, specs)))
+    found: dict[str, int] = {}
+    missing: list[str] = []
+    for sel in dict.fromkeys(selections):
+        account_id, _, role_name = sel.partition(":")
+        index = table.find(account_id, role_name)
+        if index is None:
+            missing.append(sel)
+        else:
+            found[sel] = index
+    if missing:
+        raise InvalidSelectionError(_missing_message(missing))
+    return SelectionResult.from_items([table.row(found[sel]) for sel in selections])
+
+
+def _match_table(table: AccountTable, specs: list[SelectionSpec]) -> list[int]:
+    """Match pattern specs against the table's columns, in spec order without duplicates."""
+    matched: dict[int, None] = {}
+    missing: dict[str, None] = {}
+    for spec in specs:
+        if spec.key is not None:
+            index = table.find(*spec.key)
+            indices: Sequence[int] = [] if index is None else [index]
+        else:
+            has_account = spec.account is not None or spec.environment is not None
+            indices = table.match(
+                spec.matches_account if has_account else None,
+                spec.matches_role if spec.role is not None else None,
             )
-    return BatchLoginResult(results=results)
+        if not indices:
+            missing[spec.text] = None
+        matched.update(dict.fromkeys(indices))
+    if missing:
+        raise InvalidSelectionError(_missing_message(list(missing)))
+    return list(matched)
@@ -0,0 +1,138 @@
+"""Selection specs for non-interactive mode: exact keys, globs, regexes and environments."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from fnmatch import translate
+
+from aws_pick.core.environment import classify
+from aws_pick.exceptions import InvalidSelectionError
+from aws_pick.models.account import AwsAccount
+
+_GLOB_CHARS = frozenset("*?[")
+_REGEX_PREFIX = "re:"
+_ENV_PREFIX = "env="
+# Group openings whose ':' belongs to the regex: "(?:" and inline-flag groups such as "(?i:".
+_REGEX_GROUP_PREFIX = re.compile(r"\(\?[aiLmsux-]*:")
+
+
+@dataclass(frozen=True, slots=True)
+class SelectionSpec:
+    """A compiled selection spec.
+
+    Supported forms, each split into an account part and a role part on the
+    first ':':
+
+    - ``111111111111:Admin`` - exact account id and role name (unchanged).
+    - ``prod-*:Admin*`` - globs; the account part matches the account id or
+      the account name case-insensitively, the role part matches role names.
+      A bare ``*`` matches everything.
+    - ``re:^data-.*:.*Engineer$`` - regular expressions, searched in the account
+      id or name and in the role name. Here the separator is the first ':' that
+      is not escaped (``\\:``), inside a character class or part of a group
+      opening such as ``(?:``, so ``re:^(?:data|ml)-.*:Admin`` works.
+    - ``env=staging:Deployer`` - classified environment, with an optional role glob.
+    """
+
+    text: str
+    key: tuple[str, str] | None = None
+    environment: str | None = None
+    account: re.Pattern[str] | None = None
+    role: re.Pattern[str] | None = None
+
+    @property
+    def exact(self) -> bool:
+        return self.key is not None
+
+    def matches_account(self, account: AwsAccount) -> bool:
+        """Check the environment and account parts of a pattern spec."""
+        if self.environment is not None:
+            pattern = classify(account)
+            if pattern is None or pattern.environment.lower() != self.environment:
+                return False
+        if self.account is not None:
+            return bool(self.account.search(account.account_id) or self.account.search(account.account_name))
+        return True
+
+    def matches_role(self, role_name: str) -> bool:
+        """Check the role part of a pattern spec."""
+        return self.role is None or self.role.search(role_name) is not None
+
+
+def parse_spec(text: str) -> SelectionSpec:
+    """Compile one selection spec.
+
+    Raises InvalidSelectionError if a regular expression does not compile.
+    """
+    if text.startswith(_REGEX_PREFIX):
+        account, role = _split_regex(text[len(_REGEX_PREFIX) :])
+        return SelectionSpec(text, account=_regex(text, account), role=_regex(text, role))
+    if text.startswith(_ENV_PREFIX):
+        environment, _, role = text[len(_ENV_PREFIX) :].partition(":")
+        return SelectionSpec(text, environment=environment.strip().lower(), role=_glob(role))
+    if _GLOB_CHARS.isdisjoint(text):
+        account_id, _, role_name = text.partition(":")
+        return SelectionSpec(text, key=(account_id, role_name))
+    account, _, role = text.partition(":")
+    return SelectionSpec(text, account=_glob(account, re.IGNORECASE), role=_glob(role))
+
+
+def compile_specs(texts: Iterable[str]) -> list[SelectionSpec]:
+    """Compile selection specs once, keeping their order."""
+    return [parse_spec(text) for text in texts]
+
+
+def _glob(pattern: str, flags: int = 0) -> re.Pattern[str] | None:
+    if pattern in ("", "*"):
+        return None
+    return re.compile(r"\A" + translate(pattern), flags)
+
+
+def _split_regex(body: str) -> tuple[str, str]:
+    """Split a regex spec body into account and role patterns at its separator ':'."""
+    i = 0
+    while i < len(body):
+        ch = body[i]
+        if ch == "\\":
+            i += 2
+            continue
+        if ch == "[":
+            i = _class_end(body, i)
+            continue
+        if ch == "(":
+            group = _REGEX_GROUP_PREFIX.match(body, i)
+            if group is not None:
+                i = group.end()
+                continue
+        if ch == ":":
+            return body[:i], body[i + 1 :]
+        i += 1
+    return body, ""
+
+
+def _class_end(body: str, start: int) -> int:
+    """Index just past the character class opened at start (or the end, if it is not closed)."""
+    i = start + 1
+    if body.startswith("^", i):
+        i += 1
+    if body.startswith("]", i):
+        i += 1
+    while i < len(body):
+        if body[i] == "\\":
+            i += 2
+        elif body[i] == "]":
+            return i + 1
+        else:
+            i += 1
+    return len(body)
+
+
+def _regex(spec: str, pattern: str) -> re.Pattern[str] | None:
+    if pattern == "":
+        return None
+    try:
+        return re.compile(pattern)
+    except re.error as exc:
+        raise InvalidSelectionError(f"Invalid selection pattern '{spec}': {exc}") from exc
@@ -9,6 +9,10 @@ class InvalidSelectionError(ValueError):
     """Raised when a non-interactive selection references an account/role not in the input list."""
 
 
+class InvalidSnapshotError(ValueError):
+    """Raised when a buffer or file is not a valid inventory snapshot."""
+
+
 class ConfigCorruptedError(Exception):
     """Raised when a configuration file is corrupted and cannot be parsed."""
 
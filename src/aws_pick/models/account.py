@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from typing import Any
 
 from aws_pick.exceptions import InvalidAccountError
@@ -11,7 +12,7 @@ from aws_pick.exceptions import InvalidAccountError
 _ACCOUNT_ID_PATTERN = re.compile(r"^\d{12}$")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AwsAccount:
     account_id: str
     account_name: str
@@ -29,6 +30,15 @@ class AwsAccount:
             d["environment"] = self.environment
         return d
 
+    @classmethod
+    def _unchecked(cls, account_id: str, account_name: str, environment: str | None = None) -> AwsAccount:
+        """Build an instance without __post_init__ validation; the caller guarantees validity."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "account_id", account_id)
+        object.__setattr__(obj, "account_name", account_name)
+        object.__setattr__(obj, "environment", environment)
+        return obj
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AwsAccount:
         return cls(
@@ -38,7 +48,7 @@ class AwsAccount:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AwsRole:
     role_name: str
 
@@ -49,27 +59,91 @@ class AwsRole:
     def to_dict(self) -> dict[str, str]:
         return {"role_name": self.role_name}
 
+    @classmethod
+    def _unchecked(cls, role_name: str) -> AwsRole:
+        """Build an instance without __post_init__ validation; the caller guarantees validity."""
+        obj = object.__new__(cls)
+        object.__setattr__(obj, "role_name", role_name)
+        return obj
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AwsRole:
         return cls(role_name=str(data["role_name"]))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AccountRole:
+    """An account/role pair.
+
+    Rows hold only their (usually pooled) account and role plus three lazily
+    filled slots, so large inventories stay compact: an unused row costs one
+    pointer per slot, and only rows that are hashed, rendered or selected pay
+    for the values. ``key`` (and the hash, which is derived from it) is built
+    on first use and kept, so repeated set lookups do not allocate. The display
+    string ``option_id`` ("account_id:role_name") and ``sort_key``
+    ((account_name, role_name)) are cached the same way.
+    """
+
     account: AwsAccount
     role: AwsRole
+    _key: tuple[str, str] | None = field(init=False, repr=False, compare=False, default=None)
+    _option_id: str | None = field(init=False, repr=False, compare=False, default=None)
+    _sort_key: tuple[str, str] | None = field(init=False, repr=False, compare=False, default=None)
 
     @property
     def key(self) -> tuple[str, str]:
-        return (self.account.account_id, self.role.role_name)
+        """The (account_id, role_name) pair identifying this item in selection sets."""
+        value = self._key
+        if value is None:
+            value = (self.account.account_id, self.role.role_name)
+            object.__setattr__(self, "_key", value)
+        return value
+
+    def __hash__(self) -> int:
+        # Equal items have equal keys, so hashing the key alone is consistent with __eq__.
+        return hash(self.key)
+
+    def __reduce__(self) -> tuple[type[AccountRole], tuple[AwsAccount, AwsRole]]:
+        # Rebuild from the two fields: compact pickles, and the lazy display slots start empty.
+        return AccountRole, (self.account, self.role)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, AccountRole):
+            return NotImplemented
+        return (self.account is other.account or self.account == other.account) and (
+            self.role is other.role or self.role == other.role
+        )
+
+    @property
+    def option_id(self) -> str:
+        """The "account_id:role_name" string identifying this pair."""
+        value = self._option_id
+        if value is None:
+            value = f"{self.account.account_id}:{self.role.role_name}"
+            object.__setattr__(self, "_option_id", value)
+        return value
+
+    @property
+    def sort_key(self) -> tuple[str, str]:
+        """The (account_name, role_name) ordering used by list views, matching ``AccountTable.sort``."""
+        value = self._sort_key
+        if value is None:
+            value = (self.account.account_name, self.role.role_name)
+            object.__setattr__(self, "_sort_key", value)
+        return value
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "account_id": self.account.account_id,
-            "account_name": self.account.account_name,
+        account = self.account
+        d: dict[str, Any] = {
+            "account_id": account.account_id,
+            "account_name": account.account_name,
             "role_name": self.role.role_name,
-            **({"environment": self.account.environment} if self.account.environment else {}),
         }
+        if account.environment:
+            d["environment"] = account.environment
+        return d
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> AccountRole:
@@ -83,12 +157,73 @@ class AccountRole:
         )
 
 
-def deduplicate(items: list[AccountRole]) -> list[AccountRole]:
-    """Remove duplicate AccountRole items by (account_id, role_name) key."""
+@dataclass
+class DedupeReport:
+    """Summary of what a deduplication pass dropped or found inconsistent.
+
+    ``duplicates`` maps each repeated (account_id, role_name) key to the number
+    of extra occurrences that were dropped. ``conflicts`` maps an account_id to
+    every distinct account_name seen for it, in first-seen order, whenever more
+    than one name was seen.
+    """
+
+    duplicates: dict[tuple[str, str], int] = field(default_factory=dict)
+    conflicts: dict[str, list[str]] = field(default_factory=dict)
+    _names: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(self.duplicates.values())
+
+    @property
+    def clean(self) -> bool:
+        return not self.duplicates and not self.conflicts
+
+    def _observe_name(self, account_id: str, account_name: str) -> None:
+        first = self._names.setdefault(account_id, account_name)
+        if first != account_name:
+            names = self.conflicts.setdefault(account_id, [first])
+            if account_name not in names:
+                names.append(account_name)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duplicates": [
+                {"account_id": account_id, "role_name": role_name, "dropped": count}
+                for (account_id, role_name), count in self.duplicates.items()
+            ],
+            "conflicts": {account_id: list(names) for account_id, names in self.conflicts.items()},
+        }
+
+
+def iter_deduplicate(items: Iterable[AccountRole], report: DedupeReport | None = None) -> Iterator[AccountRole]:
+    """Lazily drop AccountRole items whose (account_id, role_name) key was already seen.
+
+    Items are yielded as they arrive, so rows can stream in from a parser (or
+    several chained sources) without materialising the input. Overhead is one
+    set of keys; passing a DedupeReport additionally records dropped duplicates
+    and account_ids that appear under more than one account_name.
+    """
     seen: set[tuple[str, str]] = set()
-    result: list[AccountRole] = []
+    add = seen.add
+    if report is None:
+        for item in items:
+            key = item.key
+            if key not in seen:
+                add(key)
+                yield item
+        return
+    duplicates = report.duplicates
     for item in items:
-        if item.key not in seen:
-            seen.add(item.key)
-            result.append(item)
-    return result
+        key = item.key
+        report._observe_name(key[0], item.account.account_name)
+        if key in seen:
+            duplicates[key] = duplicates.get(key, 0) + 1
+        else:
+            add(key)
+            yield item
+
+
+def deduplicate(items: Iterable[AccountRole], report: DedupeReport | None = None) -> list[AccountRole]:
+    """Remove duplicate AccountRole items by (account_id, role_name) key."""
+    return list(iter_deduplicate(items, report))
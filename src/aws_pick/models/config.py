@@ -42,16 +42,22 @@ class HistoryEntry:
     account_id: str
     role_name: str
     last_used: str
+    login_seconds: float | None = None
 
-    def to_dict(self) -> dict[str, str]:
-        return {"account_id": self.account_id, "role_name": self.role_name, "last_used": self.last_used}
+    def to_dict(self) -> dict[str, Any]:
+        d: dict[str, Any] = {"account_id": self.account_id, "role_name": self.role_name, "last_used": self.last_used}
+        if self.login_seconds is not None:
+            d["login_seconds"] = self.login_seconds
+        return d
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> HistoryEntry:
+        login_seconds = data.get("login_seconds")
         return cls(
             account_id=str(data["account_id"]),
             role_name=str(data["role_name"]),
             last_used=str(data["last_used"]),
+            login_seconds=float(login_seconds) if login_seconds is not None else None,
         )
 
 
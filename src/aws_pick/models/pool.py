@@ -0,0 +1,151 @@
+"""Flyweight pool and symbol table for sharing strings and models within one inventory."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
+
+
+class SymbolTable:
+    """Per-inventory dictionary encoding of strings.
+
+    Each distinct value is stored once and assigned a dense integer code in
+    insertion order. Interned values are the canonical instances, so keys built
+    from them compare by identity before falling back to character comparison.
+    """
+
+    __slots__ = ("_codes", "_values", "_folded")
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self._values: list[str] = []
+        self._folded: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._codes
+
+    def intern(self, value: str) -> str:
+        """Return the canonical instance of value, adding it if unseen."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return self._values[code]
+
+    def code(self, value: str) -> int:
+        """Return the integer code for value, adding it if unseen."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def value(self, code: int) -> str:
+        return self._values[code]
+
+    @property
+    def values(self) -> list[str]:
+        """All interned values, indexed by code. Treat as read-only."""
+        return self._values
+
+    def folded(self, value: str) -> str:
+        """Return the lower-cased form of value, computed once per distinct string."""
+        folded = self._folded.get(value)
+        if folded is None:
+            folded = self.intern(value.lower())
+            self._folded[value] = folded
+        return folded
+
+
+class AccountPool:
+    """Allocates each distinct AwsAccount and AwsRole once per inventory.
+
+    Org exports repeat the same account on every one of its role rows and the
+    same handful of role names across thousands of accounts. Routing construction
+    through a pool makes those rows share a single instance instead of carrying
+    their own copies.
+
+    With ``validate=False`` instances skip their per-row field checks; use it
+    only for input that has already been validated in bulk or is trusted.
+    """
+
+    __slots__ = ("_accounts", "_roles", "_symbols", "_validate")
+
+    def __init__(self, symbols: SymbolTable | None = None, *, validate: bool = True) -> None:
+        self._accounts: dict[tuple[str, str, str | None], AwsAccount] = {}
+        self._roles: dict[str, AwsRole] = {}
+        self._symbols = symbols if symbols is not None else SymbolTable()
+        self._validate = validate
+
+    def __len__(self) -> int:
+        return len(self._accounts) + len(self._roles)
+
+    @property
+    def account_count(self) -> int:
+        return len(self._accounts)
+
+    @property
+    def role_count(self) -> int:
+        return len(self._roles)
+
+    @property
+    def symbols(self) -> SymbolTable:
+        """The symbol table every account id, name, role and environment is interned through."""
+        return self._symbols
+
+    def account(self, account_id: str, account_name: str, environment: str | None = None) -> AwsAccount:
+        acct = self._accounts.get((account_id, account_name, environment))
+        if acct is None:
+            intern = self._symbols.intern
+            account_id = intern(account_id)
+            account_name = intern(account_name)
+            if environment is not None:
+                environment = intern(environment)
+            if self._validate:
+                acct = AwsAccount(account_id=account_id, account_name=account_name, environment=environment)
+            else:
+                acct = AwsAccount._unchecked(account_id, account_name, environment)
+            self._accounts[(account_id, account_name, environment)] = acct
+        return acct
+
+    def role(self, role_name: str) -> AwsRole:
+        role = self._roles.get(role_name)
+        if role is None:
+            role_name = self._symbols.intern(role_name)
+            role = AwsRole(role_name=role_name) if self._validate else AwsRole._unchecked(role_name)
+            self._roles[role_name] = role
+        return role
+
+    def account_role(
+        self,
+        account_id: str,
+        account_name: str,
+        role_name: str,
+        environment: str | None = None,
+    ) -> AccountRole:
+        return AccountRole(account=self.account(account_id, account_name, environment), role=self.role(role_name))
+
+    def account_roles(
+        self,
+        account_ids: Sequence[str],
+        account_names: Sequence[str],
+        role_names: Sequence[str],
+        environments: Sequence[str | None],
+    ) -> list[AccountRole]:
+        """Build one AccountRole per row from parallel columns.
+
+        Equivalent to calling ``account_role`` per row, but only distinct unseen
+        accounts and roles go through the per-instance path; every row is then
+        resolved with C-level dict lookups over whole columns.
+        """
+        keys = list(zip(account_ids, account_names, environments))
+        account, role = self.account, self.role
+        accounts = {key: account(*key) for key in dict.fromkeys(keys)}
+        roles = {role_name: role(role_name) for role_name in dict.fromkeys(role_names)}
+        return list(map(AccountRole, map(accounts.__getitem__, keys), map(roles.__getitem__, role_names)))
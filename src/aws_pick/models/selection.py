@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
+from aws_pick.models.account import AccountRole
+
 
 @dataclass
 class LoginResult:
     success: bool
     error: str | None = None
+    throttled: bool = False
+    retryable: bool = False
+    expires_at: datetime | None = None
+    payload: Any = field(default=None, repr=False)
+
+    def __reduce__(self) -> tuple[type[LoginResult], tuple[Any, ...]]:
+        # Positional fields instead of a __dict__ copy: results cross process boundaries per login.
+        return LoginResult, (self.success, self.error, self.throttled, self.retryable, self.expires_at, self.payload)
 
 
 @dataclass
@@ -19,6 +31,13 @@ class ItemLoginResult:
     role_name: str
     success: bool
     error: str | None = None
+    throttled: bool = False
+    attempts: int = 1
+    cached: bool = False
+    timed_out: bool = False
+    elapsed: float = 0.0
+    expires_at: datetime | None = None
+    payload: Any = field(default=None, repr=False)
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
@@ -29,6 +48,16 @@ class ItemLoginResult:
         }
         if self.error is not None:
             d["error"] = self.error
+        if self.throttled:
+            d["throttled"] = True
+        if self.attempts > 1:
+            d["attempts"] = self.attempts
+        if self.cached:
+            d["cached"] = True
+        if self.timed_out:
+            d["timed_out"] = True
+        if self.expires_at is not None:
+            d["expires_at"] = self.expires_at.isoformat()
         return d
 
 
@@ -57,11 +86,73 @@ class BatchLoginResult:
         }
 
 
-@dataclass
 class SelectionResult:
-    selected: list[dict[str, Any]] = field(default_factory=list)
-    cancelled: bool = False
-    login_results: BatchLoginResult | None = None
+    """Outcome of a selection: the chosen account/role dicts plus optional login results.
+
+    ``selected`` is a plain ``list[dict]``. A result built with ``from_items``
+    keeps the AccountRole items and only builds the dicts the first time
+    ``selected`` is read, so passing ``selected_items`` straight to a login
+    batch never allocates them.
+    """
+
+    def __init__(
+        self,
+        selected: list[dict[str, Any]] | None = None,
+        cancelled: bool = False,
+        login_results: BatchLoginResult | None = None,
+    ) -> None:
+        self._selected: list[dict[str, Any]] | None = [] if selected is None else selected
+        self.cancelled = cancelled
+        self.login_results = login_results
+        self._items: Sequence[AccountRole] | None = None
+
+    @classmethod
+    def from_items(cls, items: Sequence[AccountRole], **kwargs: Any) -> SelectionResult:
+        """Build a result for items, keeping them for ``selected_items``."""
+        result = cls(**kwargs)
+        result._selected = None
+        result._items = items
+        return result
+
+    @property
+    def selected(self) -> list[dict[str, Any]]:
+        """Selected account/role dicts, built from the items on first access."""
+        if self._selected is None:
+            self._selected = [item.to_dict() for item in self._items or ()]
+        return self._selected
+
+    @selected.setter
+    def selected(self, value: list[dict[str, Any]]) -> None:
+        self._selected = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SelectionResult):
+            return NotImplemented
+        return (self.selected, self.cancelled, self.login_results) == (
+            other.selected,
+            other.cancelled,
+            other.login_results,
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"SelectionResult(selected={self.selected!r}, cancelled={self.cancelled!r}, "
+            f"login_results={self.login_results!r})"
+        )
+
+    @property
+    def selected_items(self) -> Sequence[AccountRole]:
+        """Selected items as AccountRole objects.
+
+        For a result built with from_items these are the original items, so
+        nothing is parsed back from ``selected``; later edits to ``selected``
+        are not reflected in them.
+        """
+        if self._items is not None:
+            return self._items
+        return [AccountRole.from_dict(d) for d in self.selected]
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {
@@ -72,3 +163,21 @@ class SelectionResult:
         if self.login_results is not None:
             d["login_results"] = self.login_results.to_dict()
         return d
+
+
+@dataclass
+class PresetResolution:
+    """Outcome of resolving one or more presets against a single inventory.
+
+    ``resolved`` maps each preset name to the items found, in preset order.
+    ``missing`` lists every unresolved (account_id, role_name) key once, in
+    first-seen order; ``missing_by_preset`` breaks the same keys down per preset.
+    """
+
+    resolved: dict[str, list[AccountRole]] = field(default_factory=dict)
+    missing: list[tuple[str, str]] = field(default_factory=list)
+    missing_by_preset: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
@@ -0,0 +1,311 @@
+"""Read-only binary snapshots of a validated inventory for sharing between processes."""
+
+from __future__ import annotations
+
+import mmap
+import multiprocessing
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, overload
+
+from aws_pick.exceptions import InvalidSnapshotError
+from aws_pick.models.account import AccountRole
+from aws_pick.models.pool import AccountPool
+from aws_pick.models.table import _ROLE_BITS, AccountTable
+
+_MAGIC = b"AWSPICK" + sys.byteorder[0].encode()
+_VERSION = 1
+# magic, version, rows, distinct names, distinct roles, distinct environments
+_HEADER = struct.Struct("=8sIIIII")
+_ALIGN = 8
+# Shared memory blocks created (and so tracked for cleanup) by this process.
+_created: set[str] = set()
+
+
+class InventorySnapshot(Sequence[AccountRole]):
+    """A validated inventory laid out as flat columns in one buffer.
+
+    ``dump`` serialises an AccountTable (or any AccountRole items) into a compact
+    byte string: account ids, name/role/environment codes, a sorted key column
+    for lookups, and the distinct strings. A snapshot is opened over any buffer
+    (bytes, an mmap'd file via ``open``, or shared memory via ``attach``) and
+    reads straight from it: rows are decoded on access and nothing is copied or
+    re-validated, so forked workers share one physical copy of the inventory.
+
+    Columns use the host's native byte order; snapshots are meant for sharing
+    between processes on one machine, not as a portable file format.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_owner",
+        "_views",
+        "_ids",
+        "_keys",
+        "_order",
+        "_names",
+        "_roles",
+        "_envs",
+        "_strings",
+        "_decoded",
+        "_role_codes",
+        "_pool",
+    )
+
+    def __init__(self, buffer: Any, owner: Any = None) -> None:
+        self._buffer = buffer
+        self._owner = owner
+        self._views: list[memoryview] = []
+        base = memoryview(buffer).cast("B")
+        self._views.append(base)
+        if len(base) < _HEADER.size:
+            raise InvalidSnapshotError("Buffer is too small to be an inventory snapshot")
+        magic, version, rows, *counts = _HEADER.unpack_from(base)
+        if magic[:7] != _MAGIC[:7]:
+            raise InvalidSnapshotError("Buffer is not an aws-pick inventory snapshot")
+        if magic != _MAGIC:
+            raise InvalidSnapshotError("Snapshot was written on a host with a different byte order")
+        if version != _VERSION:
+            raise InvalidSnapshotError(f"Unsupported snapshot version {version}")
+        offset = _aligned(_HEADER.size)
+        try:
+            self._ids, offset = self._column(base, offset, "Q", rows)
+            self._keys, offset = self._column(base, offset, "Q", rows)
+            self._order, offset = self._column(base, offset, "I", rows)
+            self._names, offset = self._column(base, offset, "I", rows)
+            self._roles, offset = self._column(base, offset, "I", rows)
+            self._envs, offset = self._column(base, offset, "I", rows)
+            starts = []
+            for count in counts:
+                column, offset = self._column(base, offset, "I", count + 1)
+                starts.append(column)
+            strings = []
+            for column in starts:
+                size = column[-1]
+                if offset + size > len(base):
+                    raise InvalidSnapshotError("Snapshot is truncated")
+                blob = base[offset : offset + size]
+                self._views.append(blob)
+                strings.append((column, blob))
+                offset = _aligned(offset + size)
+        except InvalidSnapshotError:
+            self.close()
+            raise
+        self._strings = strings
+        self._decoded: list[list[str | None]] = [[None] * count for count in counts]
+        self._role_codes: dict[str, int] | None = None
+        self._pool = AccountPool(validate=False)
+
+    def _column(self, base: memoryview, offset: int, fmt: Literal["I", "Q"], count: int) -> tuple[memoryview, int]:
+        size = struct.calcsize(fmt) * count
+        if offset + size > len(base):
+            raise InvalidSnapshotError("Snapshot is truncated")
+        view = base[offset : offset + size].cast(fmt)
+        self._views.append(view)
+        return view, _aligned(offset + size)
+
+    # --- Writing ---
+
+    @staticmethod
+    def dump(source: AccountTable | Iterable[AccountRole]) -> bytes:
+        """Serialise validated items (or a whole AccountTable) to snapshot bytes."""
+        table = source if isinstance(source, AccountTable) else AccountTable.from_items(source)
+        ids, names, roles, envs = table._ids, table._names, table._roles, table._envs
+        keys = array("Q", ((account_id << _ROLE_BITS) | role for account_id, role in zip(ids, roles)))
+        order = array("I", sorted(range(len(keys)), key=keys.__getitem__))
+        sorted_keys = array("Q", map(keys.__getitem__, order))
+        symbols = (table._name_table.values, table._role_table.values, table._env_table.values)
+        encoded = [[value.encode("utf-8") for value in values] for values in symbols]
+        parts: list[bytes] = [_HEADER.pack(_MAGIC, _VERSION, len(ids), *(len(values) for values in symbols))]
+        for column in (ids, sorted_keys, order, names, roles, envs):
+            parts.append(column.tobytes())
+        for blobs in encoded:
+            starts = array("I", [0])
+            for blob in blobs:
+                starts.append(starts[-1] + len(blob))
+            parts.append(starts.tobytes())
+        parts.extend(b"".join(blobs) for blobs in encoded)
+        out = bytearray()
+        for part in parts:
+            out += part
+            out += bytes(_aligned(len(out)) - len(out))
+        return bytes(out)
+
+    @classmethod
+    def save(cls, source: AccountTable | Iterable[AccountRole], path: str | Path) -> None:
+        """Write a snapshot file atomically."""
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_bytes(cls.dump(source))
+        os.replace(str(tmp_path), str(path))
+
+    @classmethod
+    def create_shared(cls, source: AccountTable | Iterable[AccountRole], name: str | None = None) -> InventorySnapshot:
+        """Copy a snapshot into a new shared memory block owned by the caller.
+
+        Workers open it with ``attach(snapshot.shared_name)``. The creator must
+        call ``unlink`` once every worker is done.
+        """
+        data = cls.dump(source)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(len(data), 1))
+        _created.add(shm.name)
+        buffer = shm.buf
+        assert buffer is not None
+        buffer[: len(data)] = data
+        return cls(buffer, owner=shm)
+
+    # --- Opening ---
+
+    @classmethod
+    def open(cls, path: str | Path) -> InventorySnapshot:
+        """Map a snapshot file read-only."""
+        with open(path, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mapped, owner=mapped)
+
+    @classmethod
+    def attach(cls, name: str) -> InventorySnapshot:
+        """Attach to a snapshot created by ``create_shared`` in another process."""
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if multiprocessing.parent_process() is None and name not in _created:
+                # Only the creator should unlink the block; stop this process's own
+                # resource tracker from removing it on exit. Children started by
+                # multiprocessing share the creator's tracker and must leave it be.
+                resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(shm.buf, owner=shm)
+
+    @property
+    def shared_name(self) -> str | None:
+        """Name of the shared memory block backing this snapshot, if any."""
+        return self._owner.name if isinstance(self._owner, shared_memory.SharedMemory) else None
+
+    def close(self) -> None:
+        """Release the views and the underlying mapping or shared memory handle."""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block (creator only, after workers are done)."""
+        owner = self._owner
+        self.close()
+        if isinstance(owner, shared_memory.SharedMemory):
+            owner.unlink()
+            _created.discard(owner.name)
+
+    def __enter__(self) -> InventorySnapshot:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, tb: TracebackType | None
+    ) -> None:
+        self.close()
+
+    # --- Access ---
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @overload
+    def __getitem__(self, index: int) -> AccountRole: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[AccountRole]: ...
+
+    def __getitem__(self, index: int | slice) -> AccountRole | list[AccountRole]:
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("snapshot index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[AccountRole]:
+        return (self.row(i) for i in range(len(self)))
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, AccountRole):
+            return False
+        index = self.find(item.account.account_id, item.role.role_name)
+        return index is not None and self.row(index) == item
+
+    def account_id(self, index: int) -> str:
+        return f"{self._ids[index]:012d}"
+
+    def account_name(self, index: int) -> str:
+        return self._string(0, self._names[index])
+
+    def role_name(self, index: int) -> str:
+        return self._string(1, self._roles[index])
+
+    def environment(self, index: int) -> str | None:
+        code = self._envs[index]
+        return None if code == 0 else self._string(2, code - 1)
+
+    def row(self, index: int) -> AccountRole:
+        """Decode a single row as an AccountRole."""
+        return self._pool.account_role(
+            self.account_id(index),
+            self.account_name(index),
+            self.role_name(index),
+            self.environment(index),
+        )
+
+    def find(self, account_id: str, role_name: str) -> int | None:
+        """Return the row index for (account_id, role_name) by binary search over the key column."""
+        if self._role_codes is None:
+            self._role_codes = {self._string(1, code): code for code in range(len(self._decoded[1]))}
+        role_code = self._role_codes.get(role_name)
+        if role_code is None or len(account_id) != 12 or not account_id.isdecimal():
+            return None
+        packed = (int(account_id) << _ROLE_BITS) | role_code
+        position = bisect_left(self._keys, packed)
+        if position < len(self._keys) and self._keys[position] == packed:
+            return int(self._order[position])
+        return None
+
+    def get(self, account_id: str, role_name: str) -> AccountRole | None:
+        index = self.find(account_id, role_name)
+        return None if index is None else self.row(index)
+
+    def to_table(self) -> AccountTable:
+        """Copy the columns into a private AccountTable, e.g. to filter, sort or run the TUI."""
+        names, roles, envs = (
+            [self._string(column, code) for code in range(len(codes))] for column, codes in enumerate(self._decoded)
+        )
+        ids, name_codes, role_codes, env_codes = columns = [
+            column.cast("B") for column in (self._ids, self._names, self._roles, self._envs)
+        ]
+        try:
+            return AccountTable._from_columns(
+                ids, name_codes, role_codes, env_codes, (names, roles, envs), dict(zip(self._keys, self._order))
+            )
+        finally:
+            for column in columns:
+                column.release()
+
+    def _string(self, column: int, code: int) -> str:
+        decoded = self._decoded[column]
+        value = decoded[code]
+        if value is None:
+            starts, blob = self._strings[column]
+            value = decoded[code] = str(blob[starts[code] : starts[code + 1]], "utf-8")
+        return value
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
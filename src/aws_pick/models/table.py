@@ -0,0 +1,277 @@
+"""Columnar account/role table for very large inventories."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import compress
+from operator import and_, or_
+from typing import Any, Literal
+
+from aws_pick.exceptions import InvalidAccountError
+from aws_pick.models.account import AccountRole, AwsAccount
+from aws_pick.models.pool import AccountPool, SymbolTable
+
+SortOrder = Literal["name", "role", "account_id"]
+GroupBy = Literal["account", "role"]
+
+# Rows are keyed by account_id (< 10**12 < 2**40) and role code packed into one integer.
+_ROLE_BITS = 24
+_MAX_ROLES = 1 << _ROLE_BITS
+
+
+class AccountTable:
+    """Column-oriented store of account/role rows.
+
+    Account ids live in an ``array('Q')``; account names, role names and explicit
+    environments are integer codes into per-column symbol tables. Filtering,
+    sorting and grouping work on those columns and return arrays of row indices,
+    so AccountRole objects are only built for rows that are actually displayed
+    or selected (see ``row`` and ``rows``).
+
+    Rows are unique by (account_id, role_name); ``append`` ignores duplicates,
+    keeping the first occurrence like ``deduplicate``.
+    """
+
+    __slots__ = ("_ids", "_names", "_roles", "_envs", "_name_table", "_role_table", "_env_table", "_index", "_pool")
+
+    def __init__(self) -> None:
+        self._ids = array("Q")
+        self._names = array("I")
+        self._roles = array("I")
+        self._envs = array("I")
+        self._name_table = SymbolTable()
+        self._role_table = SymbolTable()
+        self._env_table = SymbolTable()
+        self._index: dict[int, int] = {}
+        self._pool = AccountPool()
+
+    @classmethod
+    def from_dicts(cls, accounts: Iterable[dict[str, Any]]) -> AccountTable:
+        """Validate account/role dicts and load them into a new table."""
+        table = cls()
+        for i, acct in enumerate(accounts):
+            if not isinstance(acct, dict):
+                raise InvalidAccountError(f"accounts[{i}] must be a dict, got {type(acct).__name__}")
+            for field in ("account_id", "account_name", "role_name"):
+                if field not in acct:
+                    raise InvalidAccountError(f"accounts[{i}] missing required field '{field}'")
+            account_id = str(acct["account_id"])
+            if len(account_id) != 12 or not account_id.isdecimal():
+                raise InvalidAccountError(f"account_id must be 12 digits, got '{account_id}'")
+            account_name = str(acct["account_name"])
+            if not account_name.strip():
+                raise InvalidAccountError("account_name must not be empty")
+            role_name = str(acct["role_name"])
+            if not role_name.strip():
+                raise InvalidAccountError("role_name must not be empty")
+            table.append(account_id, account_name, role_name, acct.get("environment"))
+        return table
+
+    @classmethod
+    def _from_columns(
+        cls,
+        ids: bytes | memoryview,
+        names: bytes | memoryview,
+        roles: bytes | memoryview,
+        envs: bytes | memoryview,
+        symbols: tuple[Iterable[str], Iterable[str], Iterable[str]],
+        index: dict[int, int],
+    ) -> AccountTable:
+        """Build a table from the raw bytes of validated, duplicate-free columns without per-row work."""
+        table = cls()
+        table._ids.frombytes(ids)
+        table._names.frombytes(names)
+        table._roles.frombytes(roles)
+        table._envs.frombytes(envs)
+        for symbol_table, values in zip((table._name_table, table._role_table, table._env_table), symbols):
+            for value in values:
+                symbol_table.code(value)
+        table._index = index
+        return table
+
+    @classmethod
+    def from_items(cls, items: Iterable[AccountRole]) -> AccountTable:
+        """Load already-validated AccountRole items into a new table."""
+        table = cls()
+        for item in items:
+            account = item.account
+            table.append(account.account_id, account.account_name, item.role.role_name, account.environment)
+        return table
+
+    def append(self, account_id: str, account_name: str, role_name: str, environment: str | None = None) -> bool:
+        """Append a row; return False (and store nothing) if the key is already present."""
+        role_code = self._role_table.code(role_name)
+        if role_code >= _MAX_ROLES:
+            raise InvalidAccountError(f"AccountTable supports at most {_MAX_ROLES} distinct role names")
+        numeric_id = int(account_id)
+        packed = (numeric_id << _ROLE_BITS) | role_code
+        if packed in self._index:
+            return False
+        self._index[packed] = len(self._ids)
+        self._ids.append(numeric_id)
+        self._names.append(self._name_table.code(account_name))
+        self._roles.append(role_code)
+        self._envs.append(0 if environment is None else self._env_table.code(environment) + 1)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[AccountRole]:
+        return (self.row(i) for i in range(len(self._ids)))
+
+    @property
+    def account_names(self) -> list[str]:
+        """Distinct account names, indexed by name code."""
+        return self._name_table.values
+
+    @property
+    def role_names(self) -> list[str]:
+        """Distinct role names, indexed by role code."""
+        return self._role_table.values
+
+    # --- Row access ---
+
+    def account_id(self, index: int) -> str:
+        return f"{self._ids[index]:012d}"
+
+    def account_name(self, index: int) -> str:
+        return self._name_table.value(self._names[index])
+
+    def role_name(self, index: int) -> str:
+        return self._role_table.value(self._roles[index])
+
+    def environment(self, index: int) -> str | None:
+        return self._env(self._envs[index])
+
+    def _env(self, code: int) -> str | None:
+        return None if code == 0 else self._env_table.value(code - 1)
+
+    def row(self, index: int) -> AccountRole:
+        """Materialise a single row as an AccountRole."""
+        return self._pool.account_role(
+            self.account_id(index),
+            self.account_name(index),
+            self.role_name(index),
+            self.environment(index),
+        )
+
+    def rows(self, indices: Iterable[int] | None = None) -> list[AccountRole]:
+        """Materialise the given rows (all rows when indices is None), in the given order."""
+        if indices is None:
+            indices = range(len(self._ids))
+        return [self.row(i) for i in indices]
+
+    def find(self, account_id: str, role_name: str) -> int | None:
+        """Return the row index for (account_id, role_name), or None."""
+        if len(account_id) != 12 or not account_id.isdecimal() or role_name not in self._role_table:
+            return None
+        return self._index.get((int(account_id) << _ROLE_BITS) | self._role_table.code(role_name))
+
+    # --- Vectorised operations ---
+
+    def all_indices(self) -> array[int]:
+        return array("I", range(len(self._ids)))
+
+    def filter(self, text: str, indices: Iterable[int] | None = None) -> array[int]:
+        """Return indices of rows whose account name, account id or role name contains text.
+
+        Matching is case-insensitive. Each distinct name and role is tested once;
+        the per-row pass only looks up precomputed hit flags by code.
+        """
+        needle = text.strip().lower()
+        if indices is None:
+            indices = range(len(self._ids))
+        if not needle:
+            return array("I", indices)
+        name_hits = bytes(needle in name.lower() for name in self._name_table.values)
+        role_hits = bytes(needle in role.lower() for role in self._role_table.values)
+        names, roles, ids = self._names, self._roles, self._ids
+        candidates = indices if isinstance(indices, range) else list(indices)
+        flags = map(
+            or_,
+            map(name_hits.__getitem__, map(names.__getitem__, candidates)),
+            map(role_hits.__getitem__, map(roles.__getitem__, candidates)),
+        )
+        if needle.isdecimal():
+            id_hits = {account_id for account_id in set(ids) if needle in f"{account_id:012d}"}
+            flags = map(or_, flags, map(id_hits.__contains__, map(ids.__getitem__, candidates)))
+        return array("I", compress(candidates, flags))
+
+    def match(
+        self,
+        account: Callable[[AwsAccount], object] | None = None,
+        role: Callable[[str], object] | None = None,
+    ) -> array[int]:
+        """Return indices of rows whose account and role name satisfy the given predicates.
+
+        Each predicate runs once per distinct account (id, name, environment) or
+        role name; the per-row pass only looks up the results.
+        """
+        rows = range(len(self._ids))
+        flags: Iterable[object] | None = None
+        if role is not None:
+            role_hits = bytes(bool(role(name)) for name in self._role_table.values)
+            flags = map(role_hits.__getitem__, self._roles)
+        if account is not None:
+            account_hits = {
+                key
+                for key in set(zip(self._ids, self._names, self._envs))
+                if account(self._pool.account(f"{key[0]:012d}", self._name_table.value(key[1]), self._env(key[2])))
+            }
+            hits = map(account_hits.__contains__, zip(self._ids, self._names, self._envs))
+            flags = hits if flags is None else map(and_, flags, hits)
+        if flags is None:
+            return array("I", rows)
+        return array("I", compress(rows, flags))
+
+    def sort(self, indices: Iterable[int] | None = None, *, by: SortOrder = "name") -> array[int]:
+        """Return indices ordered by account name then role ("name"), role then account name
+        ("role"), or account id then role ("account_id")."""
+        if indices is None:
+            indices = range(len(self._ids))
+        role_rank = _rank(self._role_table.values)
+        width = len(role_rank) or 1
+        if by == "name":
+            name_rank = _rank(self._name_table.values)
+            names, roles = self._names, self._roles
+            return array("I", sorted(indices, key=lambda i: name_rank[names[i]] * width + role_rank[roles[i]]))
+        if by == "role":
+            name_rank = _rank(self._name_table.values)
+            names, roles = self._names, self._roles
+            name_width = len(name_rank) or 1
+            return array("I", sorted(indices, key=lambda i: role_rank[roles[i]] * name_width + name_rank[names[i]]))
+        if by == "account_id":
+            ids, roles = self._ids, self._roles
+            return array("I", sorted(indices, key=lambda i: (ids[i], role_rank[roles[i]])))
+        raise ValueError(f"Unknown sort order '{by}'")
+
+    def group(self, indices: Iterable[int] | None = None, *, by: GroupBy = "account") -> dict[str, array[int]]:
+        """Group rows by account name or role name.
+
+        Groups are returned in sorted key order; rows inside a group are sorted by
+        the other column.
+        """
+        if by == "account":
+            ordered, codes, table = self.sort(indices, by="name"), self._names, self._name_table
+        elif by == "role":
+            ordered, codes, table = self.sort(indices, by="role"), self._roles, self._role_table
+        else:
+            raise ValueError(f"Unknown grouping '{by}'")
+        groups: dict[str, array[int]] = {}
+        for i in ordered:
+            key = table.value(codes[i])
+            bucket = groups.get(key)
+            if bucket is None:
+                bucket = groups[key] = array("I")
+            bucket.append(i)
+        return groups
+
+
+def _rank(values: list[str]) -> array[int]:
+    """Map each code to the position of its value in sorted order."""
+    rank = array("I", [0]) * len(values)
+    for position, code in enumerate(sorted(range(len(values)), key=values.__getitem__)):
+        rank[code] = position
+    return rank
@@ -6,23 +6,55 @@ import json
 import logging
 import os
 import shutil
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 from platformdirs import user_config_dir
 
+from aws_pick.storage.locks import ReadWriteLock
+
 logger = logging.getLogger(__name__)
 
 _APP_NAME = "aws-pick"
 
+_Stamp = tuple[int, int, int]
+
+_shared_lock = threading.Lock()
+_shared_stores: dict[Path, JsonStore] = {}
+
 
 def default_config_dir() -> Path:
     return Path(user_config_dir(_APP_NAME))
 
 
 class JsonStore:
+    """Reads and atomically writes JSON files in one config directory.
+
+    ``snapshot`` serves parsed files from an in-memory cache that is refreshed
+    only when the file's mtime, size or inode changes, and ``transaction`` runs
+    read-modify-write cycles under the store's write lock. Use ``shared`` to get
+    the process-wide store for a directory so every manager and thread on it
+    shares that cache and lock.
+    """
+
     def __init__(self, base_dir: Path | None = None) -> None:
         self._base_dir = base_dir or default_config_dir()
+        self._lock = ReadWriteLock()
+        self._cache: dict[str, tuple[_Stamp | None, dict[str, Any] | None]] = {}
+
+    @classmethod
+    def shared(cls, base_dir: Path | None = None) -> JsonStore:
+        """Return the process-wide store for base_dir, creating it on first use."""
+        base_dir = base_dir or default_config_dir()
+        key = base_dir.resolve()
+        with _shared_lock:
+            store = _shared_stores.get(key)
+            if store is None:
+                store = _shared_stores[key] = cls(base_dir=base_dir)
+        return store
 
     @property
     def base_dir(self) -> Path:
@@ -35,11 +67,51 @@ class JsonStore:
         return self._base_dir / filename
 
     def read(self, filename: str, defaults: dict[str, Any] | None = None) -> dict[str, Any]:
+        data = self._load(self._path(filename))
+        return dict(defaults or {}) if data is None else data
+
+    def snapshot(self, filename: str, defaults: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Return the parsed file, re-parsing only if it changed on disk since the last call.
+
+        The returned dict is shared with other callers and must not be modified;
+        use ``read`` or ``transaction`` for a private copy.
+        """
         path = self._path(filename)
-        if defaults is None:
-            defaults = {}
+        with self._lock.read():
+            cached = self._cache.get(filename)
+            if cached is not None and cached[0] == _stamp(path):
+                return dict(defaults or {}) if cached[1] is None else cached[1]
+        with self._lock.write():
+            stamp = _stamp(path)
+            cached = self._cache.get(filename)
+            if cached is None or cached[0] != stamp:
+                cached = self._cache[filename] = (stamp, self._load(path))
+        return dict(defaults or {}) if cached[1] is None else cached[1]
+
+    @contextmanager
+    def transaction(
+        self, filename: str, defaults: dict[str, Any] | None = None, *, mode: int | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Read, modify and write back a file while holding the store's write lock.
+
+        Yields a private copy of the contents, which is written atomically when
+        the block exits without an exception. Transactions and snapshot refreshes
+        on the same store are serialised, so concurrent writers cannot lose each
+        other's updates. ``mode`` sets the file's permissions (e.g. 0o600).
+        """
+        with self._lock.write():
+            data = self.read(filename, defaults)
+            yield data
+            self._write(filename, data, mode)
+
+    def write(self, filename: str, data: dict[str, Any], *, mode: int | None = None) -> None:
+        with self._lock.write():
+            self._write(filename, data, mode)
+
+    def _load(self, path: Path) -> dict[str, Any] | None:
+        """Parse a file; None if it is missing or corrupt (corrupt files are backed up)."""
         if not path.exists():
-            return dict(defaults)
+            return None
         try:
             text = path.read_text(encoding="utf-8")
             data = json.loads(text)
@@ -53,12 +125,29 @@ class JsonStore:
                 shutil.copy2(str(path), str(backup_path))
             except OSError:
                 pass
-            return dict(defaults)
+            return None
 
-    def write(self, filename: str, data: dict[str, Any]) -> None:
+    def _write(self, filename: str, data: dict[str, Any], mode: int | None = None) -> None:
         self._ensure_dir()
         path = self._path(filename)
         tmp_path = path.with_suffix(path.suffix + ".tmp")
         text = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
-        tmp_path.write_text(text, encoding="utf-8")
+        if mode is None:
+            tmp_path.write_text(text, encoding="utf-8")
+        else:
+            # Create the file with its final permissions so its contents are never readable by others.
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(text)
         os.replace(str(tmp_path), str(path))
+        self._cache.pop(filename, None)
+
+
+def _stamp(path: Path) -> _Stamp | None:
+    """Identify a file version by mtime, size and inode; None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
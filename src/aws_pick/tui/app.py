@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Any
 
@@ -10,13 +11,14 @@ from textual.app import App
 
 from aws_pick.core.favorites import FavoritesManager
 from aws_pick.core.history import HistoryManager
+from aws_pick.core.login import DEFAULT_MAX_CONCURRENCY, LoginHandler
+from aws_pick.core.login_cache import LoginCache
 from aws_pick.core.presets import PresetsManager
+from aws_pick.core.ratelimit import RateLimiter
+from aws_pick.core.retry import RetryPolicy
 from aws_pick.models.account import AccountRole
-from aws_pick.models.selection import (
-    BatchLoginResult,
-    LoginResult,
-    SelectionResult,
-)
+from aws_pick.models.selection import BatchLoginResult, SelectionResult
+from aws_pick.models.table import AccountTable
 from aws_pick.tui.screens.selector import SelectorScreen
 
 _CSS_PATH = Path(__file__).parent / "styles" / "app.tcss"
@@ -30,11 +32,20 @@ class CredentialSelectorApp(App[list[AccountRole] | None]):
 
     def __init__(
         self,
-        items: list[AccountRole],
+        items: Sequence[AccountRole] | AccountTable,
         *,
         title: str = "Select Accounts",
         config_dir: Path | None = None,
-        on_login: Callable[[dict[str, Any]], LoginResult] | None = None,
+        on_login: LoginHandler | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        login_cache: LoginCache | None = None,
+        item_timeout: float | None = None,
+        batch_timeout: float | None = None,
+        executor: Executor | None = None,
+        priority: Callable[[AccountRole], float] | None = None,
+        latency_history: HistoryManager | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -42,6 +53,15 @@ class CredentialSelectorApp(App[list[AccountRole] | None]):
         self._items = items
         self._config_dir = config_dir
         self._on_login = on_login
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._login_cache = login_cache
+        self._item_timeout = item_timeout
+        self._batch_timeout = batch_timeout
+        self._executor = executor
+        self._priority = priority
+        self._latency_history = latency_history
         self._result: SelectionResult | None = None
         self._fav_mgr = FavoritesManager(config_dir=config_dir) if config_dir else None
         self._presets_mgr = PresetsManager(config_dir=config_dir) if config_dir else None
@@ -74,18 +94,28 @@ class CredentialSelectorApp(App[list[AccountRole] | None]):
         if self._hist_mgr and selected:
             self._hist_mgr.record(selected)
 
-        selected_dicts = [item.to_dict() for item in selected]
-
         if self._on_login is not None and selected:
             from aws_pick.tui.screens.progress import ProgressScreen
 
             self.push_screen(
-                ProgressScreen(selected, self._on_login),
+                ProgressScreen(
+                    selected,
+                    self._on_login,
+                    max_concurrency=self._max_concurrency,
+                    rate_limiter=self._rate_limiter,
+                    retry=self._retry,
+                    login_cache=self._login_cache,
+                    item_timeout=self._item_timeout,
+                    batch_timeout=self._batch_timeout,
+                    executor=self._executor,
+                    priority=self._priority,
+                    latency_history=self._latency_history,
+                ),
                 callback=self._on_progress_done,
             )
-            self._result = SelectionResult(selected=selected_dicts)
+            self._result = SelectionResult.from_items(selected)
         else:
-            self._result = SelectionResult(selected=selected_dicts)
+            self._result = SelectionResult.from_items(selected)
             self.exit()
 
     def _on_progress_done(self, batch_result: BatchLoginResult | None) -> None:
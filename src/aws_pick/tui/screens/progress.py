@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
 from typing import Any
 
 from textual.app import ComposeResult
@@ -11,13 +12,13 @@ from textual.containers import VerticalScroll
 from textual.screen import Screen
 from textual.widgets import Header, Static
 
-from aws_pick.core.login import process_batch
+from aws_pick.core.history import HistoryManager
+from aws_pick.core.login import DEFAULT_MAX_CONCURRENCY, LoginHandler, process_batch
+from aws_pick.core.login_cache import LoginCache
+from aws_pick.core.ratelimit import RateLimiter
+from aws_pick.core.retry import RetryPolicy
 from aws_pick.models.account import AccountRole
-from aws_pick.models.selection import (
-    BatchLoginResult,
-    ItemLoginResult,
-    LoginResult,
-)
+from aws_pick.models.selection import BatchLoginResult, ItemLoginResult
 from aws_pick.tui.widgets.progress_item import ProgressItem
 
 
@@ -39,14 +40,33 @@ class ProgressScreen(Screen[BatchLoginResult]):
 
     def __init__(
         self,
-        items: list[AccountRole],
-        handler: Callable[[dict[str, Any]], LoginResult],
+        items: Sequence[AccountRole],
+        handler: LoginHandler,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        login_cache: LoginCache | None = None,
+        item_timeout: float | None = None,
+        batch_timeout: float | None = None,
+        executor: Executor | None = None,
+        priority: Callable[[AccountRole], float] | None = None,
+        latency_history: HistoryManager | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
         self._items = items
         self._handler = handler
-        self._progress_widgets: list[ProgressItem] = []
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = rate_limiter
+        self._retry = retry
+        self._login_cache = login_cache
+        self._item_timeout = item_timeout
+        self._batch_timeout = batch_timeout
+        self._executor = executor
+        self._priority = priority
+        self._latency_history = latency_history
+        self._progress_widgets: dict[tuple[str, str], ProgressItem] = {}
         self._batch_result: BatchLoginResult | None = None
         self._completed = 0
         self._failed = 0
@@ -62,7 +82,7 @@ class ProgressScreen(Screen[BatchLoginResult]):
                     role_name=item.role.role_name,
                     account_id=item.account.account_id,
                 )
-                self._progress_widgets.append(pw)
+                self._progress_widgets[item.key] = pw
                 yield pw
         yield Static(f"0/{len(self._items)} complete", id="progress-summary")
 
@@ -74,20 +94,26 @@ class ProgressScreen(Screen[BatchLoginResult]):
             self._completed += 1
             if not result.success:
                 self._failed += 1
-            for pw in self._progress_widgets:
-                if pw._account_id == result.account_id and pw._role_name == result.role_name:
-                    pw.set_result(result.success, result.error)
-                    break
+            self._progress_widgets[(result.account_id, result.role_name)].set_result(result.success, result.error)
             self._update_summary()
 
-        # Mark items as processing one by one
-        for pw in self._progress_widgets:
-            pw.set_processing()
+        def on_start(item: AccountRole) -> None:
+            self._progress_widgets[item.key].set_processing()
 
         self._batch_result = await process_batch(
             self._items,
             self._handler,
             on_progress=on_progress,
+            max_concurrency=self._max_concurrency,
+            on_start=on_start,
+            rate_limiter=self._rate_limiter,
+            retry=self._retry,
+            login_cache=self._login_cache,
+            item_timeout=self._item_timeout,
+            batch_timeout=self._batch_timeout,
+            executor=self._executor,
+            priority=self._priority,
+            latency_history=self._latency_history,
         )
         self._update_summary(done=True)
 
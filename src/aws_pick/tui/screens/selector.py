@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any
 
 from textual import on
@@ -17,6 +18,7 @@ from aws_pick.core.history import HistoryManager
 from aws_pick.core.presets import PresetsManager
 from aws_pick.models.account import AccountRole
 from aws_pick.models.config import Favorite
+from aws_pick.models.table import AccountTable
 from aws_pick.tui.screens.confirm import ProductionConfirmScreen
 from aws_pick.tui.screens.help import HelpScreen
 from aws_pick.tui.screens.preset_load import PresetLoadScreen
@@ -46,7 +48,7 @@ class SelectorScreen(Screen[list[AccountRole] | None]):
 
     def __init__(
         self,
-        items: list[AccountRole],
+        items: Sequence[AccountRole] | AccountTable,
         *,
         title: str = "Select Accounts",
         favorites_manager: FavoritesManager | None = None,
@@ -170,10 +172,4 @@ class SelectorScreen(Screen[list[AccountRole] | None]):
         if items is None:
             return
         account_list = self.query_one(AccountList)
-        preset_keys = {(f.account_id, f.role_name) for f in items}
-        for item in account_list._all_items:
-            if item.key in preset_keys:
-                account_list._selected_keys.add(item.key)
-        account_list.selected_count = len(account_list._selected_keys)
-        account_list.post_message(AccountList.SelectionChanged(count=account_list.selected_count))
-        account_list._rebuild_list()
+        account_list.select_keys({(f.account_id, f.role_name) for f in items})
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from enum import Enum
+from itertools import filterfalse
+from operator import attrgetter
 from typing import Any
 
 from rich.text import Text
@@ -18,6 +23,8 @@ from aws_pick.core.environment import classify
 from aws_pick.core.favorites import FavoritesManager
 from aws_pick.core.history import HistoryManager, format_relative_time
 from aws_pick.models.account import AccountRole
+from aws_pick.models.pool import SymbolTable
+from aws_pick.models.table import AccountTable
 
 
 class GroupingMode(Enum):
@@ -28,6 +35,14 @@ class GroupingMode(Enum):
 
 _GROUPING_CYCLE = [GroupingMode.BY_ACCOUNT, GroupingMode.BY_ROLE, GroupingMode.FLAT]
 
+_by_sort_key = attrgetter("sort_key")
+_by_role_name = attrgetter("role.role_name")
+_by_account_name = attrgetter("account.account_name")
+
+# With an AccountTable, at most this many rows are turned into options; the rest are
+# summarised in one line until the filter narrows them down.
+_TABLE_RENDER_LIMIT = 1000
+
 _ENV_ABBREVIATIONS: dict[str, str] = {
     "production": "PROD",
     "staging": "STG",
@@ -69,15 +84,28 @@ class AccountList(Widget):
 
     def __init__(
         self,
-        items: list[AccountRole],
+        items: Sequence[AccountRole] | AccountTable,
         *,
         favorites_manager: FavoritesManager | None = None,
         history_manager: HistoryManager | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
-        self._all_items = list(items)
-        self._visible_items: list[AccountRole] = list(items)
+        # A columnar table is filtered in place and only visible/selected rows are materialised.
+        self._table = items if isinstance(items, AccountTable) else None
+        self._all_items: list[AccountRole] = [] if self._table is not None else list(items)
+        symbols = SymbolTable()
+        self._search_index: list[tuple[AccountRole, str, str, str]] = [
+            (
+                item,
+                symbols.folded(item.account.account_name),
+                item.account.account_id,
+                symbols.folded(item.role.role_name),
+            )
+            for item in self._all_items
+        ]
+        self._visible_items: list[AccountRole] = list(self._all_items)
+        self._visible_indices: array[int] = self._table.all_indices() if self._table is not None else array("I")
         self._selected_keys: set[tuple[str, str]] = set()
         self._filter_text = ""
         self._option_key_map: dict[str, AccountRole] = {}
@@ -98,7 +126,23 @@ class AccountList(Widget):
     @property
     def selected_items(self) -> list[AccountRole]:
         """Return currently selected AccountRole items."""
-        return [item for item in self._all_items if item.key in self._selected_keys]
+        return self._items_for_keys(self._selected_keys)
+
+    def _items_for_keys(self, keys: set[tuple[str, str]]) -> list[AccountRole]:
+        """Return the items whose key is in keys, in inventory order."""
+        if self._table is not None:
+            table = self._table
+            found = (table.find(account_id, role_name) for account_id, role_name in keys)
+            return table.rows(sorted(i for i in found if i is not None))
+        return [item for item in self._all_items if item.key in keys]
+
+    def select_keys(self, keys: set[tuple[str, str]]) -> None:
+        """Add every available item whose key is in keys to the selection."""
+        for item in self._items_for_keys(keys):
+            self._selected_keys.add(item.key)
+        self.selected_count = len(self._selected_keys)
+        self.post_message(self.SelectionChanged(count=self.selected_count))
+        self._rebuild_list()
 
     def compose(self) -> object:  # type: ignore[override]
         yield Static("", id="sticky-header")
@@ -122,25 +166,58 @@ class AccountList(Widget):
         self._option_key_map.clear()
         self._item_to_header.clear()
 
-        fav_items = [item for item in self._visible_items if item.key in self._favorite_keys]
-        non_fav_items = [item for item in self._visible_items if item.key not in self._favorite_keys]
+        if self._table is not None:
+            self._render_table(option_list, self._table)
+        else:
+            fav_items = [item for item in self._visible_items if item.key in self._favorite_keys]
+            non_fav_items = [item for item in self._visible_items if item.key not in self._favorite_keys]
+
+            if fav_items:
+                self._render_favorites_section(option_list, fav_items)
+                if non_fav_items:
+                    option_list.add_option(Option(Text(""), disabled=True))
+
+            if self._grouping_mode == GroupingMode.BY_ACCOUNT:
+                self._render_by_account(option_list, non_fav_items)
+            elif self._grouping_mode == GroupingMode.BY_ROLE:
+                self._render_by_role(option_list, non_fav_items)
+            else:
+                self._render_flat(option_list, non_fav_items)
+
+        if prev_highlight is not None and option_list.option_count > 0:
+            option_list.highlighted = min(prev_highlight, option_list.option_count - 1)
+
+        self._update_sticky_header()
+
+    def _render_table(self, option_list: OptionList, table: AccountTable) -> None:
+        """Render the visible table rows, materialising only the rows that get an option."""
+        visible = self._visible_indices
+        found = (table.find(account_id, role_name) for account_id, role_name in self._favorite_keys)
+        fav_rows = {i for i in found if i is not None and _contains(visible, i)}
+        rest = array("I", filterfalse(fav_rows.__contains__, visible)) if fav_rows else visible
 
-        if fav_items:
-            self._render_favorites_section(option_list, fav_items)
-            if non_fav_items:
+        if fav_rows:
+            self._render_favorites_section(option_list, table.rows(sorted(fav_rows)))
+            if rest:
                 option_list.add_option(Option(Text(""), disabled=True))
 
+        budget = max(_TABLE_RENDER_LIMIT - len(fav_rows), 0)
         if self._grouping_mode == GroupingMode.BY_ACCOUNT:
-            self._render_by_account(option_list, non_fav_items)
+            shown = table.sort(rest, by="name")[:budget]
+            groups = table.group(shown, by="account").items()
+            self._render_account_groups(option_list, ((name, table.rows(rows)) for name, rows in groups))
         elif self._grouping_mode == GroupingMode.BY_ROLE:
-            self._render_by_role(option_list, non_fav_items)
+            shown = table.sort(rest, by="role")[:budget]
+            groups = table.group(shown, by="role").items()
+            self._render_role_groups(option_list, ((name, table.rows(rows)) for name, rows in groups))
         else:
-            self._render_flat(option_list, non_fav_items)
+            shown = table.sort(rest, by="name")[:budget]
+            self._render_flat_rows(option_list, table.rows(shown))
 
-        if prev_highlight is not None and option_list.option_count > 0:
-            option_list.highlighted = min(prev_highlight, option_list.option_count - 1)
-
-        self._update_sticky_header()
+        hidden = len(rest) - len(shown)
+        if hidden:
+            option_list.add_option(Option(Text(""), disabled=True))
+            option_list.add_option(Option(Text(f"  … {hidden:,} more - type to filter", style="dim"), disabled=True))
 
     def _render_favorites_section(self, option_list: OptionList, fav_items: list[AccountRole]) -> None:
         """Render the favorites group at the top."""
@@ -149,9 +226,8 @@ class AccountList(Widget):
         header_text.append(" Favorites", style="bold")
         option_list.add_option(Option(header_text, id="header:favorites", disabled=True))
         header_display = "★ Favorites"
-        for ar in sorted(fav_items, key=lambda r: f"{r.account.account_name}/{r.role.role_name}"):
-            key_str = f"{ar.account.account_id}:{ar.role.role_name}"
-            self._item_to_header[key_str] = header_display
+        for ar in sorted(fav_items, key=_by_sort_key):
+            self._item_to_header[ar.option_id] = header_display
             self._add_item_option(
                 option_list, ar, label=f"{ar.account.account_name} / {ar.role.role_name}", is_fav=True
             )
@@ -162,9 +238,14 @@ class AccountList(Widget):
         grouped: dict[str, list[AccountRole]] = {}
         for item in source:
             grouped.setdefault(item.account.account_name, []).append(item)
+        self._render_account_groups(
+            option_list, ((name, sorted(roles, key=_by_role_name)) for name, roles in sorted(grouped.items()))
+        )
 
+    def _render_account_groups(self, option_list: OptionList, groups: Iterable[tuple[str, list[AccountRole]]]) -> None:
+        """Render account groups in the given order; roles are already sorted."""
         first_group = True
-        for account_name, roles in sorted(grouped.items()):
+        for account_name, roles in groups:
             if not first_group:
                 option_list.add_option(Option(Text(""), disabled=True))
             first_group = False
@@ -179,9 +260,8 @@ class AccountList(Widget):
             option_list.add_option(Option(header_text, id=f"header:{account_name}", disabled=True))
 
             header_display = account_name + (f"  {env_info.environment}" if env_info else "")
-            for ar in sorted(roles, key=lambda r: r.role.role_name):
-                key_str = f"{ar.account.account_id}:{ar.role.role_name}"
-                self._item_to_header[key_str] = header_display
+            for ar in roles:
+                self._item_to_header[ar.option_id] = header_display
                 self._add_item_option(option_list, ar, label=ar.role.role_name, show_env_tag=False)
 
     def _render_by_role(self, option_list: OptionList, items: list[AccountRole] | None = None) -> None:
@@ -190,9 +270,14 @@ class AccountList(Widget):
         grouped: dict[str, list[AccountRole]] = {}
         for item in source:
             grouped.setdefault(item.role.role_name, []).append(item)
+        self._render_role_groups(
+            option_list, ((name, sorted(rows, key=_by_account_name)) for name, rows in sorted(grouped.items()))
+        )
 
+    def _render_role_groups(self, option_list: OptionList, groups: Iterable[tuple[str, list[AccountRole]]]) -> None:
+        """Render role groups in the given order; accounts are already sorted."""
         first_group = True
-        for role_name, role_items in sorted(grouped.items()):
+        for role_name, role_items in groups:
             if not first_group:
                 option_list.add_option(Option(Text(""), disabled=True))
             first_group = False
@@ -201,18 +286,18 @@ class AccountList(Widget):
             header_text.append(role_name, style="bold")
             option_list.add_option(Option(header_text, id=f"header:{role_name}", disabled=True))
 
-            for ar in sorted(role_items, key=lambda r: r.account.account_name):
-                key_str = f"{ar.account.account_id}:{ar.role.role_name}"
-                self._item_to_header[key_str] = role_name
+            for ar in role_items:
+                self._item_to_header[ar.option_id] = role_name
                 self._add_item_option(option_list, ar, label=ar.account.account_name)
 
     def _render_flat(self, option_list: OptionList, items: list[AccountRole] | None = None) -> None:
         """Flat alphabetical list."""
         source = items if items is not None else self._visible_items
-        sorted_items = sorted(source, key=lambda ar: f"{ar.account.account_name}/{ar.role.role_name}")
-        for ar in sorted_items:
-            key_str = f"{ar.account.account_id}:{ar.role.role_name}"
-            self._item_to_header[key_str] = ""
+        self._render_flat_rows(option_list, sorted(source, key=_by_sort_key))
+
+    def _render_flat_rows(self, option_list: OptionList, rows: list[AccountRole]) -> None:
+        for ar in rows:
+            self._item_to_header[ar.option_id] = ""
             self._add_item_option(option_list, ar, label=f"{ar.account.account_name} / {ar.role.role_name}")
 
     def _add_item_option(
@@ -225,7 +310,7 @@ class AccountList(Widget):
         show_env_tag: bool = True,
     ) -> None:
         """Add a single selectable item option."""
-        key_str = f"{ar.account.account_id}:{ar.role.role_name}"
+        key_str = ar.option_id
         is_selected = ar.key in self._selected_keys
         indicator = "\u2713" if is_selected else "\u25cb"
         prefix = "    " if self._grouping_mode != GroupingMode.FLAT and not is_fav else "  "
@@ -323,8 +408,12 @@ class AccountList(Widget):
 
     def action_select_all(self) -> None:
         """Select all visible items."""
-        for item in self._visible_items:
-            self._selected_keys.add(item.key)
+        if self._table is not None:
+            table = self._table
+            self._selected_keys.update((table.account_id(i), table.role_name(i)) for i in self._visible_indices)
+        else:
+            for item in self._visible_items:
+                self._selected_keys.add(item.key)
         self.selected_count = len(self._selected_keys)
         self.post_message(self.SelectionChanged(count=self.selected_count))
         self._rebuild_list()
@@ -365,29 +454,31 @@ class AccountList(Widget):
 
     def select_all_favorites(self) -> None:
         """Select all items that are marked as favorites."""
-        for item in self._all_items:
-            if item.key in self._favorite_keys:
-                self._selected_keys.add(item.key)
-        self.selected_count = len(self._selected_keys)
-        self.post_message(self.SelectionChanged(count=self.selected_count))
-        self._rebuild_list()
+        self.select_keys(self._favorite_keys)
 
     def apply_filter(self, text: str) -> None:
         """Filter items by text match on account_name, account_id, or role_name."""
         self._filter_text = text.strip().lower()
-        if not self._filter_text:
+        if self._table is not None:
+            self._visible_indices = self._table.filter(self._filter_text)
+        elif not self._filter_text:
             self._visible_items = list(self._all_items)
         else:
+            needle = self._filter_text
             self._visible_items = [
                 item
-                for item in self._all_items
-                if self._filter_text in item.account.account_name.lower()
-                or self._filter_text in item.account.account_id
-                or self._filter_text in item.role.role_name.lower()
+                for item, name, account_id, role in self._search_index
+                if needle in name or needle in account_id or needle in role
             ]
         self._rebuild_list()
 
 
+def _contains(indices: array[int], index: int) -> bool:
+    """Binary-search an ascending index array."""
+    position = bisect_left(indices, index)
+    return position < len(indices) and indices[position] == index
+
+
 def _env_style(env: str) -> str:
     """Return a Rich style string for the environment."""
     env_lower = env.lower()
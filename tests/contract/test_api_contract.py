@@ -18,8 +18,12 @@ class TestPublicApiSurface:
     def test_all_exports_present(self) -> None:
         expected = {
             "select_accounts",
+            "aselect_accounts",
+            "iter_logins",
+            "aiter_logins",
             "manage_favorites",
             "manage_presets",
+            "Inventory",
             "SelectionResult",
             "LoginResult",
             "BatchLoginResult",
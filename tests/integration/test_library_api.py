@@ -55,8 +55,12 @@ class TestPublicApiExports:
     def test_all_list(self) -> None:
         expected = {
             "select_accounts",
+            "aselect_accounts",
+            "iter_logins",
+            "aiter_logins",
             "manage_favorites",
             "manage_presets",
+            "Inventory",
             "SelectionResult",
             "LoginResult",
             "BatchLoginResult",
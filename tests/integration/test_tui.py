@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
+from aws_pick.models.selection import LoginResult
 from aws_pick.tui.app import CredentialSelectorApp
+from aws_pick.tui.screens.progress import ProgressScreen
 
 
 def _make_items() -> list[AccountRole]:
@@ -87,6 +91,53 @@ class TestTuiLaunch:
         assert len(app.result.selected) >= 0  # at least verifies no crash
 
 
+class TestTuiAccountTable:
+    @pytest.mark.asyncio
+    async def test_filter_and_select_from_table(self) -> None:
+        from aws_pick.models.table import AccountTable
+
+        app = CredentialSelectorApp(AccountTable.from_items(_make_items()))
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("slash")
+            await pilot.pause()
+            await pilot.press("d", "e", "v")
+            await pilot.pause()
+            await pilot.press("escape")
+            await pilot.pause()
+            await pilot.press("a")
+            await pilot.pause()
+            await pilot.press("enter")
+        assert [item["role_name"] for item in app.result.selected] == ["AdminAccess", "ReadOnly"]
+
+    @pytest.mark.asyncio
+    async def test_only_rendered_rows_are_materialised(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from textual.widgets import OptionList
+
+        from aws_pick.models.table import AccountTable
+        from aws_pick.tui.widgets import account_list
+
+        monkeypatch.setattr(account_list, "_TABLE_RENDER_LIMIT", 2)
+        table = AccountTable.from_items(_make_items())
+        built: list[int] = []
+        row = AccountTable.row
+        monkeypatch.setattr(AccountTable, "row", lambda self, index: built.append(index) or row(self, index))
+        app = CredentialSelectorApp(table)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            option_list = app.screen.query_one("#account-option-list", OptionList)
+            ids = [option_list.get_option_at_index(i).id for i in range(option_list.option_count)]
+            assert [i for i in ids if i and not i.startswith("header:")] == [
+                "111111111111:AdminAccess",
+                "111111111111:ReadOnly",
+            ]
+            assert sorted(built) == [0, 1]
+            await pilot.press("a")
+            await pilot.press("enter")
+            await pilot.press("y")
+        assert len(app.result.selected) == 3
+
+
 class TestTuiKeyboardNavigation:
     @pytest.mark.asyncio
     async def test_arrow_keys_no_crash(self) -> None:
@@ -207,3 +258,38 @@ class TestTuiHelp:
             # Now confirm to exit
             await pilot.press("enter")
         assert app.result.cancelled is False
+
+
+class TestTuiLogin:
+    @pytest.mark.asyncio
+    async def test_progress_screen_runs_logins_concurrently(self) -> None:
+        running = 0
+        peak = 0
+
+        async def handler(item: dict) -> LoginResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return LoginResult(success=item["role_name"] != "ReadOnly", error="denied")
+
+        app = CredentialSelectorApp(_make_items(), on_login=handler, max_concurrency=3)
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await pilot.press("a")
+            await pilot.pause()
+            await pilot.press("enter")
+            await pilot.pause()
+            await pilot.press("y")
+            screen = app.screen
+            assert isinstance(screen, ProgressScreen)
+            await pilot.app.workers.wait_for_complete()
+            await pilot.pause()
+            assert [pw.status for pw in screen._progress_widgets.values()] == ["success", "failed", "success"]
+            await pilot.press("escape")
+        assert peak == 3
+        batch = app.result.login_results
+        assert batch is not None
+        assert [r.role_name for r in batch.results] == ["AdminAccess", "ReadOnly", "AdminAccess"]
+        assert batch.failed == 1
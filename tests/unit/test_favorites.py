@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import json
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 from aws_pick.core.favorites import FavoritesManager, manage_favorites
 
@@ -72,3 +75,44 @@ class TestManageFavorites:
     def test_factory_with_str_path(self, tmp_path: Path) -> None:
         mgr = manage_favorites(config_dir=str(tmp_path))
         assert isinstance(mgr, FavoritesManager)
+
+    def test_factory_returns_shared_instance(self, tmp_path: Path) -> None:
+        assert manage_favorites(config_dir=tmp_path) is manage_favorites(config_dir=str(tmp_path))
+        assert manage_favorites(config_dir=tmp_path) is not manage_favorites(config_dir=tmp_path / "other")
+
+
+class TestSharedFavorites:
+    def test_reads_do_not_reparse(self, tmp_path: Path) -> None:
+        mgr = FavoritesManager(config_dir=tmp_path)
+        mgr.add("123456789012", "Admin")
+        mgr.list()
+        with patch("aws_pick.storage.json_store.json.loads") as loads:
+            for _ in range(10):
+                assert mgr.is_favorite("123456789012", "Admin")
+                assert len(mgr.list()) == 1
+        loads.assert_not_called()
+
+    def test_sees_writes_from_other_managers_and_external_edits(self, tmp_path: Path) -> None:
+        reader = FavoritesManager(config_dir=tmp_path)
+        assert reader.list() == []
+        FavoritesManager(config_dir=tmp_path).add("123456789012", "Admin")
+        assert reader.is_favorite("123456789012", "Admin")
+        (tmp_path / "config.json").write_text(
+            json.dumps({"favorites": [{"account_id": "987654321098", "role_name": "ReadOnly"}]}), encoding="utf-8"
+        )
+        assert [f.account_id for f in reader.list()] == ["987654321098"]
+
+    def test_concurrent_adds_from_threads(self, tmp_path: Path) -> None:
+        mgr = manage_favorites(config_dir=tmp_path)
+
+        def add_range(start: int) -> None:
+            for i in range(start, start + 10):
+                mgr.add(f"{i:012d}", "Admin")
+                mgr.list()
+
+        threads = [threading.Thread(target=add_range, args=(n * 10,)) for n in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(FavoritesManager(config_dir=tmp_path).list()) == 60
@@ -43,6 +43,20 @@ class TestHistoryManager:
         mgr.record([_make_ar("111111111111", "Admin"), _make_ar("222222222222", "ReadOnly")])
         assert len(mgr.list_entries()) == 2
 
+    def test_record_latencies_moving_average(self, tmp_path: Path) -> None:
+        mgr = HistoryManager(config_dir=tmp_path)
+        mgr.record([_make_ar("111111111111", "Admin")])
+        mgr.record_latencies([("111111111111", "Admin", 10.0), ("222222222222", "ReadOnly", 2.0)])
+        mgr.record_latencies([("111111111111", "Admin", 20.0)])
+        assert mgr.get_latencies() == {("111111111111", "Admin"): 13.0, ("222222222222", "ReadOnly"): 2.0}
+        assert mgr.get_last_used("222222222222", "ReadOnly") is not None
+
+    def test_record_keeps_latency(self, tmp_path: Path) -> None:
+        mgr = HistoryManager(config_dir=tmp_path)
+        mgr.record_latencies([("123456789012", "Admin", 4.0)])
+        mgr.record([_make_ar()])
+        assert [e.login_seconds for e in mgr.list_entries()] == [4.0]
+
     def test_get_last_used_nonexistent(self, tmp_path: Path) -> None:
         mgr = HistoryManager(config_dir=tmp_path)
         assert mgr.get_last_used("000000000000", "NoRole") is None
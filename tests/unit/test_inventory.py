@@ -0,0 +1,229 @@
+"""Unit tests for the reusable Inventory."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from aws_pick.core.inventory import Inventory
+from aws_pick.core.selector import select_accounts
+from aws_pick.exceptions import InvalidAccountError, InvalidSelectionError
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole, DedupeReport
+
+_ACCOUNTS = [
+    {"account_id": "111111111111", "account_name": "prod", "role_name": "Admin", "environment": "production"},
+    {"account_id": "111111111111", "account_name": "prod", "role_name": "ReadOnly"},
+    {"account_id": "222222222222", "account_name": "dev", "role_name": "Admin"},
+    {"account_id": "111111111111", "account_name": "prod", "role_name": "Admin"},
+]
+
+
+class TestBuild:
+    def test_from_dicts_validates_and_dedupes(self) -> None:
+        inventory = Inventory.from_dicts(_ACCOUNTS)
+        assert len(inventory) == 3
+        assert [item.key for item in inventory] == [
+            ("111111111111", "Admin"),
+            ("111111111111", "ReadOnly"),
+            ("222222222222", "Admin"),
+        ]
+        assert inventory[0].account.environment == "production"
+
+    def test_from_dicts_reports_duplicates(self) -> None:
+        report = DedupeReport()
+        Inventory.from_dicts(_ACCOUNTS, report=report)
+        assert report.duplicates == {("111111111111", "Admin"): 1}
+
+    @pytest.mark.parametrize("mode", ["full", "fast", "trusted"])
+    def test_validation_modes(self, mode: str) -> None:
+        assert Inventory.from_dicts(_ACCOUNTS, validate=mode).items == Inventory.from_dicts(_ACCOUNTS).items  # type: ignore[arg-type]
+
+    def test_invalid_row_raises(self) -> None:
+        with pytest.raises(InvalidAccountError, match="accounts\\[0\\]"):
+            Inventory.from_dicts([{"account_id": "111111111111", "account_name": "a"}])
+
+    @pytest.mark.parametrize("mode", ["full", "fast", "trusted"])
+    def test_from_generator(self, mode: str) -> None:
+        consumed: list[int] = []
+
+        def rows():  # type: ignore[no-untyped-def]
+            for i, row in enumerate(_ACCOUNTS):
+                consumed.append(i)
+                yield row
+
+        with patch("aws_pick.core.inventory._CHUNK_SIZE", 2):
+            inventory = Inventory.from_dicts(rows(), validate=mode)  # type: ignore[arg-type]
+        assert consumed == [0, 1, 2, 3]
+        assert inventory.items == Inventory.from_dicts(_ACCOUNTS).items
+
+    def test_fast_error_names_row_in_later_chunk(self) -> None:
+        rows = [
+            *_ACCOUNTS,
+            {"account_id": "555555555555", "account_name": "x", "role_name": "Admin"},
+            {"account_name": "x"},
+        ]
+        with patch("aws_pick.core.inventory._CHUNK_SIZE", 2):
+            with pytest.raises(InvalidAccountError, match="accounts\\[5\\]"):
+                Inventory.from_dicts(iter(rows), validate="fast")
+
+    def test_unknown_mode_raises_before_reading(self) -> None:
+        rows = iter(_ACCOUNTS)
+        with pytest.raises(ValueError, match="validate must be one of"):
+            Inventory.from_dicts(rows, validate="sloppy")  # type: ignore[arg-type]
+        assert next(rows) == _ACCOUNTS[0]
+
+    def test_from_items(self) -> None:
+        item = AccountRole(AwsAccount("111111111111", "prod"), AwsRole("Admin"))
+        inventory = Inventory([item, item])
+        assert inventory.items == (item,)
+        assert item in inventory
+        assert "111111111111:Admin" not in inventory
+
+
+class TestLookup:
+    def test_get(self) -> None:
+        inventory = Inventory.from_dicts(_ACCOUNTS)
+        item = inventory.get("222222222222", "Admin")
+        assert item is not None
+        assert item.account.account_name == "dev"
+        assert inventory.get("222222222222", "ReadOnly") is None
+
+    def test_resolve_keeps_selection_order(self) -> None:
+        inventory = Inventory.from_dicts(_ACCOUNTS)
+        items = inventory.resolve(["222222222222:Admin", "111111111111:ReadOnly"])
+        assert [item.option_id for item in items] == ["222222222222:Admin", "111111111111:ReadOnly"]
+
+    def test_resolve_reports_all_missing(self) -> None:
+        inventory = Inventory.from_dicts(_ACCOUNTS)
+        with pytest.raises(InvalidSelectionError, match="'999999999999:Admin', 'bogus'"):
+            inventory.resolve(["999999999999:Admin", "111111111111:Admin", "bogus"])
+
+
+class TestSelectAccounts:
+    def test_reused_without_revalidation(self) -> None:
+        inventory = Inventory.from_dicts(_ACCOUNTS)
+        with patch("aws_pick.core.inventory._validate_and_convert") as convert:
+            first = select_accounts(inventory, interactive=False, selections=["111111111111:Admin"])
+            second = select_accounts(inventory, interactive=False, selections=["222222222222:Admin"])
+        convert.assert_not_called()
+        assert first.selected[0]["environment"] == "production"
+        assert second.selected[0]["account_name"] == "dev"
+
+    def test_accepts_generator(self) -> None:
+        result = select_accounts(
+            (row for row in _ACCOUNTS), interactive=False, selections=["111111111111:ReadOnly"], validate="fast"
+        )
+        assert [row["role_name"] for row in result.selected] == ["ReadOnly"]
+
+    def test_empty_generator(self) -> None:
+        result = select_accounts(iter([]), interactive=False)
+        assert result.selected == []
+
+    def test_empty_inventory(self) -> None:
+        result = select_accounts(Inventory(), interactive=False, selections=[])
+        assert result.selected == []
+        assert not result.cancelled
+
+
+class TestQuery:
+    _ROWS = [
+        {"account_id": "111111111111", "account_name": "payments-prod", "role_name": "Admin"},
+        {"account_id": "111111111111", "account_name": "payments-prod", "role_name": "ReadOnly"},
+        {"account_id": "222222222222", "account_name": "payments-dev", "role_name": "Admin"},
+        {"account_id": "333333333333", "account_name": "Search", "role_name": "Admin", "environment": "Production"},
+        {"account_id": "444444444444", "account_name": "sandbox", "role_name": "Admin"},
+    ]
+
+    def _ids(self, items: list[AccountRole]) -> list[str]:
+        return [item.option_id for item in items]
+
+    def test_no_criteria_returns_everything(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert inventory.query() == list(inventory)
+
+    def test_env_uses_classification(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert self._ids(inventory.query(env="PRODUCTION")) == [
+            "111111111111:Admin",
+            "111111111111:ReadOnly",
+            "333333333333:Admin",
+        ]
+
+    def test_role_alternatives(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert len(inventory.query(role=["Admin", "ReadOnly"])) == 5
+        assert inventory.query(role="admin") == []
+
+    def test_name_prefix_is_case_insensitive(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert self._ids(inventory.query(name_prefix="PAYMENTS-")) == [
+            "111111111111:Admin",
+            "111111111111:ReadOnly",
+            "222222222222:Admin",
+        ]
+        assert self._ids(inventory.query(name_prefix="se")) == ["333333333333:Admin"]
+
+    def test_criteria_intersect_in_inventory_order(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        result = inventory.query(
+            env=["production", "development"],
+            role="Admin",
+            name_prefix="payments",
+            account_ids=["222222222222", "111111111111"],
+        )
+        assert self._ids(result) == ["111111111111:Admin", "222222222222:Admin"]
+
+    def test_single_account_id(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert inventory.query(account_ids="111111111111") == inventory.query(account_ids=["111111111111"])
+        assert inventory.query(account_ids="111111111111") != []
+
+    def test_unknown_values_match_nothing(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert inventory.query(env="qa") == []
+        assert inventory.query(account_ids=[]) == []
+        assert inventory.query(name_prefix="zzz") == []
+
+
+class TestSelect:
+    _ROWS = [
+        {"account_id": "111111111111", "account_name": "data-prod", "role_name": "DataEngineer"},
+        {"account_id": "111111111111", "account_name": "data-prod", "role_name": "ReadOnly"},
+        {"account_id": "222222222222", "account_name": "web-stg", "role_name": "Deployer"},
+        {"account_id": "222222222222", "account_name": "web-stg", "role_name": "ReadOnly"},
+        {"account_id": "333333333333", "account_name": "data-dev", "role_name": "Admin"},
+    ]
+
+    def _ids(self, items: list[AccountRole]) -> list[str]:
+        return [item.option_id for item in items]
+
+    def test_exact_keeps_resolve_semantics(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        selections = ["222222222222:Deployer", "111111111111:ReadOnly", "222222222222:Deployer"]
+        assert inventory.select(selections) == inventory.resolve(selections)
+
+    def test_patterns(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        assert self._ids(inventory.select(["*:ReadOnly"])) == ["111111111111:ReadOnly", "222222222222:ReadOnly"]
+        assert self._ids(inventory.select(["env=staging:Deploy*"])) == ["222222222222:Deployer"]
+        assert self._ids(inventory.select(["re:^data-.*:.*Engineer$"])) == ["111111111111:DataEngineer"]
+        assert self._ids(inventory.select(["DATA-*:*"])) == [
+            "111111111111:DataEngineer",
+            "111111111111:ReadOnly",
+            "333333333333:Admin",
+        ]
+
+    def test_mixed_specs_in_spec_order_without_duplicates(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        result = inventory.select(["333333333333:Admin", "*:ReadOnly", "111111111111:ReadOnly"])
+        assert self._ids(result) == ["333333333333:Admin", "111111111111:ReadOnly", "222222222222:ReadOnly"]
+
+    def test_unmatched_specs_reported_together(self) -> None:
+        inventory = Inventory.from_dicts(self._ROWS)
+        with pytest.raises(InvalidSelectionError, match="'env=qa', '999999999999:Admin', 'web-\\*:Admin'"):
+            inventory.select(["*:ReadOnly", "env=qa", "999999999999:Admin", "web-*:Admin", "env=qa"])
+
+    def test_select_accounts_with_patterns(self) -> None:
+        result = select_accounts(self._ROWS, interactive=False, selections=["env=production"])
+        assert [row["role_name"] for row in result.selected] == ["DataEngineer", "ReadOnly"]
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from aws_pick.storage.json_store import JsonStore
+from aws_pick.storage.locks import ReadWriteLock
 
 
 class TestJsonStoreRead:
@@ -91,6 +96,14 @@ class TestJsonStoreWrite:
         text = (tmp_path / "unicode.json").read_text(encoding="utf-8")
         assert "caf\u00e9" in text
 
+    def test_write_with_mode(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        store.write("secret.json", {"a": 1}, mode=0o600)
+        store.write("secret.json", {"a": 2}, mode=0o600)
+        path = tmp_path / "secret.json"
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert json.loads(path.read_text(encoding="utf-8")) == {"a": 2}
+
     def test_write_pretty_prints(self, tmp_path: Path) -> None:
         store = JsonStore(base_dir=tmp_path)
         store.write("pretty.json", {"a": 1, "b": 2})
@@ -121,3 +134,95 @@ class TestJsonStoreRoundTrip:
     def test_base_dir_property(self, tmp_path: Path) -> None:
         store = JsonStore(base_dir=tmp_path)
         assert store.base_dir == tmp_path
+
+
+class TestJsonStoreSnapshot:
+    def test_snapshot_parses_once_until_file_changes(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        store.write("data.json", {"version": 1})
+        with patch("aws_pick.storage.json_store.json.loads", wraps=json.loads) as loads:
+            first = store.snapshot("data.json")
+            assert store.snapshot("data.json") is first
+            assert loads.call_count == 1
+            (tmp_path / "data.json").write_text('{"version": 22}', encoding="utf-8")
+            assert store.snapshot("data.json") == {"version": 22}
+            assert loads.call_count == 2
+
+    def test_snapshot_missing_file_returns_defaults(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        assert store.snapshot("missing.json", defaults={"entries": []}) == {"entries": []}
+
+    def test_write_invalidates_snapshot(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        store.write("data.json", {"version": 1})
+        store.snapshot("data.json")
+        store.write("data.json", {"version": 2})
+        assert store.snapshot("data.json") == {"version": 2}
+
+
+class TestJsonStoreTransaction:
+    def test_transaction_writes_on_success(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        with store.transaction("data.json", defaults={"count": 0}) as data:
+            data["count"] += 1
+        assert store.read("data.json") == {"count": 1}
+
+    def test_transaction_discards_on_error(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+        store.write("data.json", {"count": 1})
+        with pytest.raises(RuntimeError):
+            with store.transaction("data.json") as data:
+                data["count"] = 99
+                raise RuntimeError("abort")
+        assert store.read("data.json") == {"count": 1}
+
+    def test_concurrent_transactions_do_not_lose_updates(self, tmp_path: Path) -> None:
+        store = JsonStore(base_dir=tmp_path)
+
+        def bump() -> None:
+            for _ in range(20):
+                with store.transaction("data.json", defaults={"count": 0}) as data:
+                    data["count"] += 1
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert store.read("data.json") == {"count": 160}
+
+
+class TestSharedStore:
+    def test_one_store_per_directory(self, tmp_path: Path) -> None:
+        store = JsonStore.shared(tmp_path)
+        assert JsonStore.shared(tmp_path / "sub" / "..") is store
+        assert JsonStore.shared(tmp_path / "other") is not store
+
+
+class TestReadWriteLock:
+    def test_readers_share_writers_exclude(self) -> None:
+        lock = ReadWriteLock()
+        readers_in = threading.Barrier(3, timeout=5)
+        events: list[str] = []
+
+        def reader() -> None:
+            with lock.read():
+                readers_in.wait()
+                events.append("read")
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert events == ["read"] * 3
+
+        with lock.write():
+            blocked = threading.Thread(target=reader)
+            readers_in = threading.Barrier(1, timeout=5)
+            blocked.start()
+            blocked.join(0.05)
+            assert blocked.is_alive()
+            events.append("write")
+        blocked.join()
+        assert events[-2:] == ["write", "read"]
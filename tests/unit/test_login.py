@@ -2,11 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
 import pytest
 
-from aws_pick.core.login import process_batch
+from aws_pick.core.history import HistoryManager
+from aws_pick.core.login import (
+    DEADLINE_ERROR,
+    _dispatch,
+    _in_flight,
+    aiter_logins,
+    is_async_handler,
+    iter_logins,
+    process_batch,
+    run_batch,
+)
+from aws_pick.core.login_cache import LoginCache
+from aws_pick.core.ratelimit import RateLimiter
+from aws_pick.core.retry import RetryPolicy
 from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
-from aws_pick.models.selection import ItemLoginResult, LoginResult
+from aws_pick.models.selection import BatchLoginResult, ItemLoginResult, LoginResult
 
 
 def _make_items(n: int = 3) -> list[AccountRole]:
@@ -19,6 +43,10 @@ def _make_items(n: int = 3) -> list[AccountRole]:
     ]
 
 
+def _login_in_worker_process(item: dict) -> LoginResult:
+    return LoginResult(success=item["account_id"] != "000000000002", error="denied", payload=os.getpid())
+
+
 class TestProcessBatch:
     @pytest.mark.asyncio
     async def test_all_succeed(self) -> None:
@@ -98,3 +126,724 @@ class TestProcessBatch:
         assert result.results[0].account_id == "000000000001"
         assert result.results[0].account_name == "account-1"
         assert result.results[0].role_name == "Admin"
+
+
+class TestAsyncHandlers:
+    @pytest.mark.asyncio
+    async def test_async_handler_runs_on_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        seen: list[str] = []
+
+        async def handler(item: dict) -> LoginResult:
+            assert asyncio.get_running_loop() is loop
+            seen.append(item["account_id"])
+            return LoginResult(success=True)
+
+        result = await process_batch(_make_items(), handler)
+        assert result.succeeded == 3
+        assert seen == ["000000000001", "000000000002", "000000000003"]
+
+    @pytest.mark.asyncio
+    async def test_async_callable_object(self) -> None:
+        class Handler:
+            async def __call__(self, item: dict) -> LoginResult:
+                return LoginResult(success=False, error="nope")
+
+        assert is_async_handler(Handler())
+        result = await process_batch(_make_items(1), Handler())
+        assert result.results[0].error == "nope"
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_runs_in_thread(self) -> None:
+        main = threading.get_ident()
+        threads: set[int] = set()
+
+        def handler(item: dict) -> LoginResult:
+            threads.add(threading.get_ident())
+            return LoginResult(success=True)
+
+        await process_batch(_make_items(), handler)
+        assert main not in threads
+
+
+class TestConcurrency:
+    @pytest.mark.asyncio
+    async def test_bounded_and_ordered(self) -> None:
+        running = 0
+        peak = 0
+        progress: list[str] = []
+
+        async def handler(item: dict) -> LoginResult:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later items finish first.
+            await asyncio.sleep(0.01 * (10 - int(item["account_id"])))
+            running -= 1
+            return LoginResult(success=True)
+
+        result = await process_batch(
+            _make_items(9), handler, on_progress=lambda r: progress.append(r.account_id), max_concurrency=3
+        )
+        assert peak == 3
+        assert [r.account_id for r in result.results] == [f"{i:012d}" for i in range(1, 10)]
+        assert sorted(progress) == [f"{i:012d}" for i in range(1, 10)]
+        assert progress != sorted(progress)
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await process_batch(_make_items(), lambda item: LoginResult(success=True), max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_cancel_reports_in_flight_and_skips_rest(self) -> None:
+        started = asyncio.Event()
+
+        async def handler(item: dict) -> LoginResult:
+            started.set()
+            await asyncio.sleep(10)
+            return LoginResult(success=True)
+
+        task = asyncio.ensure_future(process_batch(_make_items(5), handler, max_concurrency=2))
+        await started.wait()
+        task.cancel()
+        result = await task
+        assert [(r.account_id, r.error) for r in result.results] == [
+            ("000000000001", "Cancelled"),
+            ("000000000002", "Cancelled"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_on_start_called_before_each_handler(self) -> None:
+        events: list[str] = []
+
+        def handler(item: dict) -> LoginResult:
+            events.append(f"run {item['account_id']}")
+            return LoginResult(success=True)
+
+        await process_batch(_make_items(2), handler, on_start=lambda item: events.append(f"start {item.key[0]}"))
+        assert events == ["start 000000000001", "run 000000000001", "start 000000000002", "run 000000000002"]
+
+
+class TestRunBatch:
+    def test_sync_handlers_run_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=5)
+
+        def handler(item: dict) -> LoginResult:
+            # Only passes if all three handlers are in flight at once.
+            barrier.wait()
+            return LoginResult(success=True)
+
+        result = run_batch(_make_items(3), handler, max_concurrency=3)
+        assert result.succeeded == 3
+        assert [r.account_id for r in result.results] == [f"{i:012d}" for i in range(1, 4)]
+
+    def test_async_handler(self) -> None:
+        async def handler(item: dict) -> LoginResult:
+            await asyncio.sleep(0)
+            return LoginResult(success=item["account_id"] != "000000000002", error="denied")
+
+        result = run_batch(_make_items(3), handler)
+        assert [r.success for r in result.results] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_inside_running_loop(self) -> None:
+        result = run_batch(_make_items(2), lambda item: LoginResult(success=True))
+        assert result.succeeded == 2
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self) -> None:
+        async def handler(item: dict) -> LoginResult:
+            await asyncio.sleep(0.02 * (4 - int(item["account_id"])))
+            return LoginResult(success=True)
+
+        results = [r.account_id async for r in aiter_logins(_make_items(3), handler, max_concurrency=3)]
+        assert results == ["000000000003", "000000000002", "000000000001"]
+
+    @pytest.mark.asyncio
+    async def test_consumer_paces_dispatch(self) -> None:
+        started: list[str] = []
+
+        async def handler(item: dict) -> LoginResult:
+            started.append(item["account_id"])
+            return LoginResult(success=True)
+
+        stream = aiter_logins(_make_items(20), handler, max_concurrency=2)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        assert len(started) == 5
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_only_claimed_items_hold_slots(self) -> None:
+        async def handler(item: dict) -> LoginResult:
+            await asyncio.sleep(10)
+            return LoginResult(success=True)
+
+        reported: list[tuple[int, bool]] = []
+        await _dispatch(
+            _make_items(3),
+            handler,
+            lambda index, result, held: reported.append((index, held)),
+            max_concurrency=1,
+            on_start=None,
+            rate_limiter=None,
+            retry=None,
+            login_cache=None,
+            item_timeout=None,
+            batch_timeout=0.05,
+            executor=None,
+            priority=None,
+            latency_history=None,
+            slots=asyncio.Semaphore(2),
+        )
+        assert reported == [(0, True), (1, False), (2, False)]
+
+    @pytest.mark.asyncio
+    async def test_leaving_early_cancels_the_rest(self) -> None:
+        cancelled: list[str] = []
+
+        async def handler(item: dict) -> LoginResult:
+            if item["account_id"] != "000000000001":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(item["account_id"])
+                    raise
+            return LoginResult(success=True)
+
+        async with aclosing(aiter_logins(_make_items(5), handler, max_concurrency=3)) as stream:
+            async for result in stream:
+                assert result.account_id == "000000000001"
+                break
+        assert sorted(cancelled) == ["000000000002", "000000000003", "000000000004"]
+        assert not _in_flight
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_are_results_and_other_errors_propagate(self) -> None:
+        def handler(item: dict) -> LoginResult:
+            raise RuntimeError("boom")
+
+        assert [r.error async for r in aiter_logins(_make_items(2), handler)] == ["boom", "boom"]
+        with pytest.raises(ValueError, match="max_concurrency"):
+            async for _ in aiter_logins(_make_items(2), handler, max_concurrency=0):
+                pass
+
+    def test_sync_consumer_overlaps_with_logins(self) -> None:
+        first_taken = threading.Event()
+
+        def handler(item: dict) -> LoginResult:
+            # Later items only finish once the caller has the first result.
+            if item["account_id"] != "000000000001":
+                assert first_taken.wait(timeout=5)
+            return LoginResult(success=True)
+
+        seen = []
+        for result in iter_logins(_make_items(4), handler, max_concurrency=2):
+            seen.append(result.account_id)
+            first_taken.set()
+        assert sorted(seen) == [f"{i:012d}" for i in range(1, 5)]
+        assert seen[0] == "000000000001"
+
+    def test_sync_leaving_early_does_not_wait_for_hung_handlers(self) -> None:
+        release = threading.Event()
+
+        def handler(item: dict) -> LoginResult:
+            if item["account_id"] != "000000000001":
+                release.wait(timeout=5)
+            return LoginResult(success=True)
+
+        begin = time.monotonic()
+        try:
+            for _ in iter_logins(_make_items(3), handler, max_concurrency=3):
+                break
+            assert time.monotonic() - begin < 2
+        finally:
+            release.set()
+
+
+class TestExecutors:
+    @pytest.mark.asyncio
+    async def test_user_thread_pool(self) -> None:
+        threads: list[str] = []
+
+        def handler(item: dict) -> LoginResult:
+            threads.append(threading.current_thread().name)
+            return LoginResult(success=True)
+
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="login") as pool:
+            result = await process_batch(_make_items(4), handler, max_concurrency=4, executor=pool)
+        assert result.succeeded == 4
+        assert all(name.startswith("login") for name in threads)
+
+    def test_process_pool(self) -> None:
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as pool:
+            result = run_batch(_make_items(3), _login_in_worker_process, executor=pool)
+        assert [(r.success, r.error) for r in result.results] == [(True, "denied"), (False, "denied"), (True, "denied")]
+        assert os.getpid() not in {r.payload for r in result.results}
+
+    @pytest.mark.asyncio
+    async def test_async_handlers_ignore_executor(self) -> None:
+        async def handler(item: dict) -> LoginResult:
+            return LoginResult(success=True)
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.shutdown()
+            result = await process_batch(_make_items(2), handler, executor=pool)
+        assert result.succeeded == 2
+
+    def test_default_threads_scale_past_loop_pool(self) -> None:
+        # The loop's default pool has min(32, cpu + 4) workers.
+        count = min(32, (os.cpu_count() or 1) + 4) + 4
+        barrier = threading.Barrier(count, timeout=5)
+
+        def handler(item: dict) -> LoginResult:
+            barrier.wait()
+            time.sleep(0.2)
+            return LoginResult(success=True)
+
+        begin = time.monotonic()
+        result = run_batch(_make_items(count), handler, max_concurrency=count)
+        assert result.succeeded == count
+        assert time.monotonic() - begin < 1.5
+
+    def test_retry_does_not_queue_behind_abandoned_thread(self) -> None:
+        release = threading.Event()
+        calls = 0
+
+        def handler(item: dict) -> LoginResult:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                release.wait(timeout=5)
+            return LoginResult(success=True)
+
+        try:
+            result = run_batch(_make_items(1), handler, item_timeout=0.2, retry=RetryPolicy(base_delay=0, jitter=False))
+            assert [(r.success, r.attempts) for r in result.results] == [(True, 2)]
+        finally:
+            release.set()
+
+    def test_run_batch_does_not_wait_for_abandoned_threads(self) -> None:
+        release = threading.Event()
+
+        def handler(item: dict) -> LoginResult:
+            release.wait(timeout=5)
+            return LoginResult(success=True)
+
+        begin = time.monotonic()
+        try:
+            result = run_batch(_make_items(1), handler, item_timeout=0.05)
+            assert time.monotonic() - begin < 2
+            assert result.results[0].timed_out
+        finally:
+            release.set()
+
+
+class TestScheduling:
+    @staticmethod
+    def _record_starts(starts: list[str]) -> Callable[[dict], LoginResult]:
+        def handler(item: dict) -> LoginResult:
+            starts.append(item["account_id"][-1])
+            return LoginResult(success=True)
+
+        return handler
+
+    @pytest.mark.asyncio
+    async def test_slowest_recorded_first_and_results_in_input_order(self, tmp_path: Path) -> None:
+        history = HistoryManager(config_dir=tmp_path)
+        history.record_latencies([("000000000001", "Admin", 1.0), ("000000000003", "Admin", 9.0)])
+        starts: list[str] = []
+        result = await process_batch(_make_items(4), self._record_starts(starts), latency_history=history)
+        # Items 2 and 4 have no history and are taken to be average (5s).
+        assert starts == ["3", "2", "4", "1"]
+        assert [r.account_id[-1] for r in result.results] == ["1", "2", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_priority_before_latency(self, tmp_path: Path) -> None:
+        history = HistoryManager(config_dir=tmp_path)
+        history.record_latencies([("000000000001", "Admin", 1.0), ("000000000003", "Admin", 9.0)])
+        starts: list[str] = []
+        favorites = {"000000000001", "000000000002"}
+        await process_batch(
+            _make_items(4),
+            self._record_starts(starts),
+            priority=lambda item: item.account.account_id not in favorites,
+            latency_history=history,
+        )
+        assert starts == ["2", "1", "3", "4"]
+
+    @pytest.mark.asyncio
+    async def test_priority_alone_is_stable(self) -> None:
+        starts: list[str] = []
+        await process_batch(
+            _make_items(4), self._record_starts(starts), priority=lambda item: item.account.account_id == "000000000002"
+        )
+        assert starts == ["1", "3", "4", "2"]
+
+    @pytest.mark.asyncio
+    async def test_successful_login_times_are_recorded(self, tmp_path: Path) -> None:
+        history = HistoryManager(config_dir=tmp_path)
+
+        async def handler(item: dict) -> LoginResult:
+            await asyncio.sleep(0.02)
+            return LoginResult(success=item["account_id"] != "000000000002")
+
+        result = await process_batch(_make_items(2), handler, latency_history=history)
+        assert result.results[0].elapsed >= 0.02
+        latencies = history.get_latencies()
+        assert list(latencies) == [("000000000001", "Admin")]
+        assert latencies["000000000001", "Admin"] == pytest.approx(result.results[0].elapsed)
+
+    @pytest.mark.asyncio
+    async def test_history_is_read_and_written_off_loop(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        history = HistoryManager(config_dir=tmp_path)
+        threads: dict[str, int] = {}
+        for name in ("get_latencies", "record_latencies"):
+            method = getattr(history, name)
+
+            def spy(*args: object, _name: str = name, _method: Callable = method) -> object:
+                threads[_name] = threading.get_ident()
+                return _method(*args)
+
+            monkeypatch.setattr(history, name, spy)
+        await process_batch(_make_items(2), lambda item: LoginResult(success=True), latency_history=history)
+        assert set(threads) == {"get_latencies", "record_latencies"}
+        assert threading.get_ident() not in threads.values()
+
+
+class TestRateLimiting:
+    @pytest.mark.asyncio
+    async def test_throttled_results_slow_the_limiter(self) -> None:
+        limiter = RateLimiter(rate=1000, burst=10)
+
+        def handler(item: dict) -> LoginResult:
+            if item["account_id"] == "000000000002":
+                return LoginResult(success=False, error="Rate exceeded", throttled=True)
+            return LoginResult(success=True)
+
+        result = await process_batch(_make_items(3), handler, rate_limiter=limiter)
+        assert [r.throttled for r in result.results] == [False, True, False]
+        assert result.results[1].to_dict()["throttled"] is True
+        assert "throttled" not in result.results[0].to_dict()
+        assert limiter.rate < 1000
+
+    @pytest.mark.asyncio
+    async def test_throttling_exception_is_flagged(self) -> None:
+        def handler(item: dict) -> LoginResult:
+            exc = RuntimeError("Rate exceeded")
+            exc.response = {"Error": {"Code": "Throttling"}}  # type: ignore[attr-defined]
+            raise exc
+
+        result = await process_batch(_make_items(1), handler)
+        assert result.results[0].throttled is True
+        assert result.results[0].error == "Rate exceeded"
+
+    @pytest.mark.asyncio
+    async def test_dispatch_is_paced(self) -> None:
+        loop = asyncio.get_running_loop()
+        started: list[float] = []
+
+        def on_start(item: AccountRole) -> None:
+            started.append(loop.time())
+
+        limiter = RateLimiter(rate=50, burst=1)
+        await process_batch(
+            _make_items(4),
+            lambda item: LoginResult(success=True),
+            max_concurrency=4,
+            on_start=on_start,
+            rate_limiter=limiter,
+        )
+        # One token up front, then one every 20 ms.
+        assert started[-1] - started[0] >= 0.05
+
+
+class TestRetries:
+    @pytest.mark.asyncio
+    async def test_retryable_failures_are_retried(self) -> None:
+        calls: dict[str, int] = {}
+
+        def handler(item: dict) -> LoginResult:
+            calls[item["account_id"]] = calls.get(item["account_id"], 0) + 1
+            if item["account_id"] == "000000000001" and calls["000000000001"] < 3:
+                raise ConnectionResetError("connection reset")
+            if item["account_id"] == "000000000002":
+                return LoginResult(success=False, error="AccessDenied")
+            return LoginResult(success=True)
+
+        policy = RetryPolicy(max_attempts=3, base_delay=0, jitter=False)
+        result = await process_batch(_make_items(3), handler, retry=policy)
+        assert [(r.success, r.attempts) for r in result.results] == [(True, 3), (False, 1), (True, 1)]
+        assert result.results[0].to_dict()["attempts"] == 3
+        assert "attempts" not in result.results[1].to_dict()
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self) -> None:
+        calls = 0
+
+        async def handler(item: dict) -> LoginResult:
+            nonlocal calls
+            calls += 1
+            return LoginResult(success=False, error="blip", retryable=True)
+
+        result = await process_batch(_make_items(1), handler, retry=RetryPolicy(max_attempts=4, base_delay=0))
+        assert calls == 4
+        assert result.results[0].attempts == 4
+        assert result.results[0].error == "blip"
+
+    @pytest.mark.asyncio
+    async def test_no_policy_means_one_attempt(self) -> None:
+        def handler(item: dict) -> LoginResult:
+            raise ConnectionResetError("connection reset")
+
+        result = await process_batch(_make_items(1), handler)
+        assert result.results[0].attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_backoff(self) -> None:
+        attempted = asyncio.Event()
+
+        def handler(item: dict) -> LoginResult:
+            attempted.set()
+            return LoginResult(success=False, retryable=True)
+
+        policy = RetryPolicy(base_delay=10, jitter=False)
+        task = asyncio.ensure_future(process_batch(_make_items(1), handler, retry=policy))
+        await attempted.wait()
+        await asyncio.sleep(0.01)
+        task.cancel()
+        result = await task
+        assert [(r.error, r.attempts) for r in result.results] == [("Cancelled", 1)]
+
+
+class TestLoginCache:
+    @pytest.mark.asyncio
+    async def test_cached_logins_skip_the_handler(self) -> None:
+        cache = LoginCache()
+        calls: list[str] = []
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+
+        def handler(item: dict) -> LoginResult:
+            calls.append(item["account_id"])
+            return LoginResult(success=True, expires_at=expires_at, payload=item["account_id"])
+
+        first = await process_batch(_make_items(2), handler, login_cache=cache)
+        assert [r.cached for r in first.results] == [False, False]
+        second = await process_batch(_make_items(3), handler, login_cache=cache)
+        assert calls == ["000000000001", "000000000002", "000000000003"]
+        assert [(r.cached, r.attempts) for r in second.results] == [(True, 0), (True, 0), (False, 1)]
+        assert second.results[0].payload == "000000000001"
+        assert second.results[0].to_dict()["cached"] is True
+        assert second.results[0].to_dict()["expires_at"] == expires_at.isoformat()
+        assert "payload" not in second.results[0].to_dict()
+
+    @pytest.mark.asyncio
+    async def test_results_without_expiry_are_not_cached(self) -> None:
+        cache = LoginCache()
+        await process_batch(_make_items(1), lambda item: LoginResult(success=True), login_cache=cache)
+        assert cache.get("000000000001", "Admin") is None
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_is_read_and_written_off_loop(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = LoginCache(tmp_path, persist=True)
+        threads: dict[str, int] = {}
+        for name in ("get_many", "put_many"):
+            method = getattr(cache, name)
+
+            def spy(*args: object, _name: str = name, _method: Callable = method) -> object:
+                threads[_name] = threading.get_ident()
+                return _method(*args)
+
+            monkeypatch.setattr(cache, name, spy)
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        await process_batch(
+            _make_items(2), lambda item: LoginResult(success=True, expires_at=expires_at), login_cache=cache
+        )
+        assert set(threads) == {"get_many", "put_many"}
+        assert threading.get_ident() not in threads.values()
+        assert LoginCache(tmp_path, persist=True).get("000000000002", "Admin") is not None
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self) -> None:
+        calls = 0
+        release = threading.Event()
+        calls_lock = threading.Lock()
+
+        def handler(item: dict) -> LoginResult:
+            nonlocal calls
+            with calls_lock:
+                calls += 1
+            release.wait(5)
+            return LoginResult(success=True, payload="session")
+
+        batches: list[BatchLoginResult] = []
+
+        def run() -> None:
+            batches.append(run_batch(_make_items(1), handler))
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while not _in_flight:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert calls == 1
+        assert [batch.results[0].payload for batch in batches] == ["session"] * 4
+        assert len({id(batch.results[0]) for batch in batches}) == 4
+        assert not _in_flight
+
+    @pytest.mark.asyncio
+    async def test_waiter_honours_its_item_timeout(self) -> None:
+        release = asyncio.Event()
+
+        async def handler(item: dict) -> LoginResult:
+            await release.wait()
+            return LoginResult(success=True)
+
+        leader = asyncio.ensure_future(process_batch(_make_items(1), handler))
+        await asyncio.sleep(0)
+        begin = time.monotonic()
+        try:
+            waiter = await asyncio.wait_for(process_batch(_make_items(1), handler, item_timeout=0.1), 5)
+        finally:
+            release.set()
+        assert time.monotonic() - begin < 1
+        assert [(r.success, r.timed_out, r.attempts) for r in waiter.results] == [(False, True, 0)]
+        # The shared call is not cancelled by the waiter giving up.
+        assert (await leader).succeeded == 1
+        assert not _in_flight
+
+    @pytest.mark.asyncio
+    async def test_different_handlers_are_not_merged(self) -> None:
+        calls: list[str] = []
+
+        async def first(item: dict) -> LoginResult:
+            calls.append("first")
+            await asyncio.sleep(0.01)
+            return LoginResult(success=True)
+
+        async def second(item: dict) -> LoginResult:
+            calls.append("second")
+            await asyncio.sleep(0.01)
+            return LoginResult(success=True)
+
+        await asyncio.gather(process_batch(_make_items(1), first), process_batch(_make_items(1), second))
+        assert sorted(calls) == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_over_when_leader_is_cancelled(self) -> None:
+        calls = 0
+        started = asyncio.Event()
+
+        async def handler(item: dict) -> LoginResult:
+            nonlocal calls
+            calls += 1
+            started.set()
+            await asyncio.sleep(0.05)
+            return LoginResult(success=True)
+
+        leader = asyncio.ensure_future(process_batch(_make_items(1), handler))
+        await started.wait()
+        waiter = asyncio.ensure_future(process_batch(_make_items(1), handler))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert (await leader).results[0].error == "Cancelled"
+        assert (await waiter).results[0].success is True
+        assert calls == 2
+
+
+class TestTimeouts:
+    @pytest.mark.asyncio
+    async def test_item_timeout_fails_only_the_slow_item(self) -> None:
+        async def handler(item: dict) -> LoginResult:
+            if item["account_id"] == "000000000001":
+                await asyncio.sleep(10)
+            return LoginResult(success=True)
+
+        result = await process_batch(_make_items(3), handler, max_concurrency=1, item_timeout=0.05)
+        assert [(r.success, r.timed_out) for r in result.results] == [(False, True), (True, False), (True, False)]
+        assert result.results[0].error == "Timed out after 0.05s"
+        assert result.results[0].to_dict()["timed_out"] is True
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_timeout(self) -> None:
+        release = threading.Event()
+
+        def handler(item: dict) -> LoginResult:
+            release.wait(5)
+            return LoginResult(success=True)
+
+        try:
+            result = await process_batch(_make_items(1), handler, item_timeout=0.05)
+        finally:
+            release.set()
+        assert result.results[0].timed_out is True
+
+    @pytest.mark.asyncio
+    async def test_handler_timeout_error_is_not_an_overrun(self) -> None:
+        def handler(item: dict) -> LoginResult:
+            raise TimeoutError("read timed out")
+
+        result = await process_batch(_make_items(1), handler, item_timeout=5)
+        assert result.results[0].error == "read timed out"
+        assert result.results[0].timed_out is False
+
+    @pytest.mark.asyncio
+    async def test_timeouts_are_retried(self) -> None:
+        calls = 0
+
+        async def handler(item: dict) -> LoginResult:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return LoginResult(success=True)
+
+        result = await process_batch(
+            _make_items(1), handler, item_timeout=0.05, retry=RetryPolicy(base_delay=0, jitter=False)
+        )
+        assert [(r.success, r.attempts) for r in result.results] == [(True, 2)]
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_with_deadline(self) -> None:
+        def handler(item: dict) -> LoginResult:
+            return LoginResult(success=True)
+
+        assert (await process_batch([], handler, batch_timeout=1)).total == 0
+        assert [r async for r in aiter_logins([], handler, batch_timeout=1)] == []
+        assert list(iter_logins([], handler, batch_timeout=1)) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_deadline_reports_every_unfinished_item(self) -> None:
+        progress: list[str] = []
+
+        async def handler(item: dict) -> LoginResult:
+            if item["account_id"] != "000000000001":
+                await asyncio.sleep(10)
+            return LoginResult(success=True)
+
+        result = await process_batch(
+            _make_items(4),
+            handler,
+            on_progress=lambda r: progress.append(r.account_id),
+            max_concurrency=2,
+            batch_timeout=0.1,
+        )
+        assert [(r.success, r.error) for r in result.results] == [
+            (True, None),
+            (False, DEADLINE_ERROR),
+            (False, DEADLINE_ERROR),
+            (False, DEADLINE_ERROR),
+        ]
+        assert all(r.timed_out for r in result.results[1:])
+        assert [r.attempts for r in result.results[1:]] == [1, 1, 0]
+        assert sorted(progress) == [f"{i:012d}" for i in range(1, 5)]
@@ -0,0 +1,92 @@
+"""Unit tests for the login result cache."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aws_pick.core.login_cache import LoginCache
+from aws_pick.models.selection import LoginResult
+
+_NOW = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = _NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _ok(minutes: int, payload: object = None) -> LoginResult:
+    return LoginResult(success=True, expires_at=_NOW + timedelta(minutes=minutes), payload=payload)
+
+
+class TestInMemory:
+    def test_hit_until_margin_before_expiry(self) -> None:
+        clock = FakeClock()
+        cache = LoginCache(clock=clock)
+        cache.put("111111111111", "Admin", _ok(60, payload={"token": "t"}))
+        hit = cache.get("111111111111", "Admin")
+        assert hit is not None and hit.success
+        assert hit.payload == {"token": "t"}
+        clock.now = _NOW + timedelta(minutes=59, seconds=1)
+        assert cache.get("111111111111", "Admin") is None
+
+    def test_only_successes_with_expiry_are_cached(self) -> None:
+        cache = LoginCache(clock=FakeClock())
+        cache.put("111111111111", "Admin", LoginResult(success=True))
+        cache.put("111111111111", "ReadOnly", LoginResult(success=False, expires_at=_NOW + timedelta(hours=1)))
+        assert cache.get("111111111111", "Admin") is None
+        assert cache.get("111111111111", "ReadOnly") is None
+
+    def test_naive_expiry_is_utc(self) -> None:
+        cache = LoginCache(clock=FakeClock())
+        cache.put("111111111111", "Admin", LoginResult(success=True, expires_at=datetime(2026, 1, 1, 13, 0)))
+        hit = cache.get("111111111111", "Admin")
+        assert hit is not None and hit.expires_at == _NOW + timedelta(hours=1)
+
+    def test_invalidate_and_clear(self) -> None:
+        cache = LoginCache(clock=FakeClock())
+        cache.put_many([("111111111111", "Admin", _ok(60)), ("222222222222", "Admin", _ok(60))])
+        cache.invalidate("111111111111", "Admin")
+        assert cache.get("111111111111", "Admin") is None
+        assert cache.get("222222222222", "Admin") is not None
+        cache.clear()
+        assert cache.get("222222222222", "Admin") is None
+
+
+class TestOnDisk:
+    def test_persisted_with_private_permissions(self, tmp_path: Path) -> None:
+        LoginCache(tmp_path, persist=True, clock=FakeClock()).put("111111111111", "Admin", _ok(60, ["k"]))
+        path = tmp_path / "login_cache.json"
+        assert path.stat().st_mode & 0o777 == 0o600
+        hit = LoginCache(tmp_path, persist=True, clock=FakeClock()).get("111111111111", "Admin")
+        assert hit is not None and hit.payload == ["k"]
+
+    def test_expired_entries_are_dropped_on_write(self, tmp_path: Path) -> None:
+        clock = FakeClock()
+        cache = LoginCache(tmp_path, persist=True, clock=clock)
+        cache.put("111111111111", "Admin", _ok(10))
+        clock.now = _NOW + timedelta(minutes=30)
+        cache.put("222222222222", "Admin", LoginResult(success=True, expires_at=_NOW + timedelta(hours=1)))
+        entries = json.loads((tmp_path / "login_cache.json").read_text(encoding="utf-8"))["entries"]
+        assert list(entries) == ["222222222222:Admin"]
+
+    def test_unserialisable_payload_stays_in_memory(self, tmp_path: Path) -> None:
+        cache = LoginCache(tmp_path, persist=True, clock=FakeClock())
+        cache.put("111111111111", "Admin", _ok(60, payload=object()))
+        assert cache.get("111111111111", "Admin") is not None
+        assert LoginCache(tmp_path, persist=True, clock=FakeClock()).get("111111111111", "Admin") is None
+
+    def test_get_many_merges_memory_and_disk(self, tmp_path: Path) -> None:
+        LoginCache(tmp_path, persist=True, clock=FakeClock()).put("111111111111", "Admin", _ok(60, "disk"))
+        cache = LoginCache(tmp_path, persist=True, clock=FakeClock())
+        cache.put("222222222222", "Admin", _ok(60, "memory"))
+        hits = cache.get_many([("111111111111", "Admin"), ("222222222222", "Admin"), ("333333333333", "Admin")])
+        assert {key: hit.payload for key, hit in hits.items()} == {
+            ("111111111111", "Admin"): "disk",
+            ("222222222222", "Admin"): "memory",
+        }
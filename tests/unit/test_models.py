@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
+from collections.abc import Iterator
+
 import pytest
 
 from aws_pick.exceptions import InvalidAccountError
-from aws_pick.models.account import AccountRole, AwsAccount, AwsRole, deduplicate
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole, DedupeReport, deduplicate, iter_deduplicate
 from aws_pick.models.config import EnvironmentPattern, Favorite, HistoryEntry, Preset
 from aws_pick.models.selection import BatchLoginResult, ItemLoginResult, LoginResult, SelectionResult
 
@@ -162,6 +165,64 @@ class TestAccountRole:
         with pytest.raises(AttributeError):
             ar.role = AwsRole(role_name="Other")  # type: ignore[misc]
 
+    def test_key_cached_on_first_use(self) -> None:
+        ar = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="test"),
+            role=AwsRole(role_name="Admin"),
+        )
+        assert ar._key is None
+        assert ar.key == ("123456789012", "Admin")
+        assert ar.key is ar.key
+        assert hash(ar) == hash(ar.key)
+        assert AccountRole.__slots__ == ("account", "role", "_key", "_option_id", "_sort_key")
+
+    def test_option_id_and_sort_key_cached(self) -> None:
+        ar = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="test"),
+            role=AwsRole(role_name="Admin"),
+        )
+        assert ar.option_id == "123456789012:Admin"
+        assert ar.option_id is ar.option_id
+        assert ar.sort_key == ("test", "Admin")
+        assert ar.sort_key is ar.sort_key
+
+    def test_equality_and_hash_ignore_cached_fields(self) -> None:
+        first = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="test"),
+            role=AwsRole(role_name="Admin"),
+        )
+        second = AccountRole.from_dict(first.to_dict())
+        _ = first.option_id
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+        assert "_option_id" not in repr(first)
+
+    def test_not_equal_when_name_differs(self) -> None:
+        first = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="test"),
+            role=AwsRole(role_name="Admin"),
+        )
+        second = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="renamed"),
+            role=AwsRole(role_name="Admin"),
+        )
+        assert first != second
+        assert first.key == second.key
+        assert first != "123456789012:Admin"
+
+    def test_pickle_round_trip(self) -> None:
+        import pickle
+
+        ar = AccountRole(
+            account=AwsAccount(account_id="123456789012", account_name="test"),
+            role=AwsRole(role_name="Admin"),
+        )
+        restored = pickle.loads(pickle.dumps(ar))
+        assert restored == ar
+        assert restored.key == ar.key
+        assert ar.__reduce__() == (AccountRole, (ar.account, ar.role))
+
 
 # --- deduplicate ---
 
@@ -217,6 +278,61 @@ class TestDeduplicate:
         assert len(result) == 2
 
 
+def _ar(account_id: str, name: str, role: str) -> AccountRole:
+    return AccountRole(account=AwsAccount(account_id=account_id, account_name=name), role=AwsRole(role_name=role))
+
+
+class TestIterDeduplicate:
+    def test_is_lazy(self) -> None:
+        consumed: list[int] = []
+
+        def source() -> Iterator[AccountRole]:
+            for i in range(3):
+                consumed.append(i)
+                yield _ar("111111111111", "a", f"Role{i}")
+
+        stream = iter_deduplicate(source())
+        assert next(stream).role.role_name == "Role0"
+        assert consumed == [0]
+
+    def test_chained_sources_single_pass(self) -> None:
+        first = [_ar("111111111111", "a", "Admin"), _ar("222222222222", "b", "Admin")]
+        second = [_ar("222222222222", "b", "Admin"), _ar("333333333333", "c", "Admin")]
+        result = list(iter_deduplicate(itertools.chain(first, second)))
+        assert [ar.account.account_id for ar in result] == ["111111111111", "222222222222", "333333333333"]
+
+    def test_report_duplicates(self) -> None:
+        report = DedupeReport()
+        items = [_ar("111111111111", "a", "Admin")] * 3 + [_ar("222222222222", "b", "Admin")]
+        result = deduplicate(items, report)
+        assert len(result) == 2
+        assert report.duplicates == {("111111111111", "Admin"): 2}
+        assert report.duplicate_count == 2
+        assert report.conflicts == {}
+        assert not report.clean
+
+    def test_report_conflicting_names(self) -> None:
+        report = DedupeReport()
+        items = [
+            _ar("111111111111", "prod", "Admin"),
+            _ar("111111111111", "prod-legacy", "ReadOnly"),
+            _ar("111111111111", "prod", "Admin"),
+            _ar("111111111111", "production", "Admin"),
+        ]
+        result = list(iter_deduplicate(items, report))
+        assert [ar.role.role_name for ar in result] == ["Admin", "ReadOnly"]
+        assert report.conflicts == {"111111111111": ["prod", "prod-legacy", "production"]}
+        assert report.to_dict() == {
+            "duplicates": [{"account_id": "111111111111", "role_name": "Admin", "dropped": 2}],
+            "conflicts": {"111111111111": ["prod", "prod-legacy", "production"]},
+        }
+
+    def test_clean_report(self, small_account_list: list[AccountRole]) -> None:
+        report = DedupeReport()
+        assert deduplicate(small_account_list, report) == small_account_list
+        assert report.clean
+
+
 # --- Favorite ---
 
 
@@ -309,6 +425,13 @@ class TestHistoryEntry:
         original = HistoryEntry(account_id="123456789012", role_name="Admin", last_used="2026-01-26T10:00:00Z")
         assert HistoryEntry.from_dict(original.to_dict()) == original
 
+    def test_round_trip_with_login_seconds(self) -> None:
+        original = HistoryEntry(
+            account_id="123456789012", role_name="Admin", last_used="2026-01-26T10:00:00Z", login_seconds=1.5
+        )
+        assert original.to_dict()["login_seconds"] == 1.5
+        assert HistoryEntry.from_dict(original.to_dict()) == original
+
 
 # --- EnvironmentPattern ---
 
@@ -363,6 +486,46 @@ class TestSelectionResult:
         assert d["login_results"]["total"] == 1
         assert d["login_results"]["succeeded"] == 1
 
+    def test_from_items_selected_is_a_list(self, small_account_list: list[AccountRole]) -> None:
+        import json
+
+        sr = SelectionResult.from_items(small_account_list)
+        expected = [ar.to_dict() for ar in small_account_list]
+        assert isinstance(sr.selected, list)
+        assert sr.selected == expected
+        assert json.loads(json.dumps(sr.selected)) == expected
+        sr.selected.append({"account_id": "999999999999"})
+        assert len(sr.selected) == 4
+
+    def test_from_items_builds_dicts_on_first_read(
+        self, small_account_list: list[AccountRole], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        built: list[AccountRole] = []
+        to_dict = AccountRole.to_dict
+        monkeypatch.setattr(AccountRole, "to_dict", lambda self: built.append(self) or to_dict(self))
+        sr = SelectionResult.from_items(small_account_list)
+        assert len(sr.selected_items) == 3
+        assert built == []
+        assert sr.selected[0]["account_id"] == "111111111111"
+        assert built == small_account_list
+        assert sr.selected is sr.selected
+
+    def test_from_items_keeps_items(self, small_account_list: list[AccountRole]) -> None:
+        sr = SelectionResult.from_items(small_account_list)
+        assert sr.selected_items is small_account_list
+        assert sr == SelectionResult(selected=[ar.to_dict() for ar in small_account_list])
+
+    def test_to_dict_from_items(self, small_account_list: list[AccountRole]) -> None:
+        import json
+
+        d = SelectionResult.from_items(small_account_list).to_dict()
+        assert d["count"] == 3
+        assert json.loads(json.dumps(d))["selected"][0]["account_id"] == "111111111111"
+
+    def test_selected_items_from_dicts(self) -> None:
+        sr = SelectionResult(selected=[{"account_id": "123456789012", "account_name": "a", "role_name": "Admin"}])
+        assert [ar.key for ar in sr.selected_items] == [("123456789012", "Admin")]
+
 
 # --- LoginResult ---
 
@@ -378,6 +541,17 @@ class TestLoginResult:
         assert lr.success is False
         assert lr.error == "timeout"
 
+    def test_pickle_round_trip(self) -> None:
+        import pickle
+        from datetime import datetime, timezone
+
+        lr = LoginResult(
+            success=True, retryable=True, expires_at=datetime(2030, 1, 1, tzinfo=timezone.utc), payload={"k": "v"}
+        )
+        restored = pickle.loads(pickle.dumps(lr))
+        assert restored == lr
+        assert restored.payload == {"k": "v"}
+
 
 # --- BatchLoginResult ---
 
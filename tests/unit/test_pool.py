@@ -0,0 +1,127 @@
+"""Unit tests for the flyweight account pool and symbol table."""
+
+from __future__ import annotations
+
+import pytest
+
+from aws_pick.core.inventory import _validate_and_convert
+from aws_pick.exceptions import InvalidAccountError
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
+from aws_pick.models.pool import AccountPool, SymbolTable
+
+
+class TestSlottedModels:
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            AwsAccount(account_id="123456789012", account_name="a"),
+            AwsRole(role_name="Admin"),
+            AccountRole(
+                account=AwsAccount(account_id="123456789012", account_name="a"),
+                role=AwsRole(role_name="Admin"),
+            ),
+        ],
+    )
+    def test_no_instance_dict(self, instance: object) -> None:
+        assert not hasattr(instance, "__dict__")
+
+
+class TestSymbolTable:
+    def test_intern_returns_canonical_instance(self) -> None:
+        table = SymbolTable()
+        first = "".join(["Admin", "Access"])
+        second = "".join(["Admin", "Access"])
+        assert first is not second
+        assert table.intern(first) is first
+        assert table.intern(second) is first
+        assert len(table) == 1
+
+    def test_codes_are_dense(self) -> None:
+        table = SymbolTable()
+        assert [table.code(v) for v in ("b", "a", "b", "c")] == [0, 1, 0, 2]
+        assert table.value(1) == "a"
+        assert table.values == ["b", "a", "c"]
+        assert "a" in table
+
+    def test_folded_cached(self) -> None:
+        table = SymbolTable()
+        folded = table.folded("AdminAccess")
+        assert folded == "adminaccess"
+        assert table.folded("".join(["Admin", "Access"])) is folded
+
+
+class TestAccountPool:
+    def test_account_shared(self) -> None:
+        pool = AccountPool()
+        a = pool.account("123456789012", "prod", "production")
+        b = pool.account("123456789012", "prod", "production")
+        assert a is b
+        assert pool.account_count == 1
+
+    def test_distinct_names_not_merged(self) -> None:
+        pool = AccountPool()
+        a = pool.account("123456789012", "prod")
+        b = pool.account("123456789012", "prod-renamed")
+        assert a is not b
+
+    def test_role_shared(self) -> None:
+        pool = AccountPool()
+        assert pool.role("Admin") is pool.role("Admin")
+        assert pool.role_count == 1
+
+    def test_account_role(self) -> None:
+        pool = AccountPool()
+        first = pool.account_role("123456789012", "prod", "Admin")
+        second = pool.account_role("123456789012", "prod", "ReadOnly")
+        assert first.account is second.account
+        assert first == AccountRole.from_dict(
+            {"account_id": "123456789012", "account_name": "prod", "role_name": "Admin"}
+        )
+        assert len(pool) == 3
+
+    def test_validation_still_applies(self) -> None:
+        pool = AccountPool()
+        with pytest.raises(InvalidAccountError):
+            pool.account("bad", "prod")
+
+    def test_strings_interned(self) -> None:
+        pool = AccountPool()
+        first = pool.account_role("".join(["1234", "56789012"]), "prod", "".join(["Read", "Only"]))
+        second = pool.account_role("210987654321", "dev", "".join(["Read", "Only"]))
+        assert first.role.role_name is second.role.role_name
+        assert first.role.role_name in pool.symbols
+        assert pool.symbols.intern("123456789012") is first.account.account_id
+
+    def test_unvalidated_pool_skips_checks(self) -> None:
+        pool = AccountPool(validate=False)
+        assert pool.account("bad", "").account_id == "bad"
+        assert pool.role("").role_name == ""
+
+    def test_account_roles_bulk(self) -> None:
+        pool = AccountPool()
+        rows = pool.account_roles(
+            ["111111111111", "111111111111", "222222222222"],
+            ["a", "a", "b"],
+            ["Admin", "ReadOnly", "Admin"],
+            ["production", "production", None],
+        )
+        assert rows == [
+            pool.account_role("111111111111", "a", "Admin", "production"),
+            pool.account_role("111111111111", "a", "ReadOnly", "production"),
+            pool.account_role("222222222222", "b", "Admin"),
+        ]
+        assert rows[0].account is rows[1].account
+        assert rows[0].role is rows[2].role
+
+
+class TestPooledConversion:
+    def test_rows_share_account_and_role(self) -> None:
+        items = _validate_and_convert(
+            [
+                {"account_id": "111111111111", "account_name": "a", "role_name": "Admin"},
+                {"account_id": "111111111111", "account_name": "a", "role_name": "ReadOnly"},
+                {"account_id": "222222222222", "account_name": "b", "role_name": "Admin"},
+            ]
+        )
+        assert items[0].account is items[1].account
+        assert items[0].role is items[2].role
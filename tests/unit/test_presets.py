@@ -6,9 +6,10 @@ from pathlib import Path
 
 import pytest
 
-from aws_pick.core.presets import PresetsManager, manage_presets
+from aws_pick.core.presets import PresetsManager, manage_presets, resolve_presets
 from aws_pick.exceptions import PresetNotFoundError
-from aws_pick.models.config import Favorite
+from aws_pick.models.account import AccountRole
+from aws_pick.models.config import Favorite, Preset
 
 
 class TestPresetsManager:
@@ -70,8 +71,75 @@ class TestPresetsManager:
         mgr.save("beta", [Favorite(account_id="987654321098", role_name="ReadOnly")])
         assert mgr.list_names() == ["alpha", "beta"]
 
+    def test_get_many(self, tmp_path: Path) -> None:
+        mgr = PresetsManager(config_dir=tmp_path)
+        mgr.save("alpha", [Favorite(account_id="123456789012", role_name="Admin")])
+        mgr.save("beta", [Favorite(account_id="987654321098", role_name="ReadOnly")])
+        presets = mgr.get_many(["beta", "alpha"])
+        assert list(presets) == ["beta", "alpha"]
+        assert presets["alpha"].items[0].role_name == "Admin"
+
+    def test_get_many_nonexistent_raises(self, tmp_path: Path) -> None:
+        mgr = PresetsManager(config_dir=tmp_path)
+        mgr.save("alpha", [Favorite(account_id="123456789012", role_name="Admin")])
+        with pytest.raises(PresetNotFoundError, match="missing"):
+            mgr.get_many(["alpha", "missing"])
+
+
+class TestResolvePresets:
+    def test_resolves_each_preset(self, small_account_list: list[AccountRole]) -> None:
+        presets = {
+            "dev": [Favorite(account_id="111111111111", role_name="AdminAccess")],
+            "all-admin": [
+                Favorite(account_id="333333333333", role_name="AdminAccess"),
+                Favorite(account_id="111111111111", role_name="AdminAccess"),
+            ],
+        }
+        resolution = resolve_presets(small_account_list, presets)
+        assert resolution.complete
+        assert [ar.key for ar in resolution.resolved["dev"]] == [("111111111111", "AdminAccess")]
+        assert [ar.account.account_id for ar in resolution.resolved["all-admin"]] == ["333333333333", "111111111111"]
+
+    def test_reports_all_missing_keys(self, small_account_list: list[AccountRole]) -> None:
+        presets = {
+            "a": [
+                Favorite(account_id="111111111111", role_name="AdminAccess"),
+                Favorite(account_id="999999999999", role_name="Gone"),
+            ],
+            "b": [
+                Favorite(account_id="999999999999", role_name="Gone"),
+                Favorite(account_id="222222222222", role_name="AdminAccess"),
+            ],
+        }
+        resolution = resolve_presets(small_account_list, presets)
+        assert not resolution.complete
+        assert resolution.missing == [("999999999999", "Gone"), ("222222222222", "AdminAccess")]
+        assert resolution.missing_by_preset == {
+            "a": [("999999999999", "Gone")],
+            "b": [("999999999999", "Gone"), ("222222222222", "AdminAccess")],
+        }
+        assert [ar.key for ar in resolution.resolved["a"]] == [("111111111111", "AdminAccess")]
+        assert resolution.resolved["b"] == []
+
+    def test_accepts_preset_objects_and_dedupes(self, small_account_list: list[AccountRole]) -> None:
+        fav = Favorite(account_id="222222222222", role_name="ReadOnly")
+        resolution = resolve_presets(small_account_list, {"p": Preset(name="p", items=(fav, fav))})
+        assert len(resolution.resolved["p"]) == 1
+
 
 class TestManagePresets:
     def test_factory(self, tmp_path: Path) -> None:
         mgr = manage_presets(config_dir=tmp_path)
         assert isinstance(mgr, PresetsManager)
+
+    def test_factory_returns_shared_instance(self, tmp_path: Path) -> None:
+        assert manage_presets(config_dir=tmp_path) is manage_presets(config_dir=str(tmp_path))
+
+    def test_shares_store_with_favorites(self, tmp_path: Path) -> None:
+        from aws_pick.core.favorites import manage_favorites
+
+        presets = manage_presets(config_dir=tmp_path)
+        presets.save("p", [Favorite(account_id="123456789012", role_name="Admin")])
+        manage_favorites(config_dir=tmp_path).add("123456789012", "Admin")
+        assert presets.get("p").items == (Favorite(account_id="123456789012", role_name="Admin"),)
+        assert presets.list_names() == ["p"]
@@ -0,0 +1,89 @@
+"""Unit tests for the adaptive token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from aws_pick.core.ratelimit import RateLimiter, is_throttle_error
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_paced(self) -> None:
+        limiter = RateLimiter(rate=10, burst=3, clock=FakeClock())
+        assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.reserve() == pytest.approx(0.1)
+        assert limiter.reserve() == pytest.approx(0.2)
+
+    def test_refills_up_to_burst(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=2, clock=clock)
+        limiter.reserve()
+        limiter.reserve()
+        clock.now = 10.0
+        assert [limiter.reserve() for _ in range(2)] == [0.0, 0.0]
+        assert limiter.reserve() > 0
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [({"rate": 0}, "rate"), ({"rate": 1, "burst": 0}, "burst"), ({"rate": 1, "decrease": 1}, "decrease")],
+    )
+    def test_invalid_arguments(self, kwargs: dict, match: str) -> None:
+        with pytest.raises(ValueError, match=match):
+            RateLimiter(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_wait_within_burst(self) -> None:
+        limiter = RateLimiter(rate=1, burst=2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+
+class TestAdaptiveRate:
+    def test_throttle_halves_rate_and_stops_burst(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(rate=8, burst=4, clock=clock)
+        limiter.on_throttle()
+        assert limiter.rate == 4
+        assert limiter.reserve() == pytest.approx(0.25)
+
+    def test_throttles_within_one_interval_count_once(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(rate=8, clock=clock)
+        limiter.on_throttle()
+        limiter.on_throttle()
+        assert limiter.rate == 4
+        clock.now = 1.0
+        limiter.on_throttle()
+        assert limiter.rate == 2
+
+    def test_floor_and_recovery_to_ceiling(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(rate=4, min_rate=1, increase=1, clock=clock)
+        for step in range(5):
+            clock.now = float(step * 10)
+            limiter.on_throttle()
+        assert limiter.rate == 1
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.rate == 4
+
+
+class TestIsThrottleError:
+    def test_botocore_style_error(self) -> None:
+        exc = RuntimeError("Rate exceeded")
+        exc.response = {"Error": {"Code": "ThrottlingException"}}  # type: ignore[attr-defined]
+        assert is_throttle_error(exc)
+
+    def test_other_errors(self) -> None:
+        denied = RuntimeError("denied")
+        denied.response = {"Error": {"Code": "AccessDenied"}}  # type: ignore[attr-defined]
+        assert not is_throttle_error(denied)
+        assert not is_throttle_error(RuntimeError("boom"))
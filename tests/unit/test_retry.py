@@ -0,0 +1,40 @@
+"""Unit tests for the login retry policy."""
+
+from __future__ import annotations
+
+import pytest
+
+from aws_pick.core.retry import RetryPolicy
+from aws_pick.models.selection import LoginResult
+
+
+class TestDelay:
+    def test_exponential_and_capped(self) -> None:
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0, jitter=False)
+        assert [policy.delay(n) for n in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+    def test_full_jitter_scales_bound(self) -> None:
+        policy = RetryPolicy(base_delay=1.0)
+        assert policy.delay(3, rand=lambda: 0.25) == 1.0
+        assert policy.delay(3, rand=lambda: 0.0) == 0.0
+
+    @pytest.mark.parametrize("kwargs", [{"max_attempts": 0}, {"base_delay": -1}, {"max_delay": -1}])
+    def test_invalid(self, kwargs: dict) -> None:
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
+
+
+class TestShouldRetry:
+    def test_results(self) -> None:
+        policy = RetryPolicy()
+        assert policy.should_retry(LoginResult(success=False, error="blip", retryable=True))
+        assert policy.should_retry(LoginResult(success=False, throttled=True))
+        assert not policy.should_retry(LoginResult(success=False, error="AccessDenied"))
+        assert not policy.should_retry(LoginResult(success=True, retryable=True))
+
+    def test_exceptions(self) -> None:
+        policy = RetryPolicy()
+        assert policy.should_retry(ConnectionResetError())
+        assert policy.should_retry(TimeoutError())
+        assert not policy.should_retry(ValueError("bad role"))
+        assert RetryPolicy(retry_on=(ValueError,)).should_retry(ValueError("bad role"))
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from aws_pick.core.selector import _run_login, _run_non_interactive, _validate_and_convert, select_accounts
+from aws_pick.core.inventory import Inventory, _validate_and_convert
+from aws_pick.core.login import run_batch
+from aws_pick.core.retry import RetryPolicy
+from aws_pick.core.selector import _run_non_interactive, aselect_accounts, select_accounts
 from aws_pick.exceptions import InvalidAccountError, InvalidSelectionError
-from aws_pick.models.selection import LoginResult, SelectionResult
+from aws_pick.models.account import AccountRole
+from aws_pick.models.selection import BatchLoginResult, LoginResult, SelectionResult
 
 # --- Input validation ---
 
@@ -66,6 +73,68 @@ class TestValidateAndConvert:
             _validate_and_convert(accounts)
 
 
+class TestValidationModes:
+    _ACCOUNTS: list[dict[str, Any]] = [
+        {"account_id": "123456789012", "account_name": "a", "role_name": "Admin", "environment": "production"},
+        {"account_id": "123456789012", "account_name": "a", "role_name": "ReadOnly", "environment": "production"},
+        {"account_id": "210987654321", "account_name": "b", "role_name": "Admin"},
+    ]
+
+    @pytest.mark.parametrize("mode", ["fast", "trusted"])
+    def test_modes_match_full(self, mode: Any) -> None:
+        assert _validate_and_convert(self._ACCOUNTS, validate=mode) == _validate_and_convert(self._ACCOUNTS)
+
+    @pytest.mark.parametrize(
+        ("row", "match"),
+        [
+            ({"account_id": "12345", "account_name": "x", "role_name": "Admin"}, "12 digits"),
+            ({"account_id": "12345678901a", "account_name": "x", "role_name": "Admin"}, "12 digits"),
+            ({"account_id": "123456789012", "account_name": "   ", "role_name": "Admin"}, "account_name"),
+            ({"account_id": "123456789012", "account_name": "x", "role_name": ""}, "role_name"),
+            ({"account_id": "123456789012", "account_name": "x"}, "accounts\\[3\\] missing required field 'role_name'"),
+            ("not_a_dict", "accounts\\[3\\] must be a dict"),
+        ],
+    )
+    def test_fast_reports_same_errors_as_full(self, row: Any, match: str) -> None:
+        with pytest.raises(InvalidAccountError, match=match):
+            _validate_and_convert([*self._ACCOUNTS, row], validate="fast")
+
+    def test_fast_accepts_numeric_ids(self) -> None:
+        result = _validate_and_convert(
+            [{"account_id": 123456789012, "account_name": "a", "role_name": "Admin"}], validate="fast"
+        )
+        assert result[0].account.account_id == "123456789012"
+
+    def test_trusted_skips_checks(self) -> None:
+        result = _validate_and_convert(
+            [{"account_id": "bad", "account_name": "", "role_name": "Admin"}], validate="trusted"
+        )
+        assert result[0].account.account_id == "bad"
+
+    def test_unknown_mode(self) -> None:
+        with pytest.raises(ValueError, match="validate must be one of"):
+            _validate_and_convert(self._ACCOUNTS, validate="sloppy")  # type: ignore[arg-type]
+
+    def test_select_accounts_accepts_mode(self) -> None:
+        result = select_accounts(
+            self._ACCOUNTS, interactive=False, selections=["210987654321:Admin"], validate="trusted"
+        )
+        assert result.selected[0]["account_name"] == "b"
+
+    def test_gc_left_alone_while_reading_input(self) -> None:
+        import gc
+
+        seen: list[bool] = []
+
+        def rows() -> Iterator[dict[str, str]]:
+            for row in self._ACCOUNTS:
+                seen.append(gc.isenabled())
+                yield row
+
+        Inventory.from_dicts(rows(), validate="fast")
+        assert seen and all(seen)
+
+
 # --- Empty list handling ---
 
 
@@ -112,6 +181,11 @@ class TestNonInteractive:
         with pytest.raises(InvalidSelectionError, match="not found"):
             _run_non_interactive(items, ["000000000000:NoRole"])
 
+    def test_all_missing_selections_reported(self) -> None:
+        items = _validate_and_convert([{"account_id": "123456789012", "account_name": "a", "role_name": "Admin"}])
+        with pytest.raises(InvalidSelectionError, match="'000000000000:NoRole', '111111111111:Other'"):
+            _run_non_interactive(items, ["123456789012:Admin", "000000000000:NoRole", "111111111111:Other"])
+
     def test_multiple_selections(self) -> None:
         items = _validate_and_convert(
             [
@@ -122,6 +196,76 @@ class TestNonInteractive:
         result = _run_non_interactive(items, ["123456789012:Admin", "987654321098:ReadOnly"])
         assert len(result.selected) == 2
 
+    def test_account_table_input(self) -> None:
+        from aws_pick.models.table import AccountTable
+
+        table = AccountTable.from_dicts(
+            [
+                {"account_id": "123456789012", "account_name": "a", "role_name": "Admin"},
+                {"account_id": "987654321098", "account_name": "b", "role_name": "ReadOnly"},
+            ]
+        )
+        result = select_accounts(table, interactive=False, selections=["987654321098:ReadOnly"])
+        assert result.selected == [{"account_id": "987654321098", "account_name": "b", "role_name": "ReadOnly"}]
+        with pytest.raises(InvalidSelectionError, match="'123456789012:Nope'"):
+            select_accounts(table, interactive=False, selections=["123456789012:Nope"])
+
+    def test_account_table_patterns(self) -> None:
+        from aws_pick.models.table import AccountTable
+
+        table = AccountTable.from_dicts(
+            [
+                {"account_id": "123456789012", "account_name": "web-prod", "role_name": "Admin"},
+                {"account_id": "123456789012", "account_name": "web-prod", "role_name": "ReadOnly"},
+                {"account_id": "987654321098", "account_name": "web-dev", "role_name": "ReadOnly"},
+            ]
+        )
+        result = select_accounts(
+            table, interactive=False, selections=["env=production:Admin", "*:ReadOnly", "123456789012:Admin"]
+        )
+        assert [(row["account_name"], row["role_name"]) for row in result.selected] == [
+            ("web-prod", "Admin"),
+            ("web-prod", "ReadOnly"),
+            ("web-dev", "ReadOnly"),
+        ]
+        with pytest.raises(InvalidSelectionError, match="'re:\\^api-', 'env=staging'"):
+            select_accounts(table, interactive=False, selections=["re:^api-", "env=staging", "*:Admin"])
+
+    def test_exact_selections_stop_reading_once_found(self) -> None:
+        consumed: list[int] = []
+
+        def rows():  # type: ignore[no-untyped-def]
+            for i in range(1000):
+                consumed.append(i)
+                yield {"account_id": f"{100000000000 + i:012d}", "account_name": f"acct-{i}", "role_name": "Admin"}
+
+        result = select_accounts(
+            rows(), interactive=False, selections=["100000000005:Admin", "100000000002:Admin", "100000000005:Admin"]
+        )
+        assert [row["account_name"] for row in result.selected] == ["acct-5", "acct-2", "acct-5"]
+        assert consumed == list(range(6))
+
+    def test_exact_selections_skip_validation_of_other_rows(self) -> None:
+        accounts = [
+            {"account_id": "123456789012", "account_name": "a", "role_name": "Admin"},
+            {"account_id": "123456789012", "account_name": "dupe", "role_name": "Admin"},
+            {"account_id": "bad", "account_name": " ", "role_name": "Admin"},
+        ]
+        result = select_accounts(accounts, interactive=False, selections=["123456789012:Admin"])
+        assert result.selected[0]["account_name"] == "a"
+
+    def test_exact_selections_validate_selected_rows(self) -> None:
+        accounts = [{"account_id": "123456789012", "account_name": " ", "role_name": "Admin"}]
+        with pytest.raises(InvalidAccountError, match="account_name"):
+            select_accounts(accounts, interactive=False, selections=["123456789012:Admin"])
+        with pytest.raises(InvalidAccountError, match="accounts\\[0\\] missing required field 'role_name'"):
+            select_accounts([{"account_id": "123456789012"}], interactive=False, selections=["123456789012:Admin"])
+
+    def test_exact_selections_report_all_missing_after_full_scan(self) -> None:
+        accounts = [{"account_id": "123456789012", "account_name": "a", "role_name": "Admin"}]
+        with pytest.raises(InvalidSelectionError, match="'123456789012:Nope', 'x'"):
+            select_accounts(accounts, interactive=False, selections=["123456789012:Admin", "123456789012:Nope", "x"])
+
     def test_requires_selections_param(self) -> None:
         with pytest.raises(ValueError, match="selections parameter is required"):
             select_accounts(
@@ -143,6 +287,10 @@ class TestNonInteractive:
 # --- Login handler ---
 
 
+def _run_login(selected: list[dict[str, Any]], handler: Any) -> BatchLoginResult:
+    return run_batch([AccountRole.from_dict(d) for d in selected], handler, max_concurrency=1)
+
+
 class TestLoginHandler:
     def test_successful_login(self) -> None:
         selected = [{"account_id": "123456789012", "account_name": "test", "role_name": "Admin"}]
@@ -200,3 +348,94 @@ class TestLoginHandler:
         )
         assert result.login_results is not None
         assert result.login_results.succeeded == 1
+
+    def test_on_login_builds_one_dict_per_login(self) -> None:
+        accounts = [{"account_id": f"{i:012d}", "account_name": f"acct-{i}", "role_name": "Admin"} for i in range(1, 5)]
+        to_dict = AccountRole.to_dict
+        with patch.object(AccountRole, "to_dict", autospec=True, side_effect=to_dict) as spy:
+            result = select_accounts(
+                accounts, interactive=False, selections=["*:Admin"], on_login=lambda _: LoginResult(success=True)
+            )
+            assert spy.call_count == 4
+            assert len(result.selected) == 4
+            assert spy.call_count == 8
+
+    def test_on_login_runs_concurrently_in_selection_order(self) -> None:
+        accounts = [{"account_id": f"{i:012d}", "account_name": f"acct-{i}", "role_name": "Admin"} for i in range(1, 5)]
+        barrier = threading.Barrier(4, timeout=5)
+
+        def handler(item: dict[str, Any]) -> LoginResult:
+            barrier.wait()
+            return LoginResult(success=True)
+
+        result = select_accounts(
+            accounts, interactive=False, selections=["*:Admin"], on_login=handler, max_concurrency=4
+        )
+        assert result.login_results is not None
+        assert [r.account_id for r in result.login_results.results] == [a["account_id"] for a in accounts]
+
+    def test_on_login_retries_transient_failures(self) -> None:
+        accounts = [{"account_id": "123456789012", "account_name": "test", "role_name": "Admin"}]
+        outcomes = [LoginResult(success=False, error="blip", retryable=True), LoginResult(success=True)]
+        result = select_accounts(
+            accounts,
+            interactive=False,
+            selections=["123456789012:Admin"],
+            on_login=lambda _: outcomes.pop(0),
+            retry=RetryPolicy(base_delay=0),
+        )
+        assert result.login_results is not None
+        assert [(r.success, r.attempts) for r in result.login_results.results] == [(True, 2)]
+
+
+# --- Async API ---
+
+
+class TestAselectAccounts:
+    _ACCOUNTS = [
+        {"account_id": "123456789012", "account_name": "a", "role_name": "Admin"},
+        {"account_id": "987654321098", "account_name": "b", "role_name": "ReadOnly"},
+    ]
+
+    async def test_non_interactive_with_async_login(self) -> None:
+        seen: list[str] = []
+
+        async def on_login(item: dict[str, Any]) -> LoginResult:
+            seen.append(item["account_id"])
+            return LoginResult(success=item["role_name"] == "Admin", error=None)
+
+        result = await aselect_accounts(
+            self._ACCOUNTS,
+            interactive=False,
+            selections=["987654321098:ReadOnly", "123456789012:Admin"],
+            on_login=on_login,
+        )
+        assert sorted(seen) == ["123456789012", "987654321098"]
+        assert result.login_results is not None
+        assert [(r.account_id, r.success) for r in result.login_results.results] == [
+            ("987654321098", False),
+            ("123456789012", True),
+        ]
+
+    async def test_selection_runs_off_loop(self) -> None:
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+
+        def rows():  # type: ignore[no-untyped-def]
+            threads.append(threading.get_ident())
+            yield from self._ACCOUNTS
+
+        result = await aselect_accounts(rows(), interactive=False, selections=["123456789012:Admin"])
+        assert len(result.selected) == 1
+        assert threads and loop_thread not in threads
+
+    async def test_errors_propagate(self) -> None:
+        with pytest.raises(InvalidSelectionError):
+            await aselect_accounts(self._ACCOUNTS, interactive=False, selections=["000000000000:Nope"])
+
+    async def test_interactive_uses_run_async(self) -> None:
+        expected = SelectionResult(cancelled=True)
+        with patch("aws_pick.core.selector._arun_interactive", return_value=expected) as run:
+            result = await aselect_accounts(self._ACCOUNTS, on_login=lambda item: LoginResult(success=True))
+        assert result is expected
+        assert len(run.call_args.args[0]) == 2
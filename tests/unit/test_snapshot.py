@@ -0,0 +1,117 @@
+"""Unit tests for binary inventory snapshots."""
+
+from __future__ import annotations
+
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from aws_pick.exceptions import InvalidSnapshotError
+from aws_pick.models.account import AccountRole, AwsAccount, AwsRole
+from aws_pick.models.snapshot import InventorySnapshot
+from aws_pick.models.table import AccountTable
+
+
+def _items() -> list[AccountRole]:
+    return [
+        AccountRole(AwsAccount("000000000003", "prod-api", "production"), AwsRole("Admin")),
+        AccountRole(AwsAccount("000000000001", "dev-é", None), AwsRole("ReadOnly")),
+        AccountRole(AwsAccount("000000000001", "dev-é", None), AwsRole("Admin")),
+        AccountRole(AwsAccount("000000000002", "staging", "staging"), AwsRole("Deployer")),
+    ]
+
+
+def _lookup_in_child(name: str, queue: multiprocessing.Queue) -> None:  # type: ignore[type-arg]
+    with InventorySnapshot.attach(name) as snapshot:
+        queue.put((len(snapshot), snapshot.get("000000000002", "Deployer")))
+
+
+class TestRoundTrip:
+    def test_rows_match_source(self) -> None:
+        snapshot = InventorySnapshot(InventorySnapshot.dump(_items()))
+        assert list(snapshot) == _items()
+        assert snapshot[-1] == _items()[-1]
+        assert snapshot[1:3] == _items()[1:3]
+        assert snapshot.environment(1) is None
+        assert snapshot.account_name(1) == "dev-é"
+
+    def test_from_table(self) -> None:
+        table = AccountTable.from_items(_items())
+        snapshot = InventorySnapshot(InventorySnapshot.dump(table))
+        assert list(snapshot) == list(table)
+
+    def test_empty(self) -> None:
+        snapshot = InventorySnapshot(InventorySnapshot.dump([]))
+        assert len(snapshot) == 0
+        assert snapshot.get("000000000001", "Admin") is None
+
+    def test_index_out_of_range(self) -> None:
+        snapshot = InventorySnapshot(InventorySnapshot.dump(_items()))
+        with pytest.raises(IndexError):
+            snapshot[4]
+
+    def test_to_table(self) -> None:
+        table = InventorySnapshot(InventorySnapshot.dump(_items())).to_table()
+        assert list(table) == _items()
+        assert table.find("000000000001", "Admin") == 2
+        assert table.environment(0) == "production"
+
+
+class TestLookup:
+    def test_find_and_get(self) -> None:
+        snapshot = InventorySnapshot(InventorySnapshot.dump(_items()))
+        assert snapshot.find("000000000001", "Admin") == 2
+        assert snapshot.get("000000000003", "Admin") == _items()[0]
+        assert snapshot.get("000000000003", "ReadOnly") is None
+        assert snapshot.get("000000000009", "Admin") is None
+        assert snapshot.get("not-an-id", "Admin") is None
+        assert snapshot.get("\u00b2" * 12, "Admin") is None
+        assert snapshot.get("000000000001", "Missing") is None
+
+    def test_contains(self) -> None:
+        snapshot = InventorySnapshot(InventorySnapshot.dump(_items()))
+        assert _items()[3] in snapshot
+        assert AccountRole(AwsAccount("000000000002", "renamed", "staging"), AwsRole("Deployer")) not in snapshot
+        assert "000000000002:Deployer" not in snapshot
+
+
+class TestInvalid:
+    def test_wrong_magic(self) -> None:
+        with pytest.raises(InvalidSnapshotError, match="not an aws-pick"):
+            InventorySnapshot(b"x" * 64)
+
+    def test_too_small(self) -> None:
+        with pytest.raises(InvalidSnapshotError, match="too small"):
+            InventorySnapshot(b"AWSPICK")
+
+    def test_truncated(self) -> None:
+        data = InventorySnapshot.dump(_items())
+        with pytest.raises(InvalidSnapshotError, match="truncated"):
+            InventorySnapshot(data[: len(data) // 2])
+
+
+class TestFileAndSharedMemory:
+    def test_save_and_open(self, tmp_path: Path) -> None:
+        path = tmp_path / "inventory.snap"
+        InventorySnapshot.save(_items(), path)
+        with InventorySnapshot.open(path) as snapshot:
+            assert list(snapshot) == _items()
+            assert snapshot.shared_name is None
+        assert not path.with_suffix(".snap.tmp").exists()
+
+    def test_shared_memory_in_worker_process(self) -> None:
+        snapshot = InventorySnapshot.create_shared(_items())
+        try:
+            assert snapshot.shared_name is not None
+            context = multiprocessing.get_context("spawn")
+            queue = context.Queue()
+            worker = context.Process(target=_lookup_in_child, args=(snapshot.shared_name, queue))
+            worker.start()
+            count, found = queue.get(timeout=30)
+            worker.join(timeout=30)
+            assert worker.exitcode == 0
+            assert count == 4
+            assert found == _items()[3]
+        finally:
+            snapshot.unlink()
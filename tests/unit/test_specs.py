@@ -0,0 +1,85 @@
+"""Unit tests for selection spec parsing and matching."""
+
+from __future__ import annotations
+
+import pytest
+
+from aws_pick.core.specs import compile_specs, parse_spec
+from aws_pick.exceptions import InvalidSelectionError
+from aws_pick.models.account import AwsAccount
+
+
+class TestParseSpec:
+    def test_exact(self) -> None:
+        spec = parse_spec("111111111111:Admin")
+        assert spec.exact
+        assert spec.key == ("111111111111", "Admin")
+
+    def test_exact_without_role(self) -> None:
+        assert parse_spec("bogus").key == ("bogus", "")
+
+    def test_glob(self) -> None:
+        spec = parse_spec("prod-*:Admin*")
+        assert not spec.exact
+        assert spec.matches_account(AwsAccount("111111111111", "PROD-payments"))
+        assert not spec.matches_account(AwsAccount("111111111111", "dev-prod-payments"))
+        assert spec.matches_role("AdminAccess")
+        assert not spec.matches_role("admin")
+
+    def test_glob_account_id(self) -> None:
+        spec = parse_spec("1111*:ReadOnly")
+        assert spec.matches_account(AwsAccount("111122223333", "anything"))
+        assert not spec.matches_account(AwsAccount("211122223333", "anything"))
+
+    def test_star_matches_everything(self) -> None:
+        spec = parse_spec("*:*")
+        assert spec.account is None and spec.role is None
+        assert spec.matches_account(AwsAccount("111111111111", "a"))
+
+    def test_regex(self) -> None:
+        spec = parse_spec("re:^data-.*:.*Engineer$")
+        assert spec.matches_account(AwsAccount("111111111111", "data-lake"))
+        assert not spec.matches_account(AwsAccount("111111111111", "big-data-lake"))
+        assert spec.matches_role("DataEngineer")
+        assert not spec.matches_role("EngineerAdmin")
+
+    def test_regex_colon_in_group(self) -> None:
+        spec = parse_spec("re:^(?:data|ml)-.*:Admin")
+        assert spec.matches_account(AwsAccount("111111111111", "ml-training"))
+        assert not spec.matches_account(AwsAccount("111111111111", "web-data"))
+        assert spec.matches_role("Admin")
+
+    def test_regex_escaped_colon(self) -> None:
+        spec = parse_spec(r"re:team\:a:Admin")
+        assert spec.matches_account(AwsAccount("111111111111", "team:a"))
+        assert spec.matches_role("Admin")
+
+    def test_regex_colon_in_class(self) -> None:
+        spec = parse_spec("re:^[^:]+-prod$:Admin")
+        assert spec.matches_account(AwsAccount("111111111111", "payments-prod"))
+        assert spec.matches_role("Admin")
+
+    def test_regex_inline_flags(self) -> None:
+        spec = parse_spec("re:(?i:PROD):(?:Admin|Owner)")
+        assert spec.matches_account(AwsAccount("111111111111", "prod-core"))
+        assert spec.matches_role("Owner")
+        assert not spec.matches_role("ReadOnly")
+
+    def test_invalid_regex(self) -> None:
+        with pytest.raises(InvalidSelectionError, match="Invalid selection pattern 're:\\(:Admin'"):
+            parse_spec("re:(:Admin")
+
+    def test_env(self) -> None:
+        spec = parse_spec("env=Staging:Deploy*")
+        assert spec.environment == "staging"
+        assert spec.matches_account(AwsAccount("111111111111", "payments-stg"))
+        assert spec.matches_account(AwsAccount("111111111111", "payments", environment="staging"))
+        assert not spec.matches_account(AwsAccount("111111111111", "payments-prod"))
+        assert spec.matches_role("Deployer")
+
+    def test_env_without_role(self) -> None:
+        spec = parse_spec("env=production")
+        assert spec.role is None
+
+    def test_compile_keeps_order(self) -> None:
+        assert [spec.text for spec in compile_specs(["b:X", "*:Y", "a:Z"])] == ["b:X", "*:Y", "a:Z"]
@@ -0,0 +1,167 @@
+"""Unit tests for the columnar AccountTable."""
+
+from __future__ import annotations
+
+import pytest
+
+from aws_pick.exceptions import InvalidAccountError
+from aws_pick.models.account import AccountRole, AwsAccount
+from aws_pick.models.table import AccountTable
+
+
+def _table(items: list[AccountRole]) -> AccountTable:
+    return AccountTable.from_items(items)
+
+
+class TestBuild:
+    def test_from_dicts(self) -> None:
+        table = AccountTable.from_dicts(
+            [
+                {"account_id": "000000000001", "account_name": "a", "role_name": "Admin", "environment": "production"},
+                {"account_id": "000000000002", "account_name": "b", "role_name": "Admin"},
+            ]
+        )
+        assert len(table) == 2
+        assert table.account_id(0) == "000000000001"
+        assert table.environment(0) == "production"
+        assert table.environment(1) is None
+        assert table.role_names == ["Admin"]
+
+    def test_duplicates_keep_first(self) -> None:
+        table = AccountTable()
+        assert table.append("123456789012", "first", "Admin") is True
+        assert table.append("123456789012", "second", "Admin") is False
+        assert len(table) == 1
+        assert table.account_name(0) == "first"
+
+    @pytest.mark.parametrize(
+        ("row", "match"),
+        [
+            ({"account_name": "a", "role_name": "Admin"}, "account_id"),
+            ({"account_id": "12345", "account_name": "a", "role_name": "Admin"}, "12 digits"),
+            ({"account_id": "\u00b2" * 12, "account_name": "a", "role_name": "Admin"}, "12 digits"),
+            ({"account_id": "123456789012", "account_name": " ", "role_name": "Admin"}, "account_name"),
+            ({"account_id": "123456789012", "account_name": "a", "role_name": ""}, "role_name"),
+        ],
+    )
+    def test_validation(self, row: dict[str, str], match: str) -> None:
+        with pytest.raises(InvalidAccountError, match=match):
+            AccountTable.from_dicts([row])
+
+    def test_round_trip_rows(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        assert table.rows() == small_account_list
+        assert list(table) == small_account_list
+
+    def test_rows_share_pooled_models(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        assert table.row(0).account is table.row(1).account
+
+    def test_find(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        assert table.find("222222222222", "ReadOnly") == 1
+        assert table.find("222222222222", "AdminAccess") is None
+        assert table.find("222222222222", "Unknown") is None
+        assert table.find("bad", "ReadOnly") is None
+        assert table.find("\u00b2" * 12, "ReadOnly") is None
+
+
+class TestFilter:
+    def test_superscript_digits(self, mock_accounts: list[AccountRole]) -> None:
+        assert list(_table(mock_accounts).filter("\u00b2")) == []
+
+    def test_by_name_case_insensitive(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        hits = table.filter("PROD")
+        expected = [i for i, ar in enumerate(mock_accounts) if "prod" in ar.account.account_name]
+        assert list(hits) == expected
+
+    def test_by_role(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        assert all(table.role_name(i) == "PowerUser" for i in table.filter("power"))
+        assert len(table.filter("power")) == 20
+
+    def test_by_account_id(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        hits = table.filter("100000000005")
+        assert [table.account_id(i) for i in hits] == ["100000000005"] * 3
+
+    def test_empty_text_returns_all(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        assert list(table.filter("  ")) == [0, 1, 2]
+
+    def test_restricted_to_indices(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        assert list(table.filter("admin", [0, 1, 2, 3])) == [0, 3]
+
+
+class TestSortAndGroup:
+    def test_sort_by_name(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        names = [table.account_name(i) for i in table.sort(by="name")]
+        assert names == ["dev-account", "prod-account", "staging-account"]
+
+    def test_sort_by_name_matches_item_sort_key(self) -> None:
+        items = [
+            AccountRole.from_dict({"account_id": f"{i:012d}", "account_name": name, "role_name": role})
+            for i, (name, role) in enumerate([("a-b", "Admin"), ("a", "Zeta"), ("a", "Admin"), ("A", "x")], 1)
+        ]
+        table = _table(items)
+        assert table.rows(table.sort(by="name")) == sorted(items, key=lambda item: item.sort_key)
+
+    def test_sort_by_role(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        ordered = [(table.role_name(i), table.account_name(i)) for i in table.sort(by="role")]
+        assert ordered == [
+            ("AdminAccess", "dev-account"),
+            ("AdminAccess", "prod-account"),
+            ("ReadOnly", "staging-account"),
+        ]
+
+    def test_sort_by_account_id(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(list(reversed(small_account_list)))
+        assert [table.account_id(i) for i in table.sort(by="account_id")] == [
+            "111111111111",
+            "222222222222",
+            "333333333333",
+        ]
+
+    def test_group_by_account(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        groups = table.group(by="account")
+        assert list(groups) == sorted(groups)
+        assert [table.role_name(i) for i in groups["dev-app-00"]] == ["AdminAccess", "PowerUser", "ReadOnly"]
+
+    def test_group_by_role_over_filtered(self, mock_accounts: list[AccountRole]) -> None:
+        table = _table(mock_accounts)
+        groups = table.group(table.filter("stg"), by="role")
+        assert list(groups) == ["AdminAccess", "PowerUser", "ReadOnly"]
+        assert all(len(rows) == 5 for rows in groups.values())
+
+    def test_unknown_order_raises(self, small_account_list: list[AccountRole]) -> None:
+        table = _table(small_account_list)
+        with pytest.raises(ValueError):
+            table.sort(by="nope")  # type: ignore[arg-type]
+
+
+class TestMatch:
+    def test_predicates_per_distinct_value(self) -> None:
+        table = AccountTable.from_dicts(
+            [
+                {"account_id": "000000000001", "account_name": "a-prod", "role_name": "Admin"},
+                {"account_id": "000000000001", "account_name": "a-prod", "role_name": "ReadOnly"},
+                {"account_id": "000000000002", "account_name": "b-dev", "role_name": "Admin"},
+                {"account_id": "000000000003", "account_name": "c", "role_name": "Admin", "environment": "qa"},
+            ]
+        )
+        seen: list[str] = []
+
+        def is_prod(account: AwsAccount) -> bool:
+            seen.append(account.account_id)
+            return account.account_name.endswith("prod") or account.environment == "qa"
+
+        assert list(table.match(is_prod)) == [0, 1, 3]
+        assert sorted(seen) == ["000000000001", "000000000002", "000000000003"]
+        assert list(table.match(role="Admin".__eq__)) == [0, 2, 3]
+        assert list(table.match(is_prod, "Admin".__eq__)) == [0, 3]
+        assert list(table.match()) == [0, 1, 2, 3]